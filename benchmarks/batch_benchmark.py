@@ -0,0 +1,73 @@
+"""Compare OperationBase.apply_batch with applying payloads one by one.
+
+Run with ``python -m benchmarks.batch_benchmark``.
+"""
+
+import random
+import sys
+import timeit
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+SIZES = (16, 1_000, 10_000)
+PAYLOAD_COUNT = 20_000
+
+
+def make_payloads(size: int, count: int) -> list[Payload]:
+    """Create a reproducible random payload sequence.
+
+    Args:
+        size (int): Number of players.
+        count (int): Number of payloads.
+
+    Returns:
+        list[Payload]: The payloads.
+
+    """
+    rng = random.Random(size)  # noqa: S311
+    payload_types = (PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH)
+    return [
+        Payload(payload_type, extended_index=rng.randrange(size))
+        for payload_type in rng.choices(payload_types, k=count)
+    ]
+
+
+def main() -> None:
+    """Print the throughput table."""
+    operation = NoMxOperation(win_threshold=10**9, lose_threshold=10**9)
+    sys.stdout.write(
+        f"{'players':>8} {'loop payloads/s':>16} {'batch payloads/s':>17}\n"
+    )
+    for size in SIZES:
+        scoreboard = ScoreboardState.create_from_players_dict(
+            {player_id: f"Player {player_id}" for player_id in range(size)}
+        )
+        payloads = make_payloads(size, PAYLOAD_COUNT)
+
+        def loop(
+            scoreboard: ScoreboardState = scoreboard,
+            payloads: list[Payload] = payloads,
+        ) -> ScoreboardState:
+            for payload in payloads:
+                scoreboard = operation(scoreboard, payload)
+            return scoreboard
+
+        def batch(
+            scoreboard: ScoreboardState = scoreboard,
+            payloads: list[Payload] = payloads,
+        ) -> ScoreboardState:
+            return operation.apply_batch(scoreboard, payloads)
+
+        assert loop() == batch()  # noqa: S101
+        loop_time = min(timeit.repeat(loop, number=1, repeat=3))
+        batch_time = min(timeit.repeat(batch, number=1, repeat=3))
+        sys.stdout.write(
+            f"{size:>8} {PAYLOAD_COUNT / loop_time:>16.0f} "
+            f"{PAYLOAD_COUNT / batch_time:>17.0f}\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
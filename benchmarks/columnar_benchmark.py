@@ -0,0 +1,124 @@
+"""Compare ScoreboardState with ColumnarScoreboardState on large rosters.
+
+Run with ``python -m benchmarks.columnar_benchmark``. NumPy is required.
+"""
+
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+
+from reflex_scoreboard.data_structure.columnar import ColumnarScoreboardState
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+SIZES = (1_000, 10_000, 100_000)
+WIN_THRESHOLD = 7
+LOSE_THRESHOLD = 3
+
+
+def apply_thresholds(scoreboard: ScoreboardState) -> ScoreboardState:
+    """Update the states of normal players reaching a threshold one by one.
+
+    Args:
+        scoreboard (ScoreboardState): The scoreboard state.
+
+    Returns:
+        ScoreboardState: The updated scoreboard state.
+
+    """
+    for index, player in enumerate(scoreboard.players):
+        if player.state is not PlayerState.NORMAL:
+            continue
+        if player.answers >= WIN_THRESHOLD:
+            scoreboard = scoreboard.update_state(index, PlayerState.WIN)
+        elif player.misses >= LOSE_THRESHOLD:
+            scoreboard = scoreboard.update_state(index, PlayerState.LOSE)
+    return scoreboard
+
+
+def ranking(scoreboard: ScoreboardState) -> list[int]:
+    """Sort the player indices by rank.
+
+    Args:
+        scoreboard (ScoreboardState): The scoreboard state.
+
+    Returns:
+        list[int]: Player indices from the first to the last rank.
+
+    """
+    players = list(scoreboard.players)
+    return sorted(
+        range(len(players)),
+        key=lambda i: (-players[i].state.value, -players[i].answers, players[i].misses),
+    )
+
+
+def measure(function: Callable[[], object]) -> float:
+    """Measure the best time of a function in microseconds.
+
+    Args:
+        function (Callable[[], object]): The function to measure.
+
+    Returns:
+        float: The best time per call in microseconds.
+
+    """
+    number, _ = timeit.Timer(function).autorange()
+    best = min(timeit.repeat(function, number=number, repeat=3))
+    return best / number * 1e6
+
+
+def prepare(size: int) -> tuple[ScoreboardState, ColumnarScoreboardState]:
+    """Create both scoreboards with every player on breaks.
+
+    Args:
+        size (int): Number of players.
+
+    Returns:
+        tuple[ScoreboardState, ColumnarScoreboardState]: The scoreboards.
+
+    """
+    players = {player_id: f"Player {player_id}" for player_id in range(size)}
+    scoreboard = ScoreboardState.create_from_players_dict(players)
+    scoreboard = ScoreboardState(
+        [player.set_breaks(2) for player in scoreboard.players]
+    )
+    return scoreboard, ColumnarScoreboardState.from_scoreboard(scoreboard)
+
+
+def main() -> None:
+    """Print the benchmark table."""
+    operation = NoMxOperation(WIN_THRESHOLD, LOSE_THRESHOLD)
+    payload = Payload(PayloadType.RIGHT, extended_index=0)
+    sys.stdout.write(
+        f"{'players':>8} {'case':<18} {'dataclass us':>14} {'columnar us':>14}\n"
+    )
+    for size in SIZES:
+        scoreboard, columnar = prepare(size)
+        cases: dict[str, tuple[Callable[[], object], Callable[[], object]]] = {
+            "payload": (
+                partial(operation, scoreboard, payload),
+                partial(operation, columnar, payload),
+            ),
+            "reduce_breaks_all": (
+                scoreboard.reduce_breaks_all,
+                columnar.reduce_breaks_all,
+            ),
+            "thresholds": (
+                partial(apply_thresholds, scoreboard),
+                partial(columnar.apply_thresholds, WIN_THRESHOLD, LOSE_THRESHOLD),
+            ),
+            "ranking": (partial(ranking, scoreboard), columnar.ranking),
+        }
+        for name, (dataclass_case, columnar_case) in cases.items():
+            sys.stdout.write(
+                f"{size:>8} {name:<18} {measure(dataclass_case):>14.1f} "
+                f"{measure(columnar_case):>14.1f}\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
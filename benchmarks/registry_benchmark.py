@@ -0,0 +1,63 @@
+"""Measure MatchRegistry throughput with many concurrent matches.
+
+Run with ``python -m benchmarks.registry_benchmark``.
+"""
+
+import asyncio
+import random
+import sys
+import time
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.registry import MatchRegistry
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+MATCH_COUNTS = (10, 100, 1_000)
+PLAYER_COUNT = 16
+PAYLOAD_COUNT = 50_000
+
+
+async def run(match_count: int) -> float:
+    """Submit payloads to random matches from one client task per match.
+
+    Args:
+        match_count (int): Number of matches.
+
+    Returns:
+        float: The throughput in payloads per second.
+
+    """
+    operation = NoMxOperation(win_threshold=10**9, lose_threshold=10**9)
+    scoreboard = ScoreboardState.create_from_players_dict(
+        {player_id: f"Player {player_id}" for player_id in range(PLAYER_COUNT)}
+    )
+    registry = MatchRegistry()
+    for match_id in range(match_count):
+        registry.register(str(match_id), ScoreManager(scoreboard, operation))
+
+    rng = random.Random(match_count)  # noqa: S311
+    payload_types = (PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH)
+    per_match = PAYLOAD_COUNT // match_count
+
+    async def client(match_id: str) -> None:
+        for payload_type in rng.choices(payload_types, k=per_match):
+            payload = Payload(payload_type, extended_index=rng.randrange(PLAYER_COUNT))
+            await registry.submit(match_id, payload)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(str(match_id)) for match_id in range(match_count)))
+    return per_match * match_count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Print the throughput table."""
+    sys.stdout.write(f"{'matches':>8} {'payloads/s':>11}\n")
+    for match_count in MATCH_COUNTS:
+        throughput = asyncio.run(run(match_count))
+        sys.stdout.write(f"{match_count:>8} {throughput:>11.0f}\n")
+
+
+if __name__ == "__main__":
+    main()
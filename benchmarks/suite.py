@@ -0,0 +1,298 @@
+"""Benchmark the scoring hot paths and compare them with a baseline.
+
+Run with ``python -m benchmarks.suite``. The results are compared with
+``benchmarks/baseline.json`` and the command exits with status 1 when a
+benchmark is slower or larger than the baseline by more than the threshold.
+Pass ``--save`` to write the current results as the new baseline.
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from collections.abc import Callable, Iterable
+from functools import partial
+from pathlib import Path
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.delta_journal import DeltaJournal
+from reflex_scoreboard.manager.event_log import EventLog
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+from reflex_scoreboard.operation.rule import RuleSpec
+
+SIZES = (2, 16, 1_000, 100_000)
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD = 2.0
+# Differences below this are timer noise, whatever the ratio.
+MIN_DIFFERENCE = 1.0
+HISTORY_LENGTH = 256
+
+
+@dataclasses.dataclass(frozen=True)
+class BenchmarkResult:
+    """The dataclass to store the result of one benchmark.
+
+    Attributes:
+        name (str): Name of the benchmark.
+        size (int): Number of players.
+        value (float): Measured value. Smaller is better.
+        unit (str): Unit of the value.
+
+    """
+
+    name: str
+    size: int
+    value: float
+    unit: str
+
+    @property
+    def key(self) -> str:
+        """Get the key of the result in the baseline.
+
+        Returns:
+            str: The name and the size.
+
+        """
+        return f"{self.name}@{self.size}"
+
+
+def measure(function: Callable[[], object]) -> float:
+    """Measure the best time of a function in microseconds.
+
+    Args:
+        function (Callable[[], object]): The function to measure.
+
+    Returns:
+        float: The best time of one call in microseconds.
+
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def measure_history_bytes(manager: ScoreManager, payloads: list[Payload]) -> float:
+    """Measure the memory kept per history entry.
+
+    Args:
+        manager (ScoreManager): The manager to apply the payloads with.
+        payloads (list[Payload]): The payloads, one per history entry.
+
+    Returns:
+        float: The allocated bytes per payload still held afterwards.
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for payload in payloads:
+            manager(payload)
+        gc.collect()
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (end - start) / len(payloads)
+
+
+def create_scoreboard(size: int, breaks: int = 0) -> ScoreboardState:
+    """Create a scoreboard with the given number of players.
+
+    Args:
+        size (int): Number of players.
+        breaks (int): Number of breaks of every player. Default is 0.
+
+    Returns:
+        ScoreboardState: The scoreboard.
+
+    """
+    return ScoreboardState(
+        [
+            PlayerScore(player_id, f"Player {player_id}", breaks=breaks)
+            for player_id in range(size)
+        ]
+    )
+
+
+def run_size(size: int) -> list[BenchmarkResult]:
+    """Run every benchmark with the given number of players.
+
+    Args:
+        size (int): Number of players.
+
+    Returns:
+        list[BenchmarkResult]: The results.
+
+    """
+    operation = NoMxOperation(win_threshold=10**9, lose_threshold=10**9)
+    scoreboard = create_scoreboard(size)
+    payloads = [
+        Payload(payload_type, extended_index=index % size)
+        for index, payload_type in enumerate(
+            [PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH]
+            * (HISTORY_LENGTH // 3 + 1)
+        )
+    ][:HISTORY_LENGTH]
+    results = []
+
+    def timed(name: str, function: Callable[[], object]) -> None:
+        results.append(BenchmarkResult(name, size, measure(function), "us"))
+
+    for payload_type in (PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH):
+        payload = Payload(payload_type, extended_index=size // 2)
+        timed(
+            f"operation_{payload_type.name.lower()}",
+            partial(operation, scoreboard, payload),
+        )
+
+    compiled = RuleSpec.n_o_m_x(10**9, 10**9).compile()
+    for payload_type in (PayloadType.RIGHT, PayloadType.MISS):
+        payload = Payload(payload_type, extended_index=size // 2)
+        timed(
+            f"compiled_{payload_type.name.lower()}",
+            partial(compiled, scoreboard, payload),
+        )
+
+    manager = ScoreManager(scoreboard, operation)
+    call_payload = Payload(PayloadType.RIGHT, extended_index=size // 2)
+    timed("manager_call", lambda: manager(call_payload))
+
+    # Same call with an event log, to compare it with manager_call.
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        EventLog(Path(directory) / "match.log", scoreboard) as event_log,
+    ):
+        manager = ScoreManager(scoreboard, operation)
+        manager.add_listener(event_log)
+        timed("manager_call_logged", lambda: manager(call_payload))
+
+    manager = ScoreManager(scoreboard, operation)
+    manager(call_payload)
+
+    def undo_redo(manager: ScoreManager = manager) -> None:
+        manager.undo()
+        manager.redo()
+
+    timed("manager_undo_redo", undo_redo)
+
+    new_player = [PlayerScore(player_id=size, name="New player")]
+    timed("add_players", lambda: scoreboard.add_players(new_player))
+    with_breaks = create_scoreboard(size, breaks=1)
+    timed("reduce_breaks_all", with_breaks.reduce_breaks_all)
+
+    for name, journal in (
+        ("history_bytes_stack", None),
+        ("history_bytes_journal", DeltaJournal()),
+    ):
+        manager = ScoreManager(scoreboard, operation, journal)
+        value = measure_history_bytes(manager, payloads)
+        results.append(BenchmarkResult(name, size, value, "bytes"))
+    return results
+
+
+def find_regressions(
+    results: list[BenchmarkResult],
+    baseline: dict[str, float],
+    threshold: float,
+    min_difference: float = MIN_DIFFERENCE,
+) -> list[BenchmarkResult]:
+    """Find the results worse than the baseline by more than the threshold.
+
+    Args:
+        results (list[BenchmarkResult]): The current results.
+        baseline (dict[str, float]): The baseline values keyed by result key.
+        threshold (float): Allowed ratio of the current value to the baseline.
+        min_difference (float): Smallest difference from the baseline that
+            counts as a regression. Default is MIN_DIFFERENCE.
+
+    Returns:
+        list[BenchmarkResult]: The regressed results.
+
+    """
+    return [
+        result
+        for result in results
+        if result.key in baseline
+        and result.value > baseline[result.key] * threshold
+        and result.value - baseline[result.key] >= min_difference
+    ]
+
+
+def run_sizes(sizes: Iterable[int]) -> list[BenchmarkResult]:
+    """Run every benchmark with each number of players and print the results.
+
+    Args:
+        sizes (Iterable[int]): The numbers of players.
+
+    Returns:
+        list[BenchmarkResult]: The results.
+
+    """
+    results = []
+    for size in sizes:
+        for result in run_size(size):
+            sys.stdout.write(
+                f"{result.name:<24} {result.size:>8} {result.value:>12.2f} "
+                f"{result.unit}\n"
+            )
+            results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suite and compare it with the baseline.
+
+    Sizes with a regression are measured once more and the better value is
+    kept, so a single noisy measurement does not fail the run.
+
+    Args:
+        argv (list[str] | None): Command line arguments. Default is None
+            (sys.argv).
+
+    Returns:
+        int: The exit status, 1 if a benchmark regressed.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="save as the baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    args = parser.parse_args(argv)
+
+    results = run_sizes(args.sizes)
+    if args.save:
+        values = {result.key: round(result.value, 3) for result in results}
+        args.baseline.write_text(json.dumps(values, indent=2) + "\n")
+        return 0
+    if not args.baseline.exists():
+        sys.stdout.write("No baseline to compare with.\n")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        sys.stdout.write("Measuring the regressed sizes again.\n")
+        rerun = run_sizes(sorted({result.size for result in regressions}))
+        best = {result.key: result for result in results}
+        for result in rerun:
+            if result.value < best[result.key].value:
+                best[result.key] = result
+        regressions = find_regressions(list(best.values()), baseline, args.threshold)
+    for result in regressions:
+        sys.stdout.write(
+            f"Regression: {result.key}: {result.value:.2f} {result.unit} "
+            f"(baseline {baseline[result.key]:.2f} {result.unit})\n"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
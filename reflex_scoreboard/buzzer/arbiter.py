@@ -0,0 +1,166 @@
+import dataclasses
+import struct
+from collections import Counter
+from collections.abc import Callable
+
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardLike
+
+# Buzz record: player index and press time from time.monotonic_ns.
+BUZZ_RECORD = struct.Struct("<Iq")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BuzzEvent:
+    """The dataclass to store a press of a buzzer.
+
+    Attributes:
+        index (int): Index of the player who pressed.
+        pressed_ns (int): Press time from time.monotonic_ns.
+
+    """
+
+    index: int
+    pressed_ns: int
+
+    def encode(self) -> bytes:
+        """Encode the event as a buzz record.
+
+        Returns:
+            bytes: The encoded record.
+
+        """
+        return BUZZ_RECORD.pack(self.index, self.pressed_ns)
+
+    @staticmethod
+    def decode(data: bytes) -> "BuzzEvent":
+        """Decode a buzz record.
+
+        Args:
+            data (bytes): The encoded record.
+
+        Returns:
+            BuzzEvent: The decoded event.
+
+        """
+        index, pressed_ns = BUZZ_RECORD.unpack(data)
+        return BuzzEvent(index, pressed_ns)
+
+
+class BuzzArbiter:
+    """Class for choosing the first valid buzz of a question.
+
+    The arbiter is open while a question accepts buzzes. Presses made while
+    it is open become candidates; ``decide`` picks the earliest candidate by
+    press time and closes the arbiter until the operator opens it again.
+    A press made while the arbiter is closed locks the player out for
+    ``lockout_ns``, and presses of players who are not NORMAL or have
+    breaks are ignored.
+
+    Attributes:
+        scoreboard (Callable[[], ScoreboardLike]): Function giving the current
+            scoreboard, used to check who can buzz.
+        lockout_ns (int): Lockout after a press while closed, in nanoseconds.
+        is_open (bool): Whether the arbiter accepts buzzes.
+        dropped (Counter[str]): Number of ignored presses by reason.
+
+    """
+
+    def __init__(
+        self,
+        scoreboard: Callable[[], ScoreboardLike],
+        lockout_ns: int = 250_000_000,
+    ) -> None:
+        """Initialize the BuzzArbiter, closed.
+
+        Args:
+            scoreboard (Callable[[], ScoreboardLike]): Function giving the
+                current scoreboard, for example ``lambda: manager.scoreboard``.
+            lockout_ns (int): Lockout after a press while closed, in
+                nanoseconds. Default is 250 ms.
+
+        Raises:
+            ValueError: If lockout_ns is negative.
+
+        """
+        if lockout_ns < 0:
+            raise ValueError("Lockout must not be negative.")
+
+        self.scoreboard = scoreboard
+        self.lockout_ns = lockout_ns
+        self.is_open = False
+        self.dropped: Counter[str] = Counter()
+        self._opened_ns = 0
+        self._locked_until: dict[int, int] = {}
+        self._candidates: list[BuzzEvent] = []
+
+    def open(self, now_ns: int) -> None:
+        """Start accepting buzzes for a question.
+
+        Args:
+            now_ns (int): The current time from time.monotonic_ns.
+
+        """
+        self.is_open = True
+        self._opened_ns = now_ns
+        self._candidates.clear()
+
+    def can_buzz(self, index: int) -> bool:
+        """Check if a player can buzz by the scoreboard.
+
+        Args:
+            index (int): The index of the player.
+
+        Returns:
+            bool: True if the player is NORMAL and has no breaks.
+
+        """
+        scoreboard = self.scoreboard()
+        if not 0 <= index < len(scoreboard):
+            return False
+        player = scoreboard[index]
+        return player.state is PlayerState.NORMAL and player.breaks == 0
+
+    def offer(self, event: BuzzEvent) -> bool:
+        """Offer a press to the arbiter.
+
+        Args:
+            event (BuzzEvent): The press.
+
+        Returns:
+            bool: True if the press became a candidate.
+
+        """
+        if not self.is_open or event.pressed_ns < self._opened_ns:
+            self.dropped["closed"] += 1
+            self._locked_until[event.index] = event.pressed_ns + self.lockout_ns
+            return False
+        if event.pressed_ns < self._locked_until.get(event.index, 0):
+            self.dropped["locked_out"] += 1
+            return False
+        if not self.can_buzz(event.index):
+            self.dropped["ineligible"] += 1
+            return False
+        self._candidates.append(event)
+        return True
+
+    def decide(self) -> BuzzEvent | None:
+        """Choose the earliest candidate and close the arbiter.
+
+        Candidates that can no longer buzz by the scoreboard are skipped.
+
+        Returns:
+            BuzzEvent | None: The winning press, or None if there is no valid
+                candidate, in which case the arbiter stays open.
+
+        """
+        candidates = sorted(
+            self._candidates, key=lambda event: (event.pressed_ns, event.index)
+        )
+        self._candidates.clear()
+        for event in candidates:
+            if self.can_buzz(event.index):
+                self.is_open = False
+                return event
+            self.dropped["ineligible"] += 1
+        return None
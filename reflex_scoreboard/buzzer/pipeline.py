@@ -0,0 +1,135 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+from reflex_scoreboard.buzzer.arbiter import BUZZ_RECORD, BuzzArbiter, BuzzEvent
+from reflex_scoreboard.metrics.histogram import LatencyHistogram
+
+
+class BuzzerPipeline:
+    """Class for ingesting buzzer presses and reporting the winning buzz.
+
+    ``read`` decodes buzz records from a stream into a bounded queue. When
+    the queue is full, reading stops, so the stream buffers fill up and the
+    buzzer side is slowed down instead of memory growing. ``arbitrate``
+    waits ``window_ns`` after the first candidate so presses that arrive a
+    little late but were made earlier still win, then lights the indicator
+    and puts the winner on the bounded ``winners`` queue for the operator.
+
+    The operator judges the winner, applies the payload to the ScoreManager
+    and calls ``open`` for the next buzz.
+
+    Attributes:
+        arbiter (BuzzArbiter): The arbiter choosing the winning buzz.
+        window_ns (int): Time to wait for earlier presses, in nanoseconds.
+        indicator (Callable[[BuzzEvent], None] | None): Callback lighting the
+            indicator of the winner.
+        presses (asyncio.Queue[BuzzEvent | None]): Presses waiting for
+            arbitration, ended by None.
+        winners (asyncio.Queue[BuzzEvent]): Winning presses for the operator.
+        latency (LatencyHistogram): Time from the press to the lit indicator.
+
+    """
+
+    def __init__(
+        self,
+        arbiter: BuzzArbiter,
+        window_ns: int = 5_000_000,
+        indicator: Callable[[BuzzEvent], None] | None = None,
+        max_presses: int = 1024,
+        max_winners: int = 16,
+    ) -> None:
+        """Initialize the BuzzerPipeline.
+
+        Args:
+            arbiter (BuzzArbiter): The arbiter choosing the winning buzz.
+            window_ns (int): Time to wait for earlier presses, in
+                nanoseconds. Default is 5 ms.
+            indicator (Callable[[BuzzEvent], None] | None): Callback lighting
+                the indicator of the winner. Default is None.
+            max_presses (int): Capacity of the press queue. Default is 1024.
+            max_winners (int): Capacity of the winner queue. Default is 16.
+
+        Raises:
+            ValueError: If window_ns is negative or a capacity is not positive.
+
+        """
+        if window_ns < 0:
+            raise ValueError("Window must not be negative.")
+        if max_presses <= 0 or max_winners <= 0:
+            raise ValueError("Queue capacities must be positive.")
+
+        self.arbiter = arbiter
+        self.window_ns = window_ns
+        self.indicator = indicator
+        self.presses: asyncio.Queue[BuzzEvent | None] = asyncio.Queue(max_presses)
+        self.winners: asyncio.Queue[BuzzEvent] = asyncio.Queue(max_winners)
+        self.latency = LatencyHistogram()
+
+    def open(self) -> None:
+        """Start accepting buzzes for the next question."""
+        self.arbiter.open(time.monotonic_ns())
+
+    async def read(self, reader: asyncio.StreamReader) -> None:
+        """Read buzz records until the end of the stream.
+
+        The end of the stream is passed on to ``arbitrate`` as None.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of buzz records, for
+                example from asyncio.open_unix_connection.
+
+        """
+        while True:
+            try:
+                data = await reader.readexactly(BUZZ_RECORD.size)
+            except asyncio.IncompleteReadError:
+                await self.presses.put(None)
+                return
+            await self.presses.put(BuzzEvent.decode(data))
+
+    async def _decide(self) -> None:
+        """Report the winner of the current candidates, if any."""
+        winner = self.arbiter.decide()
+        if winner is None:
+            return
+        if self.indicator is not None:
+            self.indicator(winner)
+        self.latency.record(time.monotonic_ns() - winner.pressed_ns)
+        await self.winners.put(winner)
+
+    async def arbitrate(self) -> None:
+        """Choose the winning buzzes until the end of the presses."""
+        deadline_ns: int | None = None
+        while True:
+            try:
+                if deadline_ns is None:
+                    event = await self.presses.get()
+                else:
+                    delay_ns = max(deadline_ns - time.monotonic_ns(), 0)
+                    async with asyncio.timeout(delay_ns / 1e9):
+                        event = await self.presses.get()
+            except TimeoutError:
+                deadline_ns = None
+                await self._decide()
+                continue
+            if event is None:
+                await self._decide()
+                return
+            if self.arbiter.offer(event) and deadline_ns is None:
+                deadline_ns = time.monotonic_ns() + self.window_ns
+
+    async def run(self, reader: asyncio.StreamReader) -> None:
+        """Read and arbitrate until the end of the stream.
+
+        Args:
+            reader (asyncio.StreamReader): The stream of buzz records.
+
+        """
+        arbitration = asyncio.create_task(self.arbitrate())
+        try:
+            await self.read(reader)
+        except BaseException:
+            arbitration.cancel()
+            raise
+        await arbitration
@@ -0,0 +1,287 @@
+"""Command-line scoreboard driven by keyboard or stdin payloads.
+
+Each input line holds one or more commands separated by spaces:
+
+    o<N>  right answer of player N (1-based)
+    x<N>  miss of player N
+    t     through
+    u     undo
+    r     redo
+    p     print the board
+    s     print the latency statistics (with --stats)
+    q     quit
+
+Only the core packages are imported, so the CLI starts without Reflex.
+"""
+
+import argparse
+import sys
+from typing import TextIO
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+PROMPT = "> "
+DEFAULT_PLAYERS = ("Player 1", "Player 2", "Player 3", "Player 4")
+PLAYER_COMMANDS = {"o": PayloadType.RIGHT, "x": PayloadType.MISS}
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse the command-line arguments.
+
+    Args:
+        argv (list[str] | None): The arguments, or None for sys.argv.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="reflex-scoreboard",
+        description="Run an N-o M-x scoreboard in the terminal.",
+    )
+    parser.add_argument(
+        "players", nargs="*", default=DEFAULT_PLAYERS, help="Player names."
+    )
+    parser.add_argument("--win", type=int, default=7, help="Answers to win.")
+    parser.add_argument("--lose", type=int, default=3, help="Misses to lose.")
+    parser.add_argument("--load", help="History file to resume from.")
+    parser.add_argument("--save", help="History file to write when quitting.")
+    parser.add_argument(
+        "--journal", action="store_true", help="Keep the history as deltas."
+    )
+    parser.add_argument(
+        "--undo-window",
+        type=int,
+        help="States kept in memory for undo; older ones are spilled to disk.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Time every payload and print the statistics when quitting.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Serve the statistics as JSON on this local port (implies --stats).",
+    )
+    parser.add_argument(
+        "--events-port",
+        type=int,
+        help="Stream the board to displays as Server-Sent Events on this port.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address the event stream binds to. Default is 127.0.0.1.",
+    )
+    return parser.parse_args(argv)
+
+
+def format_board(scoreboard: ScoreboardState) -> str:
+    """Format the scoreboard as a text table.
+
+    Args:
+        scoreboard (ScoreboardState): The scoreboard to format.
+
+    Returns:
+        str: The table, one line per player.
+
+    """
+    width = max([4, *(len(player.name) for player in scoreboard.players)])
+    lines = [
+        f"Q{scoreboard.question_count}",
+        f"{'#':>3}  {'Name':<{width}}  {'O':>3}  {'X':>3}  {'Score':>5}  State",
+    ]
+    lines.extend(
+        f"{number:>3}  {player.name:<{width}}  {player.answers:>3}  "
+        f"{player.misses:>3}  {player.score:>5}  {player.state.name}"
+        for number, player in enumerate(scoreboard.players, 1)
+    )
+    return "\n".join(lines)
+
+
+def run_command(manager: ScoreManager, command: str, output: TextIO) -> bool:
+    """Run one command on the manager.
+
+    Args:
+        manager (ScoreManager): The manager to drive.
+        command (str): The command.
+        output (TextIO): Where to print the board.
+
+    Raises:
+        ValueError: If the command is not valid.
+
+    Returns:
+        bool: False if the command was quit, otherwise True.
+
+    """
+    head, argument = command[0].lower(), command[1:]
+    if head in PLAYER_COMMANDS:
+        if not argument.isdigit() or not 1 <= int(argument) <= len(manager.scoreboard):
+            raise ValueError("Player number is out of range.")
+        manager(Payload.of(PLAYER_COMMANDS[head], int(argument) - 1))
+    elif argument:
+        raise ValueError("Command is not valid.")
+    elif head == "t":
+        manager(Payload.of(PayloadType.THROUGH))
+    elif head == "u":
+        manager.undo()
+    elif head == "r":
+        manager.redo()
+    elif head == "p":
+        print(format_board(manager.scoreboard), file=output)
+    elif head == "s" and manager.instrumentation is not None:
+        print(manager.instrumentation.snapshot().format_report(), file=output)
+    elif head == "q":
+        return False
+    else:
+        raise ValueError("Command is not valid.")
+    return True
+
+
+def create_manager(args: argparse.Namespace) -> ScoreManager:
+    """Create the manager from the parsed arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        ScoreManager: The new or resumed manager.
+
+    """
+    operation = NoMxOperation(win_threshold=args.win, lose_threshold=args.lose)
+    journal = None
+    if args.journal:
+        # Imported here, so the history modules are only loaded when asked for.
+        from reflex_scoreboard.manager.delta_journal import (  # noqa: PLC0415
+            DeltaJournal,
+        )
+
+        journal = DeltaJournal()
+    policy = None
+    if args.undo_window is not None:
+        from reflex_scoreboard.manager.spill import HistoryPolicy  # noqa: PLC0415
+
+        policy = HistoryPolicy(args.undo_window, chunk_size=min(args.undo_window, 64))
+    if args.load:
+        return ScoreManager.load_history(args.load, operation, journal, policy)
+    scoreboard = ScoreboardState.create_from_players_dict(
+        dict(enumerate(args.players, 1))
+    )
+    return ScoreManager(scoreboard, operation, journal, policy)
+
+
+def instrument(manager: ScoreManager, args: argparse.Namespace) -> None:
+    """Time the payloads of the manager if asked by the arguments.
+
+    Args:
+        manager (ScoreManager): The manager to instrument.
+        args (argparse.Namespace): The parsed arguments.
+
+    """
+    if not args.stats and args.metrics_port is None:
+        return
+    # Imported here, so the statistics are only loaded when asked for.
+    from reflex_scoreboard.metrics.instrumentation import (  # noqa: PLC0415
+        Instrumentation,
+    )
+
+    instrumentation = Instrumentation()
+    manager.instrument(instrumentation)
+    if args.metrics_port is not None:
+        # Imported here, so the HTTP server is only loaded when asked for.
+        from reflex_scoreboard.metrics.server import serve_metrics  # noqa: PLC0415
+
+        serve_metrics(instrumentation, port=args.metrics_port)
+
+
+def broadcast(manager: ScoreManager, args: argparse.Namespace) -> None:
+    """Stream the board of the manager to displays if asked by the arguments.
+
+    Args:
+        manager (ScoreManager): The manager to stream.
+        args (argparse.Namespace): The parsed arguments.
+
+    """
+    if args.events_port is None:
+        return
+    # Imported here, so the HTTP server is only loaded when asked for.
+    from reflex_scoreboard.manager.broadcast import Broadcaster  # noqa: PLC0415
+    from reflex_scoreboard.manager.broadcast_server import (  # noqa: PLC0415
+        serve_broadcast,
+    )
+
+    serve_broadcast(Broadcaster.follow(manager), args.host, args.events_port)
+
+
+def finish(manager: ScoreManager, args: argparse.Namespace, output: TextIO) -> None:
+    """Print the statistics and save the history if asked by the arguments.
+
+    Args:
+        manager (ScoreManager): The manager to finish.
+        args (argparse.Namespace): The parsed arguments.
+        output (TextIO): Where to print the statistics.
+
+    """
+    if manager.instrumentation is not None:
+        print(manager.instrumentation.snapshot().format_report(), file=output)
+    if args.save:
+        manager.save_history(args.save)
+
+
+def main(
+    argv: list[str] | None = None,
+    stdin: TextIO | None = None,
+    stdout: TextIO | None = None,
+) -> int:
+    """Run the scoreboard until quit or end of input.
+
+    When the input is a terminal, the board is printed after every line and
+    a prompt is shown; otherwise the board is printed once at the end.
+
+    Args:
+        argv (list[str] | None): The arguments, or None for sys.argv.
+        stdin (TextIO | None): The input. Default is sys.stdin.
+        stdout (TextIO | None): The output. Default is sys.stdout.
+
+    Returns:
+        int: 0 on success, 1 if any command was not valid.
+
+    """
+    args = parse_args(argv)
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    interactive = stdin.isatty()
+    manager = create_manager(args)
+    instrument(manager, args)
+    broadcast(manager, args)
+    status = 0
+    running = True
+    if interactive:
+        print(format_board(manager.scoreboard), file=stdout)
+        print(PROMPT, end="", file=stdout, flush=True)
+    for line in stdin:
+        for command in line.split():
+            try:
+                running = run_command(manager, command, stdout)
+            except ValueError as error:
+                sys.stderr.write(f"error: {command}: {error}\n")
+                status = 1
+            if not running:
+                break
+        if not running:
+            break
+        if interactive:
+            print(format_board(manager.scoreboard), file=stdout)
+            print(PROMPT, end="", file=stdout, flush=True)
+    if not interactive:
+        print(format_board(manager.scoreboard), file=stdout)
+    finish(manager, args, stdout)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
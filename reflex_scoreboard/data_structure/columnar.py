@@ -0,0 +1,398 @@
+import dataclasses
+from collections.abc import Buffer
+from typing import Any, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.snapshot import SnapshotLayout, decode_names
+
+type IntColumn = npt.NDArray[np.int64]
+type StateColumn = npt.NDArray[np.int8]
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class ColumnarScoreboardState:
+    """The dataclass to store the scoreboard state as NumPy columns.
+
+    This is an alternative to ScoreboardState for very large rosters. Each
+    field of PlayerScore is stored in its own array, so whole-board updates
+    are vectorized and no PlayerScore object exists until a player is read.
+    Single-player updates copy only the column they change; the columns are
+    never modified in place, so older states stay valid.
+
+    Attributes:
+        player_ids (IntColumn): Player IDs.
+        names (tuple[str, ...]): Player names.
+        answers (IntColumn): Number of correct answers of each player.
+        misses (IntColumn): Number of misses of each player.
+        scores (IntColumn): Total score of each player.
+        breaks (IntColumn): Number of breaks of each player.
+        states (StateColumn): PlayerState values of each player.
+        question_count (int): Number of questions. Default to 1.
+
+    """
+
+    player_ids: IntColumn
+    names: tuple[str, ...]
+    answers: IntColumn
+    misses: IntColumn
+    scores: IntColumn
+    breaks: IntColumn
+    states: StateColumn
+    question_count: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the columns.
+
+        Raises:
+            ValueError: If question_count is less than 1 or the columns have
+                different lengths.
+
+        """
+        if self.question_count < 1:
+            raise ValueError("Question count must be at least 1.")
+        size = len(self.player_ids)
+        columns = (self.answers, self.misses, self.scores, self.breaks, self.states)
+        if len(self.names) != size or any(len(column) != size for column in columns):
+            raise ValueError("Columns must have the same length.")
+
+    @staticmethod
+    def create_from_players_dict(
+        players_dict: dict[int, str],
+    ) -> "ColumnarScoreboardState":
+        """Create a ColumnarScoreboardState from a dictionary of players.
+
+        Args:
+            players_dict (dict[int, str]): Dictionary of players.
+                The keys are player IDs and the values are player names.
+
+        Returns:
+            ColumnarScoreboardState: The created ColumnarScoreboardState object.
+
+        """
+        size = len(players_dict)
+        return ColumnarScoreboardState(
+            player_ids=np.fromiter(players_dict.keys(), dtype=np.int64, count=size),
+            names=tuple(players_dict.values()),
+            answers=np.zeros(size, dtype=np.int64),
+            misses=np.zeros(size, dtype=np.int64),
+            scores=np.zeros(size, dtype=np.int64),
+            breaks=np.zeros(size, dtype=np.int64),
+            states=np.zeros(size, dtype=np.int8),
+        )
+
+    @staticmethod
+    def from_scoreboard(scoreboard: ScoreboardState) -> "ColumnarScoreboardState":
+        """Create a ColumnarScoreboardState from a ScoreboardState.
+
+        Args:
+            scoreboard (ScoreboardState): The scoreboard state to convert.
+
+        Returns:
+            ColumnarScoreboardState: The converted scoreboard state.
+
+        """
+        players = list(scoreboard.players)
+        size = len(players)
+
+        def column(name: str) -> IntColumn:
+            return np.fromiter(
+                (getattr(player, name) for player in players),
+                dtype=np.int64,
+                count=size,
+            )
+
+        return ColumnarScoreboardState(
+            player_ids=column("player_id"),
+            names=tuple(player.name for player in players),
+            answers=column("answers"),
+            misses=column("misses"),
+            scores=column("score"),
+            breaks=column("breaks"),
+            states=np.fromiter(
+                (player.state.value for player in players), dtype=np.int8, count=size
+            ),
+            question_count=scoreboard.question_count,
+        )
+
+    @staticmethod
+    def from_snapshot(data: Buffer, offset: int = 0) -> "ColumnarScoreboardState":
+        """Create a ColumnarScoreboardState from a snapshot without copying.
+
+        The columns are read-only views of the buffer, so only the names are
+        decoded. The buffer must stay open while the columns are used.
+
+        Args:
+            data (Buffer): The buffer holding the snapshot, for example a
+                memory map.
+            offset (int): The offset of the snapshot in the buffer. Default is 0.
+
+        Returns:
+            ColumnarScoreboardState: The scoreboard state.
+
+        """
+        layout = SnapshotLayout.read(data, offset)
+        count = layout.player_count
+
+        def column(start: int) -> IntColumn:
+            return np.frombuffer(data, dtype="<i8", count=count, offset=offset + start)
+
+        player_ids, answers, misses, scores, breaks = map(
+            column, layout.columns.values()
+        )
+        view = memoryview(data).cast("B")[offset : offset + layout.size]
+        return ColumnarScoreboardState(
+            player_ids=player_ids,
+            names=tuple(decode_names(view, layout)),
+            answers=answers,
+            misses=misses,
+            scores=scores,
+            breaks=breaks,
+            states=np.frombuffer(
+                data, dtype=np.int8, count=count, offset=offset + layout.states
+            ),
+            question_count=layout.question_count,
+        )
+
+    def to_scoreboard(self) -> ScoreboardState:
+        """Convert the columns to a ScoreboardState.
+
+        Returns:
+            ScoreboardState: The converted scoreboard state.
+
+        """
+        return ScoreboardState(
+            players=[self[index] for index in range(len(self))],
+            question_count=self.question_count,
+        )
+
+    def __getitem__(self, index: int) -> PlayerScore:
+        """Get the player at the given index.
+
+        Args:
+            index (int): The index of the player to retrieve.
+
+        Returns:
+            PlayerScore: The player at the given index.
+
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("Index out of range.")
+        return PlayerScore(
+            player_id=int(self.player_ids[index]),
+            name=self.names[index],
+            answers=int(self.answers[index]),
+            misses=int(self.misses[index]),
+            score=int(self.scores[index]),
+            breaks=int(self.breaks[index]),
+            state=PlayerState(int(self.states[index])),
+        )
+
+    def __len__(self) -> int:
+        """Get the number of players in the scoreboard.
+
+        Returns:
+            int: The number of players in the scoreboard.
+
+        """
+        return len(self.player_ids)
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether two scoreboards hold the same values.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if all columns and the question count are equal.
+
+        """
+        if not isinstance(other, ColumnarScoreboardState):
+            return NotImplemented
+        return (
+            self.question_count == other.question_count
+            and self.names == other.names
+            and all(
+                np.array_equal(getattr(self, name), getattr(other, name))
+                for name in ("player_ids", "answers", "misses", "scores", "breaks")
+            )
+            and np.array_equal(self.states, other.states)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _set_value(self, column_name: str, index: int, value: int) -> Self:
+        """Copy one column with the value at the given index replaced.
+
+        Args:
+            column_name (str): Name of the column to update.
+            index (int): The index of the player to update.
+            value (int): The new value.
+
+        Returns:
+            Self: The updated scoreboard state.
+
+        """
+        column = getattr(self, column_name).copy()
+        column[index] = value
+        return dataclasses.replace(self, **{column_name: column})
+
+    def replace_player(self, index: int, new_player: PlayerScore) -> Self:
+        """Replace the player at the given index with a new player.
+
+        Only the columns whose value changes are copied.
+
+        Args:
+            index (int): The index of the player to replace.
+            new_player (PlayerScore): The new player to replace with.
+
+        Returns:
+            Self: The updated scoreboard state with the replaced player.
+
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("Index out of range.")
+        changes: dict[str, Any] = {}
+        values = (
+            ("player_ids", new_player.player_id),
+            ("answers", new_player.answers),
+            ("misses", new_player.misses),
+            ("scores", new_player.score),
+            ("breaks", new_player.breaks),
+            ("states", new_player.state.value),
+        )
+        for column_name, value in values:
+            column = getattr(self, column_name)
+            if column[index] != value:
+                column = column.copy()
+                column[index] = value
+                changes[column_name] = column
+        if self.names[index] != new_player.name:
+            names = list(self.names)
+            names[index] = new_player.name
+            changes["names"] = tuple(names)
+        if not changes:
+            return self
+        return dataclasses.replace(self, **changes)
+
+    def add_answer(self, index: int) -> Self:
+        """Add an answer to the player at the given index.
+
+        Args:
+            index (int): The index of the player to add an answer to.
+
+        Returns:
+            Self: The updated scoreboard state with the added answer.
+
+        """
+        return self._set_value("answers", index, self.answers[index] + 1)
+
+    def add_miss(self, index: int) -> Self:
+        """Add a miss to the player at the given index.
+
+        Args:
+            index (int): The index of the player to add a miss to.
+
+        Returns:
+            Self: The updated scoreboard state with the added miss.
+
+        """
+        return self._set_value("misses", index, self.misses[index] + 1)
+
+    def update_score(self, index: int, score: int) -> Self:
+        """Update the score of the player at the given index.
+
+        Args:
+            index (int): The index of the player to update.
+            score (int): The new score to set.
+
+        Returns:
+            Self: The updated scoreboard state with the new score.
+
+        """
+        return self._set_value("scores", index, score)
+
+    def set_breaks(self, index: int, breaks: int) -> Self:
+        """Update the number of breaks for the player at the given index.
+
+        Args:
+            index (int): The index of the player to update.
+            breaks (int): The new number of breaks to set.
+
+        Returns:
+            Self: The updated scoreboard state with the new breaks.
+
+        """
+        return self._set_value("breaks", index, breaks)
+
+    def update_state(self, index: int, state: PlayerState) -> Self:
+        """Update the state of the player at the given index.
+
+        Args:
+            index (int): The index of the player to update.
+            state (PlayerState): The new state to set.
+
+        Returns:
+            Self: The updated scoreboard state with the new state.
+
+        """
+        return self._set_value("states", index, state.value)
+
+    def reduce_breaks_all(self) -> Self:
+        """Reduce the breaks of all players in the scoreboard by 1.
+
+        Returns:
+            Self: The updated scoreboard state with reduced breaks.
+
+        """
+        return dataclasses.replace(self, breaks=np.maximum(self.breaks - 1, 0))
+
+    def set_question_count(self, count: int) -> Self:
+        """Update the question count of the scoreboard.
+
+        Args:
+            count (int): The new question count.
+
+        Returns:
+            Self: The updated scoreboard state with the new question count.
+
+        """
+        return dataclasses.replace(self, question_count=count)
+
+    def apply_thresholds(self, win_threshold: int, lose_threshold: int) -> Self:
+        """Update the states of all normal players reaching a threshold.
+
+        Players with at least win_threshold answers become WIN, and the other
+        players with at least lose_threshold misses become LOSE.
+
+        Args:
+            win_threshold (int): The threshold of answers for winning.
+            lose_threshold (int): The threshold of misses for losing.
+
+        Returns:
+            Self: The updated scoreboard state.
+
+        """
+        normal = self.states == PlayerState.NORMAL.value
+        states = self.states.copy()
+        win = normal & (self.answers >= win_threshold)
+        states[win] = PlayerState.WIN.value
+        states[normal & ~win & (self.misses >= lose_threshold)] = PlayerState.LOSE.value
+        return dataclasses.replace(self, states=states)
+
+    def ranking(self) -> IntColumn:
+        """Get the player indices ordered by rank.
+
+        Players are ordered by state (WIN, NORMAL, LOSE), then by more
+        answers, then by fewer misses, then by index.
+
+        Returns:
+            IntColumn: Player indices from the first to the last rank.
+
+        """
+        # lexsort is stable, so ties keep the index order.
+        order = np.lexsort((self.misses, -self.answers, -self.states))
+        return order.astype(np.int64)
@@ -0,0 +1,246 @@
+from collections.abc import Callable, Iterable
+from typing import Self, cast
+
+from reflex_scoreboard.data_structure.persistent_vector import PersistentVector
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+
+class MutableScoreboard:
+    """Class for a mutable scratch copy of a ScoreboardState.
+
+    The update methods change the players in place and return the same
+    object, so it can be passed to the operations wherever a ScoreboardLike
+    is expected. ``freeze`` turns the result back into a ScoreboardState that
+    shares every unchanged part with the original state. The scoreboard can
+    still be edited after freezing; the frozen state does not change.
+
+    Attributes:
+        players (list[PlayerScore]): List of PlayerScore objects.
+        question_count (int): Number of questions.
+
+    """
+
+    def __init__(self, scoreboard: ScoreboardState) -> None:
+        """Initialize the MutableScoreboard from a scoreboard state.
+
+        Args:
+            scoreboard (ScoreboardState): The scoreboard state to copy.
+
+        """
+        self._scoreboard = scoreboard
+        self._base = cast("PersistentVector[PlayerScore]", scoreboard.players)
+        self._base_index = scoreboard.player_index
+        self._changed: set[int] = set()
+        self._identity_changed = False
+        self.players = list(scoreboard.players)
+        self.question_count = scoreboard.question_count
+
+    def __getitem__(self, index: int) -> PlayerScore:
+        """Get the player at the given index.
+
+        Args:
+            index (int): The index of the player to retrieve.
+
+        Returns:
+            PlayerScore: The player at the given index.
+
+        """
+        if index < 0 or index >= len(self.players):
+            raise IndexError("Index out of range.")
+        return self.players[index]
+
+    def __len__(self) -> int:
+        """Get the number of players in the scoreboard.
+
+        Returns:
+            int: The number of players in the scoreboard.
+
+        """
+        return len(self.players)
+
+    def replace_player(self, index: int, new_player: PlayerScore) -> Self:
+        """Replace the player at the given index in place.
+
+        Args:
+            index (int): The index of the player to replace.
+            new_player (PlayerScore): The new player to replace with.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        if not self.players[index].is_same_player(new_player):
+            self._identity_changed = True
+        self.players[index] = new_player
+        self._changed.add(index)
+        return self
+
+    def update_players(
+        self,
+        function: Callable[[PlayerScore], PlayerScore],
+        indices: Iterable[int] | None = None,
+    ) -> Self:
+        """Replace players with the result of a function in place.
+
+        Args:
+            function (Callable[[PlayerScore], PlayerScore]): Function
+                returning the new player for a player.
+            indices (Iterable[int] | None): Indices of the players to update.
+                Default is None (all players).
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        if indices is None:
+            indices = range(len(self.players))
+        for index in indices:
+            player = self[index]
+            new_player = function(player)
+            if new_player is not player:
+                self.replace_player(index, new_player)
+        return self
+
+    def add_players(self, new_players: Iterable[PlayerScore]) -> Self:
+        """Add players at the end in place.
+
+        Duplicates are only detected when freezing.
+
+        Args:
+            new_players (Iterable[PlayerScore]): The players to add.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        self.players.extend(new_players)
+        self._identity_changed = True
+        return self
+
+    def add_answer(self, index: int) -> Self:
+        """Add an answer to the player at the given index in place.
+
+        Args:
+            index (int): The index of the player to add an answer to.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        return self.replace_player(index, self.players[index].add_answer())
+
+    def add_miss(self, index: int) -> Self:
+        """Add a miss to the player at the given index in place.
+
+        Args:
+            index (int): The index of the player to add a miss to.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        return self.replace_player(index, self.players[index].add_miss())
+
+    def update_score(self, index: int, score: int) -> Self:
+        """Update the score of the player at the given index in place.
+
+        Args:
+            index (int): The index of the player to update.
+            score (int): The new score to set.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        return self.replace_player(index, self.players[index].update_score(score))
+
+    def set_breaks(self, index: int, breaks: int) -> Self:
+        """Update the number of breaks for the player at the given index in place.
+
+        Args:
+            index (int): The index of the player to update.
+            breaks (int): The new number of breaks to set.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        return self.replace_player(index, self.players[index].set_breaks(breaks))
+
+    def update_state(self, index: int, state: PlayerState) -> Self:
+        """Update the state of the player at the given index in place.
+
+        Args:
+            index (int): The index of the player to update.
+            state (PlayerState): The new state to set.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        return self.replace_player(index, self.players[index].update_state(state))
+
+    def reduce_breaks_all(self) -> Self:
+        """Reduce the breaks of all players by 1 in place.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        for index, player in enumerate(self.players):
+            if player.breaks:
+                self.replace_player(index, player.set_breaks(max(0, player.breaks - 1)))
+        return self
+
+    def set_question_count(self, count: int) -> Self:
+        """Update the question count in place.
+
+        Args:
+            count (int): The new question count.
+
+        Raises:
+            ValueError: If count is less than 1.
+
+        Returns:
+            Self: This scoreboard.
+
+        """
+        if count < 1:
+            raise ValueError("Question count must be at least 1.")
+        self.question_count = count
+        return self
+
+    def freeze(self) -> ScoreboardState:
+        """Create an immutable ScoreboardState from the current values.
+
+        When only a few players changed, they are set on the original vector
+        so the new state shares structure with it; otherwise the vector is
+        rebuilt in one pass. When nothing changed, the original state is
+        returned.
+
+        Raises:
+            ValueError: If any added player is the same as another player.
+
+        Returns:
+            ScoreboardState: The frozen scoreboard state.
+
+        """
+        resized = len(self.players) != len(self._base)
+        if (
+            not self._changed
+            and not resized
+            and self.question_count == self._scoreboard.question_count
+        ):
+            return self._scoreboard
+        if not resized and len(self._changed) * 64 < len(self.players):
+            players = self._base
+            for index in sorted(self._changed):
+                players = players.set(index, self.players[index])
+        else:
+            players = PersistentVector(self.players)
+        return ScoreboardState(
+            players=players,
+            question_count=self.question_count,
+            player_index=None if self._identity_changed else self._base_index,
+        )
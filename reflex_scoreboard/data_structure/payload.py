@@ -1,39 +1,108 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import cast
+from typing import ClassVar, cast
 
 
 class PayloadType(Enum):
-    """Enum for payload types."""
+    """Enum for payload types.
+
+    RIGHT, MISS and THROUGH move to the next question. The other types are
+    corrections of one player that keep the question count, and carry the
+    new value in the payload.
+    """
 
     RIGHT = 1
     THROUGH = 0
     MISS = -1
+    # Add the value to the score. A negative value is a penalty.
+    ADJUST = 2
+    # Override the state with PlayerState(value).
+    SET_STATE = 3
+    # Rest the player for the value number of questions.
+    REST = 4
+
+
+# Payload types that need a value.
+VALUE_TYPES = frozenset({PayloadType.ADJUST, PayloadType.SET_STATE, PayloadType.REST})
+# Maximum number of interned payloads. A board with N players has 2N + 1
+# answer payloads, so this covers the boards the app shows.
+INTERN_SIZE = 4096
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Payload:
     """Class for payload.
 
+    Payloads are immutable, so equal payloads can be shared. Use ``of`` to
+    get the interned payload for a type and index instead of creating and
+    validating a new object each time.
+
     Attributes:
         payload_type (PayloadType): Type of the payload.
-        index (int | None): Index of the player. Required for RIGHT and MISS payloads.
-            Default is None.
+        index (int | None): Index of the player. Required for all payloads but
+            THROUGH. Default is None.
+        value (int | None): Value of a correction. Required for ADJUST,
+            SET_STATE and REST payloads. Default is None.
 
     """
 
     payload_type: PayloadType
     extended_index: int | None = None
+    value: int | None = None
+
+    _interned: ClassVar[
+        dict[tuple[PayloadType, int | None, int | None], "Payload"]
+    ] = {}
+
+    @classmethod
+    def of(
+        cls,
+        payload_type: PayloadType,
+        index: int | None = None,
+        value: int | None = None,
+    ) -> "Payload":
+        """Get the interned payload for a type, index and value.
+
+        A board with N players has only 2N + 1 distinct answer payloads, so
+        each is created and validated once and shared afterwards. The cache
+        is cleared when it holds INTERN_SIZE payloads, so arbitrary indices
+        and values cannot grow it without bound.
+
+        Args:
+            payload_type (PayloadType): Type of the payload.
+            index (int | None): Index of the player. Required for all
+                payloads but THROUGH. Default is None.
+            value (int | None): Value of a correction. Required for ADJUST,
+                SET_STATE and REST payloads. Default is None.
+
+        Raises:
+            ValueError: If index or value is missing.
+
+        Returns:
+            Payload: The interned payload.
+
+        """
+        key = (payload_type, index, value)
+        payload = cls._interned.get(key)
+        if payload is None:
+            payload = Payload(payload_type, index, value)
+            if len(cls._interned) >= INTERN_SIZE:
+                cls._interned.clear()
+            cls._interned[key] = payload
+        return payload
 
     def __post_init__(self) -> None:
         """Validate the payload attributes.
 
         Raises:
-            ValueError: If index is None for RIGHT or MISS payloads.
+            ValueError: If index is None for payloads other than THROUGH, or
+                value is None for ADJUST, SET_STATE and REST payloads.
 
         """
         if self.payload_type != PayloadType.THROUGH and self.extended_index is None:
-            raise ValueError("Index must be provided for RIGHT and MISS payloads.")
+            raise ValueError("Index must be provided for payloads other than THROUGH.")
+        if self.payload_type in VALUE_TYPES and self.value is None:
+            raise ValueError("Value must be provided for correction payloads.")
 
     @property
     def index(self) -> int:
@@ -0,0 +1,131 @@
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+
+from reflex_scoreboard.data_structure.payload import INTERN_SIZE, Payload, PayloadType
+
+# Each payload is one little-endian 32-bit word: the low 2 bits hold the
+# type code and the other bits hold the player index plus 1, or 0 for none.
+PAYLOAD_WIDTH = 4
+TYPE_BITS = 2
+TYPE_MASK = (1 << TYPE_BITS) - 1
+MAX_INDEX = (1 << (8 * PAYLOAD_WIDTH - TYPE_BITS)) - 2
+TYPE_CODES = {PayloadType.THROUGH: 0, PayloadType.RIGHT: 1, PayloadType.MISS: 2}
+CODE_TYPES = {code: payload_type for payload_type, code in TYPE_CODES.items()}
+
+
+def encode_payload(payload: Payload) -> int:
+    """Encode a payload as a word.
+
+    Only RIGHT, MISS and THROUGH payloads are encoded. Corrections carry a
+    value that does not fit in the word.
+
+    Args:
+        payload (Payload): The payload to encode.
+
+    Raises:
+        ValueError: If the type or the index of the payload cannot be encoded.
+
+    Returns:
+        int: The encoded word.
+
+    """
+    if payload.payload_type not in TYPE_CODES:
+        raise ValueError("Payload type cannot be encoded.")
+    index = payload.extended_index
+    if index is None:
+        return TYPE_CODES[payload.payload_type]
+    if not 0 <= index <= MAX_INDEX:
+        raise ValueError("Index is out of the encodable range.")
+    return (index + 1) << TYPE_BITS | TYPE_CODES[payload.payload_type]
+
+
+def decode_payload(word: int) -> Payload:
+    """Decode a word as an interned payload.
+
+    Args:
+        word (int): The encoded word.
+
+    Raises:
+        ValueError: If the word has an unknown type code.
+
+    Returns:
+        Payload: The interned payload.
+
+    """
+    payload_type = CODE_TYPES.get(word & TYPE_MASK)
+    if payload_type is None:
+        raise ValueError("Unknown payload type code.")
+    index = (word >> TYPE_BITS) - 1
+    return Payload.of(payload_type, None if index < 0 else index)
+
+
+class _PayloadTable(dict[int, Payload]):
+    """Cache of the decoded payload of each word.
+
+    Like the interned payloads, it is cleared when it holds INTERN_SIZE
+    words.
+    """
+
+    def __missing__(self, word: int) -> Payload:
+        """Decode a word seen for the first time.
+
+        Args:
+            word (int): The encoded word.
+
+        Returns:
+            Payload: The interned payload.
+
+        """
+        payload = decode_payload(word)
+        if len(self) >= INTERN_SIZE:
+            self.clear()
+        self[word] = payload
+        return payload
+
+
+_PAYLOAD_TABLE = _PayloadTable()
+
+
+def encode_payloads(payloads: Iterable[Payload]) -> bytes:
+    """Encode payloads as fixed-width words.
+
+    Args:
+        payloads (Iterable[Payload]): The payloads to encode.
+
+    Returns:
+        bytes: The encoded payloads, PAYLOAD_WIDTH bytes each.
+
+    """
+    words = array("I", map(encode_payload, payloads))
+    if sys.byteorder == "big":
+        words.byteswap()
+    return words.tobytes()
+
+
+def decode_payloads(data: bytes | bytearray | memoryview) -> Iterator[Payload]:
+    """Decode fixed-width words as interned payloads.
+
+    The data is read in place as an array of words, and each word is mapped
+    to its shared payload, so no Payload is created per event.
+
+    Args:
+        data (bytes | bytearray | memoryview): The encoded payloads.
+
+    Raises:
+        ValueError: If the data length is not a multiple of PAYLOAD_WIDTH.
+
+    Returns:
+        Iterator[Payload]: The decoded payloads, in order.
+
+    """
+    if len(data) % PAYLOAD_WIDTH:
+        raise ValueError("Data length must be a multiple of the payload width.")
+    words: Iterable[int]
+    if sys.byteorder == "big":
+        swapped = array("I", bytes(data))
+        swapped.byteswap()
+        words = swapped
+    else:
+        words = memoryview(data).cast("B").cast("I")
+    return map(_PAYLOAD_TABLE.__getitem__, words)
@@ -0,0 +1,250 @@
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import chain
+from typing import Any
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+# Average number of keys per leaf above which the trie gets a level deeper.
+_LEAF_SIZE = 32
+
+type _Node = tuple[Any, ...] | dict[Any, Any]
+
+
+class PersistentMap[K, V](Mapping[K, V]):
+    """Immutable hash map with structural sharing between versions.
+
+    The map is a 32-way trie of tuples over the low bits of the key hashes,
+    with a small dict at each leaf. Updates copy only the leaf of the key
+    and the path to it, so ``set`` and ``delete`` cost O(log32 n) and every
+    previous version stays valid. Leaves are never changed after creation.
+
+    """
+
+    __slots__ = ("_count", "_root", "_shift")
+
+    def __init__(self, items: Mapping[K, V] | Iterable[tuple[K, V]] = ()) -> None:
+        """Build a map from key-value pairs in O(n).
+
+        Args:
+            items (Mapping[K, V] | Iterable[tuple[K, V]]): The pairs. Later
+                pairs replace earlier ones with the same key.
+
+        """
+        values = dict(items)
+        count = len(values)
+        shift = -_BITS
+        while count > _LEAF_SIZE << (shift + _BITS):
+            shift += _BITS
+        leaves: list[dict[K, V]] = [{} for _ in range(1 << (shift + _BITS))]
+        mask = len(leaves) - 1
+        for key, value in values.items():
+            leaves[hash(key) & mask][key] = value
+        nodes: list[_Node] = list(leaves)
+        while len(nodes) > 1:
+            nodes = [
+                tuple(nodes[start : start + _WIDTH])
+                for start in range(0, len(nodes), _WIDTH)
+            ]
+        self._count = count
+        self._shift = shift
+        self._root: _Node = nodes[0]
+
+    @classmethod
+    def _create(cls, count: int, shift: int, root: _Node) -> "PersistentMap[K, V]":
+        """Create a map directly from its internal nodes.
+
+        Args:
+            count (int): Number of keys.
+            shift (int): Bit shift of the root level, or -5 for a single leaf.
+            root (_Node): Root node of the trie.
+
+        Returns:
+            PersistentMap[K, V]: The new map.
+
+        """
+        mapping = cls.__new__(cls)
+        mapping._count = count  # noqa: SLF001
+        mapping._shift = shift  # noqa: SLF001
+        mapping._root = root  # noqa: SLF001
+        return mapping
+
+    def _leaf_for(self, hashed: int) -> dict[K, V]:
+        """Get the leaf holding the keys with the given hash.
+
+        Args:
+            hashed (int): The hash of the key.
+
+        Returns:
+            dict[K, V]: The leaf.
+
+        """
+        node = self._root
+        shift = self._shift
+        while shift >= 0:
+            node = node[(hashed >> shift) & _MASK]
+            shift -= _BITS
+        return node  # type: ignore[return-value]
+
+    def get(self, key: K, default: Any = None) -> Any:  # noqa: ANN401
+        """Get the value of a key.
+
+        Args:
+            key (K): The key to look up.
+            default (Any): The value returned for a missing key.
+                Default is None.
+
+        Returns:
+            Any: The value of the key, or default if it is missing.
+
+        """
+        return self._leaf_for(hash(key)).get(key, default)
+
+    def __getitem__(self, key: K) -> V:
+        """Get the value of a key.
+
+        Args:
+            key (K): The key to look up.
+
+        Returns:
+            V: The value of the key.
+
+        """
+        return self._leaf_for(hash(key))[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the map has a key.
+
+        Args:
+            key (object): The key to look up.
+
+        Returns:
+            bool: True if the key is in the map.
+
+        """
+        return key in self._leaf_for(hash(key))
+
+    def __len__(self) -> int:
+        """Get the number of keys in the map.
+
+        Returns:
+            int: Number of keys.
+
+        """
+        return self._count
+
+    def _leaves(self, node: _Node, level: int) -> Iterator[dict[K, V]]:
+        """Iterate over the leaves below a node.
+
+        Args:
+            node (_Node): The node to walk.
+            level (int): Bit shift of the node level.
+
+        Yields:
+            dict[K, V]: Leaves in trie order.
+
+        """
+        if level < 0:
+            yield node  # type: ignore[misc]
+            return
+        for child in node:
+            yield from self._leaves(child, level - _BITS)
+
+    def _pairs(self) -> Iterator[tuple[K, V]]:
+        """Iterate over the key-value pairs of the map.
+
+        Returns:
+            Iterator[tuple[K, V]]: Pairs in trie order.
+
+        """
+        return chain.from_iterable(
+            leaf.items() for leaf in self._leaves(self._root, self._shift)
+        )
+
+    def to_dict(self) -> dict[K, V]:
+        """Copy the map into a dict in O(n).
+
+        Returns:
+            dict[K, V]: The keys and values of the map.
+
+        """
+        return dict(self._pairs())
+
+    def __iter__(self) -> Iterator[K]:
+        """Iterate over the keys of the map.
+
+        Yields:
+            K: Keys in trie order.
+
+        """
+        for leaf in self._leaves(self._root, self._shift):
+            yield from leaf
+
+    def __repr__(self) -> str:
+        """Get the representation of the map.
+
+        Returns:
+            str: The representation.
+
+        """
+        return f"PersistentMap({self.to_dict()!r})"
+
+    def _assoc(self, level: int, node: _Node, hashed: int, leaf: dict[K, V]) -> _Node:
+        """Copy the path to the leaf of a hash with the leaf replaced.
+
+        Args:
+            level (int): Bit shift of the node level.
+            node (_Node): The node to copy.
+            hashed (int): The hash of the key.
+            leaf (dict[K, V]): The new leaf.
+
+        Returns:
+            _Node: The copied node.
+
+        """
+        if level < 0:
+            return leaf
+        slot = (hashed >> level) & _MASK
+        child = self._assoc(level - _BITS, node[slot], hashed, leaf)  # type: ignore[index]
+        return (*node[:slot], child, *node[slot + 1 :])  # type: ignore[index]
+
+    def set(self, key: K, value: V) -> "PersistentMap[K, V]":
+        """Return a new map with the value of a key set.
+
+        The trie gets a level deeper when the leaves hold too many keys on
+        average, which costs O(n) once every 32-fold growth.
+
+        Args:
+            key (K): The key to set.
+            value (V): The new value.
+
+        Returns:
+            PersistentMap[K, V]: The updated map.
+
+        """
+        hashed = hash(key)
+        leaf = self._leaf_for(hashed)
+        count = self._count + (key not in leaf)
+        if count > _LEAF_SIZE << (self._shift + _BITS):
+            return PersistentMap(chain(self._pairs(), [(key, value)]))
+        root = self._assoc(self._shift, self._root, hashed, {**leaf, key: value})
+        return self._create(count, self._shift, root)
+
+    def delete(self, key: K) -> "PersistentMap[K, V]":
+        """Return a new map without a key.
+
+        Args:
+            key (K): The key to remove.
+
+        Raises:
+            KeyError: If the key is missing.
+
+        Returns:
+            PersistentMap[K, V]: The updated map.
+
+        """
+        hashed = hash(key)
+        leaf = dict(self._leaf_for(hashed))
+        del leaf[key]
+        root = self._assoc(self._shift, self._root, hashed, leaf)
+        return self._create(self._count - 1, self._shift, root)
@@ -0,0 +1,393 @@
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import compress
+from operator import is_not
+from typing import Any, overload
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+type _Node = tuple[Any, ...]
+
+
+class PersistentVector[T](Sequence[T]):
+    """Immutable vector with structural sharing between versions.
+
+    The vector is a 32-way trie of tuples with a separate tail leaf, as in
+    Clojure's ``PersistentVector``. Updates copy only the path from the root
+    to the changed leaf, so ``set`` and ``append`` cost O(log32 n) and every
+    previous version stays valid.
+
+    """
+
+    __slots__ = ("_count", "_root", "_shift", "_tail")
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        """Build a vector from an iterable in O(n).
+
+        Args:
+            items (Iterable[T]): Elements of the vector, in order.
+
+        """
+        values = tuple(items)
+        count = len(values)
+        tail_offset = ((count - 1) >> _BITS) << _BITS if count else 0
+        nodes: list[_Node] = [
+            values[start : start + _WIDTH] for start in range(0, tail_offset, _WIDTH)
+        ]
+        shift = _BITS
+        while len(nodes) > _WIDTH:
+            nodes = [
+                tuple(nodes[start : start + _WIDTH])
+                for start in range(0, len(nodes), _WIDTH)
+            ]
+            shift += _BITS
+        self._count = count
+        self._shift = shift
+        self._root: _Node = tuple(nodes)
+        self._tail: _Node = values[tail_offset:]
+
+    @classmethod
+    def _create(
+        cls, count: int, shift: int, root: _Node, tail: _Node
+    ) -> "PersistentVector[T]":
+        """Create a vector directly from its internal nodes.
+
+        Args:
+            count (int): Number of elements.
+            shift (int): Bit shift of the root level.
+            root (_Node): Root node of the trie.
+            tail (_Node): Tail leaf.
+
+        Returns:
+            PersistentVector[T]: The new vector.
+
+        """
+        vector = cls.__new__(cls)
+        vector._count = count  # noqa: SLF001
+        vector._shift = shift  # noqa: SLF001
+        vector._root = root  # noqa: SLF001
+        vector._tail = tail  # noqa: SLF001
+        return vector
+
+    def _tail_offset(self) -> int:
+        """Get the index of the first element stored in the tail.
+
+        Returns:
+            int: Index of the first tail element.
+
+        """
+        return self._count - len(self._tail)
+
+    def _leaf_for(self, index: int) -> _Node:
+        """Get the leaf node holding the element at the given index.
+
+        Args:
+            index (int): A non-negative index smaller than the vector length.
+
+        Returns:
+            _Node: The leaf containing the element.
+
+        """
+        if index >= self._tail_offset():
+            return self._tail
+        node = self._root
+        level = self._shift
+        while level > 0:
+            node = node[(index >> level) & _MASK]
+            level -= _BITS
+        return node
+
+    def _normalize_index(self, index: int) -> int:
+        """Convert a possibly negative index to a non-negative one.
+
+        Args:
+            index (int): The index to normalize.
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            int: The non-negative index.
+
+        """
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("Index out of range.")
+        return index
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PersistentVector[T]": ...
+
+    def __getitem__(self, index: int | slice) -> "T | PersistentVector[T]":
+        """Get the element at the given index or a slice of the vector.
+
+        Args:
+            index (int | slice): The index or slice to retrieve.
+
+        Returns:
+            T | PersistentVector[T]: The element, or a new vector for slices.
+
+        """
+        if isinstance(index, slice):
+            return PersistentVector(list(self)[index])
+        index = self._normalize_index(index)
+        return self._leaf_for(index)[index & _MASK]
+
+    def __len__(self) -> int:
+        """Get the number of elements in the vector.
+
+        Returns:
+            int: Number of elements.
+
+        """
+        return self._count
+
+    def _leaves(self, node: _Node, level: int) -> Iterator[_Node]:
+        """Iterate over the leaves below a node from left to right.
+
+        Args:
+            node (_Node): The node to walk.
+            level (int): Bit shift of the node level.
+
+        Yields:
+            _Node: Leaf nodes in order.
+
+        """
+        if level == 0:
+            yield node
+            return
+        for child in node:
+            yield from self._leaves(child, level - _BITS)
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over the elements of the vector.
+
+        Yields:
+            T: Elements in order.
+
+        """
+        for leaf in self._leaves(self._root, self._shift):
+            yield from leaf
+        yield from self._tail
+
+    def __eq__(self, other: object) -> bool:
+        """Check element-wise equality with another sequence.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if both sequences hold equal elements in the same order.
+
+        """
+        if isinstance(other, PersistentVector):
+            if self._root is other._root and self._tail is other._tail:
+                return True
+        elif not isinstance(other, list | tuple):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other, strict=True)
+        )
+
+    def __hash__(self) -> int:
+        """Hash the vector by its elements.
+
+        Returns:
+            int: The hash value.
+
+        """
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        """Get the representation of the vector.
+
+        Returns:
+            str: The representation.
+
+        """
+        return f"PersistentVector({list(self)!r})"
+
+    def _assoc(self, level: int, node: _Node, index: int, value: T) -> _Node:
+        """Copy the path to the given index with the element replaced.
+
+        Args:
+            level (int): Bit shift of the node level.
+            node (_Node): The node to copy.
+            index (int): The index of the element to replace.
+            value (T): The new element.
+
+        Returns:
+            _Node: The copied node.
+
+        """
+        slot = (index >> level) & _MASK
+        child = (
+            value
+            if level == 0
+            else self._assoc(level - _BITS, node[slot], index, value)
+        )
+        return (*node[:slot], child, *node[slot + 1 :])
+
+    def set(self, index: int, value: T) -> "PersistentVector[T]":
+        """Return a new vector with the element at the given index replaced.
+
+        Args:
+            index (int): The index of the element to replace.
+            value (T): The new element.
+
+        Returns:
+            PersistentVector[T]: The updated vector.
+
+        """
+        index = self._normalize_index(index)
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            slot = index - tail_offset
+            tail = (*self._tail[:slot], value, *self._tail[slot + 1 :])
+            return self._create(self._count, self._shift, self._root, tail)
+        root = self._assoc(self._shift, self._root, index, value)
+        return self._create(self._count, self._shift, root, self._tail)
+
+    @staticmethod
+    def _new_path(level: int, node: _Node) -> _Node:
+        """Wrap a leaf in single-child nodes up to the given level.
+
+        Args:
+            level (int): Bit shift of the level to reach.
+            node (_Node): The leaf to wrap.
+
+        Returns:
+            _Node: The wrapped node.
+
+        """
+        while level > 0:
+            node = (node,)
+            level -= _BITS
+        return node
+
+    def _push_tail(self, level: int, parent: _Node, tail: _Node) -> _Node:
+        """Copy the rightmost path of the trie with the full tail inserted.
+
+        Args:
+            level (int): Bit shift of the parent level.
+            parent (_Node): The node to copy.
+            tail (_Node): The full tail leaf to insert.
+
+        Returns:
+            _Node: The copied node.
+
+        """
+        slot = ((self._count - 1) >> level) & _MASK
+        if level == _BITS:
+            child = tail
+        elif slot < len(parent):
+            child = self._push_tail(level - _BITS, parent[slot], tail)
+        else:
+            child = self._new_path(level - _BITS, tail)
+        if slot < len(parent):
+            return (*parent[:slot], child, *parent[slot + 1 :])
+        return (*parent, child)
+
+    def append(self, value: T) -> "PersistentVector[T]":
+        """Return a new vector with the element added at the end.
+
+        Args:
+            value (T): The element to add.
+
+        Returns:
+            PersistentVector[T]: The extended vector.
+
+        """
+        if len(self._tail) < _WIDTH:
+            return self._create(
+                self._count + 1, self._shift, self._root, (*self._tail, value)
+            )
+        shift = self._shift
+        if (self._count >> _BITS) > (1 << shift):
+            root = (self._root, self._new_path(shift, self._tail))
+            shift += _BITS
+        else:
+            root = self._push_tail(shift, self._root, self._tail)
+        return self._create(self._count + 1, shift, root, (value,))
+
+    def extend(self, values: Iterable[T]) -> "PersistentVector[T]":
+        """Return a new vector with the elements added at the end.
+
+        Args:
+            values (Iterable[T]): The elements to add.
+
+        Returns:
+            PersistentVector[T]: The extended vector.
+
+        """
+        vector = self
+        for value in values:
+            vector = vector.append(value)
+        return vector
+
+    def _diff_nodes(
+        self, node: _Node, other: _Node, level: int, offset: int
+    ) -> Iterator[int]:
+        """Iterate over indices whose elements differ below two nodes.
+
+        Args:
+            node (_Node): A node of this vector.
+            other (_Node): The node at the same position in the other vector.
+            level (int): Bit shift of the node level.
+            offset (int): Index of the first element below the nodes.
+
+        Yields:
+            int: Indices of elements that are not the same object.
+
+        """
+        if node is other:
+            return
+        # map and compress compare the slots in C, so only the slots that
+        # differ reach Python code.
+        slots = compress(range(len(node)), map(is_not, node, other))
+        if level == 0:
+            for slot in slots:
+                yield offset + slot
+            return
+        for slot in slots:
+            yield from self._diff_nodes(
+                node[slot], other[slot], level - _BITS, offset + (slot << level)
+            )
+
+    def diff(self, other: "PersistentVector[T]") -> Iterator[int]:
+        """Iterate over indices whose elements differ from another vector.
+
+        Subtrees shared between both vectors are skipped, so comparing a
+        vector with one derived from it by k updates costs O(k log n).
+        Elements are compared by identity.
+
+        Args:
+            other (PersistentVector[T]): A vector of the same length.
+
+        Raises:
+            ValueError: If the vectors have different lengths.
+
+        Yields:
+            int: Indices of elements that are not the same object.
+
+        """
+        if len(self) != len(other):
+            raise ValueError("Vectors must have the same length.")
+        tail_offset = self._tail_offset()
+        if self._shift == other._shift:  # noqa: SLF001
+            yield from self._diff_nodes(self._root, other._root, self._shift, 0)  # noqa: SLF001
+        else:
+            for index in range(tail_offset):
+                if self[index] is not other[index]:
+                    yield index
+        if self._tail is not other._tail:  # noqa: SLF001
+            for slot in compress(
+                range(len(self._tail)),
+                map(is_not, self._tail, other._tail),  # noqa: SLF001
+            ):
+                yield tail_offset + slot
@@ -1,4 +1,5 @@
 import dataclasses
+from collections.abc import Iterable
 from enum import Enum
 
 
@@ -10,10 +11,14 @@ class PlayerState(Enum):
     LOSE = -1
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class PlayerScore:
     """Base class for player scores.
 
+    The class uses slots, so instances have no ``__dict__``. The update
+    methods build the copy directly instead of going through
+    ``dataclasses.replace``, since they run for every payload.
+
     Attributes:
         player_id (str): Unique identifier for the player.
         name (str): Name of the player.
@@ -40,7 +45,15 @@ class PlayerScore:
             PlayerScore: A new PlayerScore instance with incremented answers.
 
         """
-        return dataclasses.replace(self, answers=self.answers + 1)
+        return _new_player(
+            self.player_id,
+            self.name,
+            self.answers + 1,
+            self.misses,
+            self.score,
+            self.breaks,
+            self.state,
+        )
 
     def add_miss(self) -> "PlayerScore":
         """Increment the number of misses by 1.
@@ -49,7 +62,15 @@ class PlayerScore:
             PlayerScore: A new PlayerScore instance with incremented misses.
 
         """
-        return dataclasses.replace(self, misses=self.misses + 1)
+        return _new_player(
+            self.player_id,
+            self.name,
+            self.answers,
+            self.misses + 1,
+            self.score,
+            self.breaks,
+            self.state,
+        )
 
     def update_score(self, score: int) -> "PlayerScore":
         """Update the score of the player.
@@ -61,7 +82,15 @@ class PlayerScore:
             PlayerScore: A new PlayerScore instance with updated score.
 
         """
-        return dataclasses.replace(self, score=score)
+        return _new_player(
+            self.player_id,
+            self.name,
+            self.answers,
+            self.misses,
+            score,
+            self.breaks,
+            self.state,
+        )
 
     def set_breaks(self, breaks: int) -> "PlayerScore":
         """Update the number of breaks for the player.
@@ -73,7 +102,15 @@ class PlayerScore:
             PlayerScore: A new PlayerScore instance with updated breaks.
 
         """
-        return dataclasses.replace(self, breaks=breaks)
+        return _new_player(
+            self.player_id,
+            self.name,
+            self.answers,
+            self.misses,
+            self.score,
+            breaks,
+            self.state,
+        )
 
     def update_state(self, state: PlayerState) -> "PlayerScore":
         """Update the state of the player.
@@ -85,7 +122,40 @@ class PlayerScore:
             PlayerScore: A new PlayerScore instance with updated state.
 
         """
-        return dataclasses.replace(self, state=state)
+        return _new_player(
+            self.player_id,
+            self.name,
+            self.answers,
+            self.misses,
+            self.score,
+            self.breaks,
+            state,
+        )
+
+    def with_results(
+        self,
+        answers: int,
+        misses: int,
+        score: int,
+        breaks: int,
+        state: PlayerState,
+    ) -> "PlayerScore":
+        """Create a copy of the player with all results replaced.
+
+        Args:
+            answers (int): The new number of correct answers.
+            misses (int): The new number of misses.
+            score (int): The new score.
+            breaks (int): The new number of breaks.
+            state (PlayerState): The new state.
+
+        Returns:
+            PlayerScore: A new PlayerScore instance with the new results.
+
+        """
+        return _new_player(
+            self.player_id, self.name, answers, misses, score, breaks, state
+        )
 
     def is_same_player(self, player: "PlayerScore") -> bool:
         """Check if the current player is the same as another player.
@@ -98,3 +168,88 @@ class PlayerScore:
 
         """
         return self.player_id == player.player_id and self.name == player.name
+
+
+_PLAYER_SETTERS = tuple(
+    getattr(PlayerScore, field.name).__set__
+    for field in dataclasses.fields(PlayerScore)
+)
+
+
+def _new_player(  # noqa: PLR0913, PLR0917
+    player_id: int,
+    name: str,
+    answers: int,
+    misses: int,
+    score: int,
+    breaks: int,
+    state: PlayerState,
+) -> PlayerScore:
+    """Create a PlayerScore without running the dataclass __init__.
+
+    The slots are set through their descriptors, which skips the frozen
+    check and the default handling of __init__.
+
+    Args:
+        player_id (int): Unique identifier for the player.
+        name (str): Name of the player.
+        answers (int): Number of correct answers.
+        misses (int): Number of misses.
+        score (int): Total score.
+        breaks (int): Number of breaks.
+        state (PlayerState): Current state of the player.
+
+    Returns:
+        PlayerScore: The created player.
+
+    """
+    player = object.__new__(PlayerScore)
+    (
+        set_player_id,
+        set_name,
+        set_answers,
+        set_misses,
+        set_score,
+        set_breaks,
+        set_state,
+    ) = _PLAYER_SETTERS
+    set_player_id(player, player_id)
+    set_name(player, name)
+    set_answers(player, answers)
+    set_misses(player, misses)
+    set_score(player, score)
+    set_breaks(player, breaks)
+    set_state(player, state)
+    return player
+
+
+def build_players(  # noqa: PLR0913, PLR0917
+    player_ids: Iterable[int],
+    names: Iterable[str],
+    answers: Iterable[int],
+    misses: Iterable[int],
+    scores: Iterable[int],
+    breaks: Iterable[int],
+    states: Iterable[PlayerState],
+) -> list[PlayerScore]:
+    """Create players from one iterable per field.
+
+    This skips the dataclass __init__ like the update methods, so decoders
+    can build large rosters quickly.
+
+    Args:
+        player_ids (Iterable[int]): Player IDs.
+        names (Iterable[str]): Player names.
+        answers (Iterable[int]): Numbers of correct answers.
+        misses (Iterable[int]): Numbers of misses.
+        scores (Iterable[int]): Total scores.
+        breaks (Iterable[int]): Numbers of breaks.
+        states (Iterable[PlayerState]): States of the players.
+
+    Returns:
+        list[PlayerScore]: The created players, in order.
+
+    """
+    return list(
+        map(_new_player, player_ids, names, answers, misses, scores, breaks, states)
+    )
@@ -0,0 +1,157 @@
+import dataclasses
+from collections.abc import Iterable, Sequence
+
+from reflex_scoreboard.data_structure.persistent_map import PersistentMap
+from reflex_scoreboard.data_structure.player import PlayerScore
+
+
+@dataclasses.dataclass(frozen=True)
+class PlayerIndex:
+    """The dataclass to look up players of a scoreboard by identity.
+
+    The index is shared between scoreboard states as long as no player
+    identity changes, so score updates never copy it. Its maps are
+    persistent, so adding or renaming players copies only the paths to the
+    changed keys.
+
+    Attributes:
+        by_id (PersistentMap[int, tuple[int, ...]]): Indices of the players
+            with each player ID, in ascending order.
+        by_key (PersistentMap[tuple[int, str], int]): Index of the player with
+            each (player ID, name) pair.
+
+    """
+
+    by_id: PersistentMap[int, tuple[int, ...]]
+    by_key: PersistentMap[tuple[int, str], int]
+
+    @staticmethod
+    def build(players: Iterable[PlayerScore]) -> "PlayerIndex":
+        """Build the index of the players.
+
+        Args:
+            players (Iterable[PlayerScore]): The players, in scoreboard order.
+
+        Raises:
+            ValueError: If any two players have the same ID and name.
+
+        Returns:
+            PlayerIndex: The built index.
+
+        """
+        players = list(players)
+        return PlayerIndex.from_identities(
+            [player.player_id for player in players],
+            [player.name for player in players],
+        )
+
+    @staticmethod
+    def from_identities(
+        player_ids: Sequence[int], names: Sequence[str]
+    ) -> "PlayerIndex":
+        """Build the index from the player IDs and names in scoreboard order.
+
+        Args:
+            player_ids (Sequence[int]): The player IDs.
+            names (Sequence[str]): The player names.
+
+        Raises:
+            ValueError: If any two players have the same ID and name.
+
+        Returns:
+            PlayerIndex: The built index.
+
+        """
+        by_key = dict(
+            zip(zip(player_ids, names, strict=True), range(len(names)), strict=True)
+        )
+        if len(by_key) != len(names):
+            raise ValueError("Players must be different.")
+        # Player IDs are usually unique, which takes only this comprehension.
+        by_id = {player_id: (index,) for index, player_id in enumerate(player_ids)}
+        if len(by_id) != len(player_ids):
+            by_id = {}
+            for index, player_id in enumerate(player_ids):
+                by_id[player_id] = (*by_id.get(player_id, ()), index)
+        return PlayerIndex(PersistentMap(by_id), PersistentMap(by_key))
+
+    def extended(self, players: Iterable[PlayerScore], start: int) -> "PlayerIndex":
+        """Get the index with players added at the end.
+
+        Adding m players to n players writes only the added keys, which
+        costs O(m log32 n). When m is more than a quarter of n, the maps
+        are rebuilt in O(n + m) instead, since that is faster.
+
+        Args:
+            players (Iterable[PlayerScore]): The players to add.
+            start (int): The index of the first added player.
+
+        Raises:
+            ValueError: If any player is the same as an existing player.
+
+        Returns:
+            PlayerIndex: The extended index.
+
+        """
+        players = list(players)
+        if len(players) > len(self.by_key) >> 2:
+            ids = self.by_id.to_dict()
+            keys = self.by_key.to_dict()
+            for index, player in enumerate(players, start):
+                key = (player.player_id, player.name)
+                if key in keys:
+                    raise ValueError("Players must be different.")
+                keys[key] = index
+                ids[player.player_id] = (*ids.get(player.player_id, ()), index)
+            return PlayerIndex(PersistentMap(ids), PersistentMap(keys))
+        by_id = self.by_id
+        by_key = self.by_key
+        for index, player in enumerate(players, start):
+            key = (player.player_id, player.name)
+            if key in by_key:
+                raise ValueError("Players must be different.")
+            by_key = by_key.set(key, index)
+            indices = by_id.get(player.player_id, ())
+            by_id = by_id.set(player.player_id, (*indices, index))
+        return PlayerIndex(by_id, by_key)
+
+    def replaced(
+        self, index: int, old_player: PlayerScore, new_player: PlayerScore
+    ) -> "PlayerIndex":
+        """Get the index after a player was replaced.
+
+        Only the keys of the old and new identities are written, so this
+        costs O(log32 n).
+
+        Args:
+            index (int): The index of the replaced player.
+            old_player (PlayerScore): The replaced player.
+            new_player (PlayerScore): The player replacing it.
+
+        Raises:
+            ValueError: If the new player is the same as another player.
+
+        Returns:
+            PlayerIndex: This index if the identity of the player did not
+                change, otherwise the updated index.
+
+        """
+        if old_player.is_same_player(new_player):
+            return self
+        key = (new_player.player_id, new_player.name)
+        if key in self.by_key:
+            raise ValueError("Players must be different.")
+        by_key = self.by_key.delete((old_player.player_id, old_player.name))
+        by_id = self.by_id
+        if old_player.player_id != new_player.player_id:
+            indices = tuple(
+                other for other in by_id[old_player.player_id] if other != index
+            )
+            by_id = (
+                by_id.set(old_player.player_id, indices)
+                if indices
+                else by_id.delete(old_player.player_id)
+            )
+            indices = tuple(sorted((*by_id.get(new_player.player_id, ()), index)))
+            by_id = by_id.set(new_player.player_id, indices)
+        return PlayerIndex(by_id, by_key.set(key, index))
@@ -1,34 +1,133 @@
 import dataclasses
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Protocol, Self, cast
 
+from reflex_scoreboard.data_structure.persistent_vector import PersistentVector
 from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.player_index import PlayerIndex
 
+if TYPE_CHECKING:
+    from reflex_scoreboard.data_structure.mutable_scoreboard import MutableScoreboard
 
-@dataclasses.dataclass(frozen=True)
+
+class ScoreboardLike(Protocol):
+    """Protocol for scoreboard implementations used by the operations.
+
+    ScoreboardState implements it with one PlayerScore per player, and
+    ColumnarScoreboardState implements it with one array per field.
+    """
+
+    @property
+    def question_count(self) -> int:
+        """Number of questions."""
+        ...
+
+    def __getitem__(self, index: int) -> PlayerScore:
+        """Get the player at the given index."""
+        ...
+
+    def __len__(self) -> int:
+        """Get the number of players."""
+        ...
+
+    def replace_player(self, index: int, new_player: PlayerScore) -> Self:
+        """Replace the player at the given index."""
+        ...
+
+    def add_answer(self, index: int) -> Self:
+        """Add an answer to the player at the given index."""
+        ...
+
+    def add_miss(self, index: int) -> Self:
+        """Add a miss to the player at the given index."""
+        ...
+
+    def update_score(self, index: int, score: int) -> Self:
+        """Update the score of the player at the given index."""
+        ...
+
+    def set_breaks(self, index: int, breaks: int) -> Self:
+        """Update the number of breaks for the player at the given index."""
+        ...
+
+    def update_state(self, index: int, state: PlayerState) -> Self:
+        """Update the state of the player at the given index."""
+        ...
+
+    def reduce_breaks_all(self) -> Self:
+        """Reduce the breaks of all players by 1."""
+        ...
+
+    def set_question_count(self, count: int) -> Self:
+        """Update the question count."""
+        ...
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ScoreboardState:
     """The dataclass to store the scoreboard state.
 
+    The players are kept in a PersistentVector, so every update copies only
+    the path to the changed player and older states stay valid as snapshots.
+    The class uses slots to keep each snapshot small.
+
     Attributes:
-        players (list[PlayerScore]): List of PlayerScore objects.
+        players (Sequence[PlayerScore]): Sequence of PlayerScore objects.
+            Stored as a PersistentVector.
         question_count (int): Number of questions. Default to 1.
+        player_index (PlayerIndex | None): Index of the players by identity.
+            Built from players when omitted, and shared between states while
+            no player identity changes. Default to None.
 
     """
 
-    players: list[PlayerScore]
+    players: Sequence[PlayerScore]
     question_count: int = 1
+    player_index: PlayerIndex | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        """Post-initialization to ensure players is a list.
+        """Post-initialization to ensure players is a PersistentVector.
 
         Raises:
-            ValueError: If question_count is less than 1.
+            ValueError: If question_count is less than 1 or any player is the
+                same as another player.
 
         """
         if self.question_count < 1:
             raise ValueError("Question count must be at least 1.")
+        if not isinstance(self.players, PersistentVector):
+            object.__setattr__(self, "players", PersistentVector(self.players))
+        if self.player_index is None:
+            object.__setattr__(self, "player_index", PlayerIndex.build(self.players))
+
+    @property
+    def _index(self) -> PlayerIndex:
+        """Get the player index.
+
+        Returns:
+            PlayerIndex: The index of the players.
+
+        """
+        return cast("PlayerIndex", self.player_index)
+
+    @property
+    def _vector(self) -> PersistentVector[PlayerScore]:
+        """Get the players as a PersistentVector.
+
+        Returns:
+            PersistentVector[PlayerScore]: The players of the scoreboard.
+
+        """
+        return cast("PersistentVector[PlayerScore]", self.players)
 
     def add_players(self, new_players: list[PlayerScore]) -> "ScoreboardState":
         """Add players to the scoreboard.
 
+        Duplicates are found through the player index, so adding m players
+        to n players costs O(m log n).
+
         Args:
             new_players (list[PlayerScore]): List of PlayerScore objects to add.
 
@@ -39,12 +138,52 @@ class ScoreboardState:
             ScoreboardState: The updated scoreboard state with the added players.
 
         """
-        current_players = self.players
-        for new_player in new_players:
-            if any(new_player.is_same_player(p) for p in current_players):
-                raise ValueError("Players must be different.")
-            current_players.append(new_player)
-        return dataclasses.replace(self, players=current_players)
+        player_index = self._index.extended(new_players, start=len(self))
+        return ScoreboardState(
+            self._vector.extend(new_players), self.question_count, player_index
+        )
+
+    def index_of(self, player_id: int) -> int:
+        """Get the index of the first player with the given player ID.
+
+        Args:
+            player_id (int): The player ID to look up.
+
+        Raises:
+            KeyError: If no player has the player ID.
+
+        Returns:
+            int: The index of the player.
+
+        """
+        indices = self._index.by_id.get(player_id)
+        if indices is None:
+            raise KeyError("Player not found.")
+        return indices[0]
+
+    def get_player(self, player_id: int) -> PlayerScore:
+        """Get the first player with the given player ID.
+
+        Args:
+            player_id (int): The player ID to look up.
+
+        Returns:
+            PlayerScore: The player with the player ID.
+
+        """
+        return self.players[self.index_of(player_id)]
+
+    def contains_player(self, player: PlayerScore) -> bool:
+        """Check if the same player is on the scoreboard.
+
+        Args:
+            player (PlayerScore): The player to look up.
+
+        Returns:
+            bool: True if a player with the same ID and name exists.
+
+        """
+        return (player.player_id, player.name) in self._index.by_key
 
     def __getitem__(self, index: int) -> PlayerScore:
         """Get the player at the given index.
@@ -71,9 +210,11 @@ class ScoreboardState:
             ScoreboardState: The updated scoreboard state with the replaced player.
 
         """
-        players_list = self.players
-        players_list[index] = new_player
-        return dataclasses.replace(self, players=players_list)
+        return ScoreboardState(
+            self._vector.set(index, new_player),
+            self.question_count,
+            self._index.replaced(index, self[index], new_player),
+        )
 
     def add_answer(self, index: int) -> "ScoreboardState":
         """Add an answer to the player at the given index.
@@ -141,14 +282,21 @@ class ScoreboardState:
     def reduce_breaks_all(self) -> "ScoreboardState":
         """Reduce the breaks of all players in the scoreboard by 1.
 
+        The players are kept as they are when nobody has breaks left.
+
         Returns:
             ScoreboardState: The updated scoreboard state with reduced breaks.
 
         """
+        if all(player.breaks == 0 for player in self.players):
+            return self
         players_list = [
-            player.set_breaks(max(0, player.breaks - 1)) for player in self.players
+            player.set_breaks(max(0, player.breaks - 1)) if player.breaks else player
+            for player in self.players
         ]
-        return dataclasses.replace(self, players=players_list)
+        return ScoreboardState(
+            PersistentVector(players_list), self.question_count, self.player_index
+        )
 
     def set_question_count(self, count: int) -> "ScoreboardState":
         """Update the question count of the scoreboard.
@@ -160,7 +308,40 @@ class ScoreboardState:
             ScoreboardState: The updated scoreboard state with the new question count.
 
         """
-        return dataclasses.replace(self, question_count=count)
+        return ScoreboardState(self.players, count, self.player_index)
+
+    def edit(self) -> "MutableScoreboard":
+        """Create a mutable draft of the scoreboard for bulk edits.
+
+        Edits on the draft change a private copy in place, and
+        ``freeze`` creates the new state once, sharing the unchanged
+        players with this state.
+
+        Returns:
+            MutableScoreboard: The draft.
+
+        """
+        # Imported here, since MutableScoreboard is built on this module.
+        from reflex_scoreboard.data_structure.mutable_scoreboard import (  # noqa: PLC0415
+            MutableScoreboard,
+        )
+
+        return MutableScoreboard(self)
+
+    def changed_indices(self, other: "ScoreboardState") -> Iterator[int]:
+        """Iterate over the indices of players replaced in another state.
+
+        Players shared between the states are skipped, so comparing a state
+        with one derived from it by k updates costs O(k log n).
+
+        Args:
+            other (ScoreboardState): A state with the same number of players.
+
+        Returns:
+            Iterator[int]: Indices of players that are not the same object.
+
+        """
+        return self._vector.diff(cast("PersistentVector[PlayerScore]", other.players))
 
     def __len__(self) -> int:
         """Get the number of players in the scoreboard.
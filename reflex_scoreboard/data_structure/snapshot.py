@@ -0,0 +1,272 @@
+import struct
+import sys
+from array import array
+from collections.abc import Buffer, Sequence
+from itertools import accumulate, pairwise
+from typing import Literal
+
+from reflex_scoreboard.data_structure.player import (
+    PlayerScore,
+    PlayerState,
+    build_players,
+)
+from reflex_scoreboard.data_structure.player_index import PlayerIndex
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+# A snapshot stores the players by column so that each column can be read in
+# place, for example from a memory map:
+#   header, padded to 8 bytes
+#   player IDs, answers, misses, scores and breaks as int64
+#   state values as int8, padded to 4 bytes
+#   name offsets as uint32, one more than the players
+#   names as UTF-8
+# All numbers are little-endian.
+SNAPSHOT_MAGIC = b"RSBS"
+SNAPSHOT_VERSION = 1
+# Header: magic, version, reserved, question count, player count, name bytes.
+SNAPSHOT_HEADER = struct.Struct("<4sHHIII4x")
+INT_COLUMNS = ("player_ids", "answers", "misses", "scores", "breaks")
+
+_STATES = {state.value: state for state in PlayerState}
+_WIN_BYTE = PlayerState.WIN.value & 0xFF
+_LOSE_BYTE = PlayerState.LOSE.value & 0xFF
+_NORMAL_BYTE = PlayerState.NORMAL.value & 0xFF
+_SWAP = sys.byteorder == "big"
+
+
+def _align(offset: int, alignment: int) -> int:
+    """Round an offset up to a multiple of the alignment.
+
+    Args:
+        offset (int): The offset.
+        alignment (int): The alignment, a power of two.
+
+    Returns:
+        int: The aligned offset.
+
+    """
+    return (offset + alignment - 1) & -alignment
+
+
+class SnapshotLayout:
+    """Class for the offsets of the sections of a snapshot.
+
+    Attributes:
+        question_count (int): Number of questions.
+        player_count (int): Number of players.
+        names_size (int): Size of the names in bytes.
+        columns (dict[str, int]): Offset of each int64 column.
+        states (int): Offset of the state values.
+        name_offsets (int): Offset of the name offsets.
+        names (int): Offset of the names.
+        size (int): Total size of the snapshot in bytes.
+
+    """
+
+    def __init__(self, question_count: int, player_count: int, names_size: int) -> None:
+        """Compute the offsets of the sections.
+
+        Args:
+            question_count (int): Number of questions.
+            player_count (int): Number of players.
+            names_size (int): Size of the names in bytes.
+
+        """
+        self.question_count = question_count
+        self.player_count = player_count
+        self.names_size = names_size
+        column_size = 8 * player_count
+        self.columns = {
+            name: SNAPSHOT_HEADER.size + number * column_size
+            for number, name in enumerate(INT_COLUMNS)
+        }
+        self.states = SNAPSHOT_HEADER.size + len(INT_COLUMNS) * column_size
+        self.name_offsets = _align(self.states + player_count, 4)
+        self.names = self.name_offsets + 4 * (player_count + 1)
+        self.size = self.names + names_size
+
+    @staticmethod
+    def read(data: Buffer, offset: int = 0) -> "SnapshotLayout":
+        """Read and validate the header of a snapshot.
+
+        Args:
+            data (Buffer): The buffer holding the snapshot, for example bytes
+                or a memory map.
+            offset (int): The offset of the snapshot in the buffer. Default is 0.
+
+        Raises:
+            ValueError: If the data is not a snapshot, has an unsupported
+                version, or is shorter than the snapshot.
+
+        Returns:
+            SnapshotLayout: The layout of the snapshot.
+
+        """
+        available = memoryview(data).nbytes - offset
+        if available < SNAPSHOT_HEADER.size:
+            raise ValueError("Snapshot is truncated.")
+        magic, version, _, question_count, player_count, names_size = (
+            SNAPSHOT_HEADER.unpack_from(data, offset)
+        )
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Data is not a scoreboard snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError("Snapshot version is not supported.")
+        layout = SnapshotLayout(question_count, player_count, names_size)
+        if available < layout.size:
+            raise ValueError("Snapshot is truncated.")
+        return layout
+
+
+def _pack(typecode: str, values: Sequence[int]) -> bytes:
+    """Pack integers as a little-endian array.
+
+    Args:
+        typecode (str): The array typecode.
+        values (Sequence[int]): The values.
+
+    Returns:
+        bytes: The packed values.
+
+    """
+    packed = array(typecode, values)
+    if _SWAP:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack(view: memoryview, typecode: Literal["q", "I"]) -> list[int]:
+    """Unpack a little-endian array.
+
+    Args:
+        view (memoryview): The bytes of the array.
+        typecode (Literal["q", "I"]): The array typecode.
+
+    Returns:
+        list[int]: The values.
+
+    """
+    if _SWAP:
+        swapped = array(typecode, view.tobytes())
+        swapped.byteswap()
+        return swapped.tolist()
+    return view.cast(typecode).tolist()
+
+
+def _encode_states(players: list[PlayerScore]) -> bytes:
+    """Encode the state values of the players as int8.
+
+    The states are compared by identity, since hashing or reading the value
+    of an enum member is slow in a loop over a large roster.
+
+    Args:
+        players (list[PlayerScore]): The players.
+
+    Returns:
+        bytes: The state values, one byte per player.
+
+    """
+    win = PlayerState.WIN
+    lose = PlayerState.LOSE
+    return bytes(
+        [
+            _WIN_BYTE
+            if player.state is win
+            else _LOSE_BYTE
+            if player.state is lose
+            else _NORMAL_BYTE
+            for player in players
+        ]
+    )
+
+
+def encode_scoreboard(scoreboard: ScoreboardState) -> bytes:
+    """Encode a scoreboard as a snapshot.
+
+    Args:
+        scoreboard (ScoreboardState): The scoreboard to encode.
+
+    Returns:
+        bytes: The encoded snapshot.
+
+    """
+    players = list(scoreboard.players)
+    names = [player.name.encode() for player in players]
+    name_offsets = list(accumulate(map(len, names), initial=0))
+    layout = SnapshotLayout(scoreboard.question_count, len(players), name_offsets[-1])
+    parts = [
+        SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC,
+            SNAPSHOT_VERSION,
+            0,
+            layout.question_count,
+            layout.player_count,
+            layout.names_size,
+        ),
+        _pack("q", [player.player_id for player in players]),
+        _pack("q", [player.answers for player in players]),
+        _pack("q", [player.misses for player in players]),
+        _pack("q", [player.score for player in players]),
+        _pack("q", [player.breaks for player in players]),
+        _encode_states(players),
+        bytes(layout.name_offsets - layout.states - layout.player_count),
+        _pack("I", name_offsets),
+        *names,
+    ]
+    return b"".join(parts)
+
+
+def decode_scoreboard(data: Buffer, offset: int = 0) -> ScoreboardState:
+    """Decode a snapshot as a scoreboard.
+
+    Args:
+        data (Buffer): The buffer holding the snapshot, for example bytes or
+            a memory map.
+        offset (int): The offset of the snapshot in the buffer. Default is 0.
+
+    Raises:
+        ValueError: If the data is not a valid snapshot or has the same
+            player twice.
+
+    Returns:
+        ScoreboardState: The decoded scoreboard.
+
+    """
+    layout = SnapshotLayout.read(data, offset)
+    view = memoryview(data).cast("B")[offset : offset + layout.size]
+    count = layout.player_count
+    player_ids, answers, misses, scores, breaks = (
+        _unpack(view[start : start + 8 * count], "q")
+        for start in layout.columns.values()
+    )
+    state_values = view[layout.states : layout.states + count].cast("b")
+    if not _STATES.keys() >= set(state_values):
+        raise ValueError("Snapshot has an invalid player state.")
+    states = map(_STATES.__getitem__, state_values)
+    names = decode_names(view, layout)
+    players = build_players(player_ids, names, answers, misses, scores, breaks, states)
+    return ScoreboardState(
+        players,
+        layout.question_count,
+        PlayerIndex.from_identities(player_ids, names),
+    )
+
+
+def decode_names(view: memoryview, layout: SnapshotLayout) -> list[str]:
+    """Decode the player names of a snapshot.
+
+    Args:
+        view (memoryview): The bytes of the snapshot.
+        layout (SnapshotLayout): The layout of the snapshot.
+
+    Returns:
+        list[str]: The player names, in order.
+
+    """
+    name_offsets = _unpack(view[layout.name_offsets : layout.names], "I")
+    blob = bytes(view[layout.names : layout.size])
+    if blob.isascii():
+        # ASCII has one character per byte, so the offsets index the text.
+        text = blob.decode("ascii")
+        return [text[start:end] for start, end in pairwise(name_offsets)]
+    return [blob[start:end].decode() for start, end in pairwise(name_offsets)]
@@ -0,0 +1,456 @@
+import dataclasses
+import itertools
+import json
+import os
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.events import ManagerEvent
+from reflex_scoreboard.manager.patches import field_patches, player_row
+
+if TYPE_CHECKING:
+    from reflex_scoreboard.manager.score_manager import ScoreManager
+
+FULL_EVENT = "full"
+PATCH_EVENT = "patch"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Frame:
+    """The dataclass to store one encoded update for the display clients.
+
+    Attributes:
+        sequence (int): Number of the state the frame leads to. The initial
+            state is 0 and each published state adds 1.
+        full (bool): Whether the frame holds the whole state rather than the
+            changes from the state before it.
+        data (bytes): The frame as a Server-Sent Events message, sent as is
+            to every client.
+
+    """
+
+    sequence: int
+    full: bool
+    data: bytes
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StateDocument:
+    """The dataclass to store the JSON rendering of one state for polling.
+
+    Attributes:
+        sequence (int): Number of the rendered state.
+        etag (str): Entity tag of the rendering, quoted for the ETag header.
+        body (bytes): The state as JSON, the same as the data of a full frame.
+
+    """
+
+    sequence: int
+    etag: str
+    body: bytes
+
+
+def _encode_data(
+    sequence: int, previous: ScoreboardState | None, current: ScoreboardState
+) -> tuple[bool, bytes]:
+    """Encode a state as the JSON data of a frame.
+
+    Args:
+        sequence (int): The number of the state.
+        previous (ScoreboardState | None): The state the clients show, or
+            None to encode the whole state.
+        current (ScoreboardState): The state to encode.
+
+    Returns:
+        tuple[bool, bytes]: Whether the data holds the whole state, and the
+            data.
+
+    """
+    patches = None if previous is None else field_patches(previous, current)
+    body: dict[str, object] = {
+        "version": sequence,
+        "question_count": current.question_count,
+    }
+    if patches is None:
+        body["players"] = [player_row(player) for player in current.players]
+    else:
+        body["patches"] = patches
+    return patches is None, json.dumps(body, separators=(",", ":")).encode()
+
+
+def event_id(run_id: str, sequence: int) -> str:
+    """Get the event ID of a state.
+
+    Args:
+        run_id (str): The ID of the run, or an empty string for none.
+        sequence (int): The number of the state.
+
+    Returns:
+        str: ``<run_id>-<sequence>``, or the bare sequence without a run ID.
+
+    """
+    return f"{run_id}-{sequence}" if run_id else str(sequence)
+
+
+def _frame(sequence: int, data: bytes, *, full: bool, run_id: str) -> Frame:
+    """Wrap JSON data in a Server-Sent Events message.
+
+    Args:
+        sequence (int): The number of the state.
+        data (bytes): The JSON data.
+        full (bool): Whether the data holds the whole state.
+        run_id (str): The ID of the run, sent in the event ID.
+
+    Returns:
+        Frame: The frame.
+
+    """
+    event = FULL_EVENT if full else PATCH_EVENT
+    header = f"id: {event_id(run_id, sequence)}\nevent: {event}\ndata: ".encode()
+    return Frame(sequence, full, header + data + b"\n\n")
+
+
+def encode_frame(
+    sequence: int,
+    previous: ScoreboardState | None,
+    current: ScoreboardState,
+    run_id: str = "",
+) -> Frame:
+    """Encode a state as a Server-Sent Events message.
+
+    The message data is JSON with the version and question count, and
+    either the player rows (event ``full``) or the changed fields as
+    [index, field, value] lists (event ``patch``).
+
+    Args:
+        sequence (int): The number of the state, sent in the event ID and
+            as the version.
+        previous (ScoreboardState | None): The state the clients show, or
+            None to encode the whole state.
+        current (ScoreboardState): The state to encode.
+        run_id (str): The ID of the run, sent in the event ID. Default is
+            an empty string (bare sequence).
+
+    Returns:
+        Frame: The encoded frame.
+
+    """
+    full, data = _encode_data(sequence, previous, current)
+    return _frame(sequence, data, full=full, run_id=run_id)
+
+
+class Broadcaster:
+    """Class for encoding each state once and sharing it with every client.
+
+    Published states are encoded as one frame each and kept in a ring of
+    the last ``capacity`` frames. Clients read the ring through their own
+    Subscription, so publishing does not depend on the number of clients
+    and never waits for them. A client that falls behind by more than
+    ``capacity`` frames skips them and gets one full frame instead.
+
+    The whole current state is also rendered once per state, for new
+    clients and for polling with ``state_document``, whose entity tag lets
+    unchanged polls be answered without a body.
+
+    A Broadcaster can be registered as a ScoreManager listener. Created
+    with ``follow``, its sequence numbers are the versions of the manager.
+
+    Versions restart when the manager is recovered or the process restarts,
+    so event IDs and entity tags hold a random ID of the broadcaster as
+    well. An ID or tag from an earlier run never matches, and the client
+    gets the whole state.
+
+    Attributes:
+        capacity (int): Number of frames kept for the clients.
+        run_id (str): Random ID of the broadcaster, part of the event IDs
+            and entity tags.
+
+    """
+
+    def __init__(
+        self, scoreboard: ScoreboardState, capacity: int = 256, sequence: int = 0
+    ) -> None:
+        """Initialize the Broadcaster with the current state.
+
+        Args:
+            scoreboard (ScoreboardState): The state shown at first.
+            capacity (int): Number of frames kept for the clients.
+                Default is 256.
+            sequence (int): The number of the state shown at first.
+                Default is 0.
+
+        Raises:
+            ValueError: If capacity is not positive.
+
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+
+        self.capacity = capacity
+        self._scoreboard = scoreboard
+        self._sequence = sequence
+        self._frames: deque[Frame] = deque(maxlen=capacity)
+        self._full: tuple[Frame, StateDocument] | None = None
+        self.run_id = os.urandom(4).hex()
+        self._closed = False
+        self._changed = threading.Condition()
+
+    @staticmethod
+    def follow(manager: "ScoreManager", capacity: int = 256) -> "Broadcaster":
+        """Create a Broadcaster of a manager's state and keep it up to date.
+
+        Args:
+            manager (ScoreManager): The manager to follow.
+            capacity (int): Number of frames kept for the clients.
+                Default is 256.
+
+        Returns:
+            Broadcaster: The created broadcaster.
+
+        """
+        broadcaster = Broadcaster(manager.scoreboard, capacity, manager.version)
+        manager.add_listener(broadcaster)
+        return broadcaster
+
+    @property
+    def sequence(self) -> int:
+        """Get the number of the current state.
+
+        Returns:
+            int: The number of the last published state.
+
+        """
+        return self._sequence
+
+    @property
+    def scoreboard(self) -> ScoreboardState:
+        """Get the current state.
+
+        Returns:
+            ScoreboardState: The last published state.
+
+        """
+        return self._scoreboard
+
+    @property
+    def closed(self) -> bool:
+        """Check if the broadcaster is closed.
+
+        Returns:
+            bool: True if the subscriptions are ended.
+
+        """
+        return self._closed
+
+    def publish(self, scoreboard: ScoreboardState) -> Frame:
+        """Encode a new state and wake the waiting clients.
+
+        The state is encoded once, as the changes from the last published
+        state, or as a whole if the roster changed.
+
+        Args:
+            scoreboard (ScoreboardState): The new state.
+
+        Returns:
+            Frame: The encoded frame.
+
+        """
+        frame = encode_frame(
+            self._sequence + 1, self._scoreboard, scoreboard, self.run_id
+        )
+        with self._changed:
+            self._frames.append(frame)
+            self._scoreboard = scoreboard
+            self._sequence = frame.sequence
+            self._changed.notify_all()
+        return frame
+
+    def __call__(self, event: ManagerEvent) -> None:
+        """Publish the new state of a manager.
+
+        Args:
+            event (ManagerEvent): The state change.
+
+        """
+        self.publish(event.current)
+
+    def close(self) -> None:
+        """Wake the waiting clients and end their subscriptions.
+
+        States published afterwards are still encoded, but no client waits
+        for them.
+        """
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    def _render_full(self) -> tuple[Frame, StateDocument]:
+        """Render the current state as a whole, once per state.
+
+        Returns:
+            tuple[Frame, StateDocument]: The full frame and the document.
+
+        """
+        with self._changed:
+            rendered = self._full
+            sequence, scoreboard = self._sequence, self._scoreboard
+        if rendered is None or rendered[0].sequence != sequence:
+            # Encoded without the lock, so publishing never waits for it.
+            _, data = _encode_data(sequence, None, scoreboard)
+            etag = f'"{event_id(self.run_id, sequence)}"'
+            rendered = (
+                _frame(sequence, data, full=True, run_id=self.run_id),
+                StateDocument(sequence, etag, data),
+            )
+            with self._changed:
+                if self._full is None or self._full[0].sequence < sequence:
+                    self._full = rendered
+        return rendered
+
+    def full_frame(self) -> Frame:
+        """Get the current state as a full frame.
+
+        The frame is encoded once per state and shared by the clients that
+        join or skip frames at that state.
+
+        Returns:
+            Frame: The full frame of the current state.
+
+        """
+        return self._render_full()[0]
+
+    def state_document(self) -> StateDocument:
+        """Get the current state as a JSON document for polling.
+
+        The document is rendered once per state, and its entity tag changes
+        with the state, so a poll with an unchanged tag only compares it.
+
+        Returns:
+            StateDocument: The document of the current state.
+
+        """
+        return self._render_full()[1]
+
+    def frames_after(self, sequence: int | None) -> list[Frame]:
+        """Get the frames a client needs after the state it shows.
+
+        Args:
+            sequence (int | None): The number of the state the client shows,
+                or None for a new client.
+
+        Returns:
+            list[Frame]: The frames after the state, or one full frame if
+                the client is new or the frames were dropped from the ring.
+
+        """
+        with self._changed:
+            if sequence == self._sequence:
+                return []
+            missed = self._sequence - sequence if sequence is not None else -1
+            if 0 < missed <= len(self._frames):
+                return list(
+                    itertools.islice(self._frames, len(self._frames) - missed, None)
+                )
+        return [self.full_frame()]
+
+    def wait(self, sequence: int | None, timeout: float | None = None) -> bool:
+        """Wait until a state after the given one is published.
+
+        Args:
+            sequence (int | None): The number of the state the client shows,
+                or None for a new client.
+            timeout (float | None): Seconds to wait at most, or None to wait
+                without limit. Default is None.
+
+        Returns:
+            bool: True if there is a newer state, False on timeout or close.
+
+        """
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._closed or sequence != self._sequence, timeout
+            )
+            return sequence != self._sequence
+
+    def parse_event_id(self, last_event_id: str) -> int | None:
+        """Get the state a reconnecting client shows from its event ID.
+
+        Args:
+            last_event_id (str): The Last-Event-ID header of the client.
+
+        Returns:
+            int | None: The number of the state, or None if the ID is not
+                from this broadcaster, so the client is treated as new.
+
+        """
+        run_id, _, sequence = last_event_id.partition("-")
+        if run_id != self.run_id or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+    def subscribe(self, last_sequence: int | None = None) -> "Subscription":
+        """Create a subscription for one client.
+
+        Args:
+            last_sequence (int | None): The number of the state the client
+                already shows, for example from ``parse_event_id`` of a
+                reconnecting client. Default is None (new client).
+
+        Returns:
+            Subscription: The subscription.
+
+        """
+        return Subscription(self, last_sequence)
+
+
+class Subscription:
+    """Class for the position of one client in a Broadcaster.
+
+    Each client keeps only the number of the last frame it received, so the
+    frames waiting for a client are bounded by the ring of the broadcaster.
+
+    Attributes:
+        broadcaster (Broadcaster): The broadcaster to read.
+        sequence (int | None): Number of the state the client shows, or None
+            before the first frame.
+        resyncs (int): Number of full frames received in place of frames
+            dropped from the ring.
+
+    """
+
+    def __init__(self, broadcaster: Broadcaster, sequence: int | None = None) -> None:
+        """Initialize the Subscription.
+
+        Args:
+            broadcaster (Broadcaster): The broadcaster to read.
+            sequence (int | None): Number of the state the client shows.
+                Default is None (new client).
+
+        """
+        self.broadcaster = broadcaster
+        self.sequence = sequence
+        self.resyncs = 0
+
+    def poll(self, timeout: float | None = None) -> list[Frame]:
+        """Wait for and get the next frames of the client.
+
+        Args:
+            timeout (float | None): Seconds to wait at most, or None to wait
+                without limit. Default is None.
+
+        Returns:
+            list[Frame]: The frames in order, or an empty list on timeout or
+                when the broadcaster is closed.
+
+        """
+        broadcaster = self.broadcaster
+        if not broadcaster.wait(self.sequence, timeout):
+            return []
+        frames = broadcaster.frames_after(self.sequence)
+        if frames:
+            if self.sequence is not None and frames[0].sequence != self.sequence + 1:
+                self.resyncs += 1
+            self.sequence = frames[-1].sequence
+        return frames
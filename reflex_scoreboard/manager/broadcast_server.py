@@ -0,0 +1,160 @@
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from reflex_scoreboard.manager.broadcast import Broadcaster
+
+EVENTS_PATH = "/events"
+STATE_PATH = "/state"
+# Longest wait of a long poll in seconds.
+MAX_POLL_TIMEOUT = 60.0
+# Comment line sent when no frame was published, so proxies keep the
+# connection open and closed clients are noticed.
+KEEPALIVE = b": keepalive\n\n"
+
+
+class DisplayHandler(BaseHTTPRequestHandler):
+    """Handler serving the state of a broadcaster to one client."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so without TCP_NODELAY each
+    # kept-alive response waits for the delayed ACK of the client.
+    disable_nagle_algorithm = True
+    server: "DisplayServer"
+
+    def do_GET(self) -> None:
+        """Serve the event stream or the state document."""
+        url = urlsplit(self.path)
+        if url.path == EVENTS_PATH:
+            self._stream_events()
+        elif url.path == STATE_PATH:
+            self._send_state(parse_qs(url.query))
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def _send_state(self, query: dict[str, list[str]]) -> None:
+        """Send the state document, or 304 if the client has it.
+
+        Args:
+            query (dict[str, list[str]]): The parsed query string.
+
+        """
+        try:
+            after = int(query["after"][0]) if "after" in query else None
+            timeout = float(query.get("timeout", ["30"])[0])
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST)
+            return
+        if after is not None:
+            self.server.broadcaster.wait(
+                after, min(max(timeout, 0.0), MAX_POLL_TIMEOUT)
+            )
+        document = self.server.broadcaster.state_document()
+        unchanged = document.sequence == after
+        if unchanged or self.headers.get("If-None-Match") == document.etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", document.etag)
+            self.end_headers()
+            return
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(document.body)))
+        self.send_header("ETag", document.etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(document.body)
+
+    def _stream_events(self) -> None:
+        """Stream the frames until the client or the broadcaster closes."""
+        broadcaster = self.server.broadcaster
+        subscription = broadcaster.subscribe(
+            broadcaster.parse_event_id(self.headers.get("Last-Event-ID", ""))
+        )
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.close_connection = True
+        try:
+            self.wfile.write(b"".join(frame.data for frame in subscription.poll(0)))
+            self.wfile.flush()
+            while not self.server.broadcaster.closed:
+                frames = subscription.poll(self.server.keepalive)
+                self.wfile.write(b"".join(frame.data for frame in frames) or KEEPALIVE)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def log_message(self, *_: object) -> None:
+        """Do not log the requests."""
+
+
+class DisplayServer(ThreadingHTTPServer):
+    """Class for the HTTP server of a broadcaster.
+
+    Attributes:
+        broadcaster (Broadcaster): The state to serve.
+        keepalive (float): Seconds without frames before a keepalive comment
+            is sent on an event stream.
+
+    """
+
+    def __init__(
+        self, address: tuple[str, int], broadcaster: Broadcaster, keepalive: float
+    ) -> None:
+        """Initialize the DisplayServer and bind it.
+
+        Args:
+            address (tuple[str, int]): The host and port to bind.
+            broadcaster (Broadcaster): The state to serve.
+            keepalive (float): Seconds without frames before a keepalive
+                comment is sent on an event stream.
+
+        """
+        super().__init__(address, DisplayHandler)
+        self.broadcaster = broadcaster
+        self.keepalive = keepalive
+
+
+def serve_broadcast(
+    broadcaster: Broadcaster,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    keepalive: float = 15.0,
+) -> DisplayServer:
+    """Serve the state of a broadcaster to displays over HTTP.
+
+    ``GET /events`` sends the current state as a full frame, then every
+    published frame, as Server-Sent Events. Browsers can read it with
+    ``EventSource``, which sends the Last-Event-ID header on reconnect, so
+    the client continues from the frames it missed. An event ID from
+    another run of the broadcaster gets a full frame. Each client is served
+    by its own thread and writes to its own socket, so a slow client only
+    delays itself.
+
+    ``GET /state`` returns the current state as JSON with an ETag. A request
+    whose If-None-Match header holds the current tag gets 304 Not Modified
+    without a body. With ``?after=<version>``, the request waits until the
+    version differs from the given one, up to ``timeout`` seconds (default
+    30), and gets 304 if it did not change. Connections are kept alive, so
+    a poller reuses one connection.
+
+    Call ``broadcaster.close`` and then ``shutdown`` on the returned server
+    to stop it.
+
+    Args:
+        broadcaster (Broadcaster): The frames to stream.
+        host (str): The address to bind. Default is the loopback address.
+        port (int): The port to bind. Default is 0 (any free port).
+        keepalive (float): Seconds without frames before a keepalive
+            comment is sent. Default is 15.
+
+    Returns:
+        DisplayServer: The running server. Its ``server_address``
+            holds the bound port.
+
+    """
+    server = DisplayServer((host, port), broadcaster, keepalive)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,314 @@
+import dataclasses
+import sys
+from collections import deque
+from typing import Any
+
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+PLAYER_FIELDS = tuple(field.name for field in dataclasses.fields(PlayerScore))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FieldChange:
+    """The dataclass to store a change of one player field.
+
+    Attributes:
+        name (str): Name of the PlayerScore field.
+        before (Any): Value before the change.
+        after (Any): Value after the change.
+
+    """
+
+    name: str
+    before: Any
+    after: Any
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PlayerDelta:
+    """The dataclass to store the changed fields of one player.
+
+    Attributes:
+        index (int): Index of the player in the scoreboard.
+        changes (tuple[FieldChange, ...]): Changed fields of the player.
+
+    """
+
+    index: int
+    changes: tuple[FieldChange, ...]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """The dataclass to store one recorded transition of the scoreboard.
+
+    Attributes:
+        question_count_before (int): Question count before the transition.
+        question_count_after (int): Question count after the transition.
+        deltas (tuple[PlayerDelta, ...]): Changed players.
+        before_checkpoint (ScoreboardState | None): Full state before the
+            transition, stored periodically or when the roster changed.
+            Default is None.
+        after_checkpoint (ScoreboardState | None): Full state after the
+            transition, stored when the roster changed. Default is None.
+
+    """
+
+    question_count_before: int
+    question_count_after: int
+    deltas: tuple[PlayerDelta, ...]
+    before_checkpoint: ScoreboardState | None = None
+    after_checkpoint: ScoreboardState | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class JournalMemoryReport:
+    """The dataclass to report the memory used by a DeltaJournal.
+
+    Attributes:
+        undo_entries (int): Number of entries available for undo.
+        redo_entries (int): Number of entries available for redo.
+        checkpoints (int): Number of full checkpoints held by the entries.
+        field_changes (int): Number of field changes held by the entries.
+        delta_bytes (int): Approximate bytes used by entries and deltas,
+            excluding the checkpointed states.
+
+    """
+
+    undo_entries: int
+    redo_entries: int
+    checkpoints: int
+    field_changes: int
+    delta_bytes: int
+
+
+def diff_players(
+    previous: ScoreboardState, current: ScoreboardState
+) -> tuple[PlayerDelta, ...]:
+    """Compute the changed player fields between two scoreboard states.
+
+    Both states must have the same number of players. Players shared between
+    the states are skipped without being compared.
+
+    Args:
+        previous (ScoreboardState): The state before the transition.
+        current (ScoreboardState): The state after the transition.
+
+    Returns:
+        tuple[PlayerDelta, ...]: The changed players, ordered by index.
+
+    """
+    deltas = []
+    for index in previous.changed_indices(current):
+        before = previous[index]
+        after = current[index]
+        changes = tuple(
+            FieldChange(name, getattr(before, name), getattr(after, name))
+            for name in PLAYER_FIELDS
+            if getattr(before, name) != getattr(after, name)
+        )
+        if changes:
+            deltas.append(PlayerDelta(index, changes))
+    return tuple(deltas)
+
+
+def apply_entry(
+    scoreboard: ScoreboardState, entry: JournalEntry, *, reverse: bool
+) -> ScoreboardState:
+    """Apply the deltas of an entry to a scoreboard.
+
+    Args:
+        scoreboard (ScoreboardState): The state to apply the deltas to.
+        entry (JournalEntry): The entry to apply.
+        reverse (bool): Whether to restore the values before the entry.
+
+    Returns:
+        ScoreboardState: The updated scoreboard state.
+
+    """
+    for delta in entry.deltas:
+        values = {
+            change.name: change.before if reverse else change.after
+            for change in delta.changes
+        }
+        scoreboard = scoreboard.replace_player(
+            delta.index, dataclasses.replace(scoreboard[delta.index], **values)
+        )
+    return scoreboard.set_question_count(
+        entry.question_count_before if reverse else entry.question_count_after
+    )
+
+
+class DeltaJournal:
+    """Class for undo/redo history stored as per-transition deltas.
+
+    Each transition records only the changed player fields and the question
+    counts, so undo and redo cost O(changed fields). Every
+    ``checkpoint_interval`` entries the full previous state is kept as well;
+    with the persistent scoreboard this is a reference, not a copy.
+
+    Attributes:
+        max_depth (int | None): Maximum number of undo entries to keep.
+            None means unbounded.
+        checkpoint_interval (int): Number of entries between checkpoints.
+        undo_entries (deque[JournalEntry]): Entries available for undo.
+        redo_entries (list[JournalEntry]): Entries available for redo.
+
+    """
+
+    def __init__(
+        self, max_depth: int | None = None, checkpoint_interval: int = 64
+    ) -> None:
+        """Initialize the DeltaJournal.
+
+        Args:
+            max_depth (int | None): Maximum number of undo entries to keep.
+                Default is None (unbounded).
+            checkpoint_interval (int): Number of entries between checkpoints.
+                Default is 64.
+
+        Raises:
+            ValueError: If max_depth or checkpoint_interval is not positive.
+
+        """
+        if max_depth is not None and max_depth <= 0:
+            raise ValueError("Max depth must be positive.")
+        if checkpoint_interval <= 0:
+            raise ValueError("Checkpoint interval must be positive.")
+
+        self.max_depth = max_depth
+        self.checkpoint_interval = checkpoint_interval
+        self.undo_entries: deque[JournalEntry] = deque(maxlen=max_depth)
+        self.redo_entries: list[JournalEntry] = []
+        self._recorded = 0
+
+    def record(self, previous: ScoreboardState, current: ScoreboardState) -> None:
+        """Record a transition of the scoreboard.
+
+        Recording a new transition clears the redo entries, since they were
+        computed against a state that is no longer current.
+
+        Args:
+            previous (ScoreboardState): The state before the transition.
+            current (ScoreboardState): The state after the transition.
+
+        """
+        if len(previous) != len(current):
+            entry = JournalEntry(
+                previous.question_count,
+                current.question_count,
+                (),
+                before_checkpoint=previous,
+                after_checkpoint=current,
+            )
+        else:
+            checkpoint = (
+                previous if self._recorded % self.checkpoint_interval == 0 else None
+            )
+            entry = JournalEntry(
+                previous.question_count,
+                current.question_count,
+                diff_players(previous, current),
+                before_checkpoint=checkpoint,
+            )
+        self._recorded += 1
+        self.undo_entries.append(entry)
+        self.redo_entries.clear()
+
+    def undo(self, current: ScoreboardState) -> ScoreboardState | None:
+        """Restore the state before the last recorded transition.
+
+        Args:
+            current (ScoreboardState): The current state.
+
+        Returns:
+            ScoreboardState | None: The restored state, or None if there is
+                nothing to undo.
+
+        """
+        if not self.undo_entries:
+            return None
+        entry = self.undo_entries.pop()
+        self.redo_entries.append(entry)
+        if entry.before_checkpoint is not None:
+            return entry.before_checkpoint
+        return apply_entry(current, entry, reverse=True)
+
+    def redo(self, current: ScoreboardState) -> ScoreboardState | None:
+        """Reapply the last undone transition.
+
+        Args:
+            current (ScoreboardState): The current state.
+
+        Returns:
+            ScoreboardState | None: The restored state, or None if there is
+                nothing to redo.
+
+        """
+        if not self.redo_entries:
+            return None
+        entry = self.redo_entries.pop()
+        self.undo_entries.append(entry)
+        if entry.after_checkpoint is not None:
+            return entry.after_checkpoint
+        return apply_entry(current, entry, reverse=False)
+
+    def timeline(self, current: ScoreboardState) -> tuple[list[ScoreboardState], int]:
+        """Reconstruct every state reachable by undo and redo.
+
+        The journal is not changed.
+
+        Args:
+            current (ScoreboardState): The current state.
+
+        Returns:
+            tuple[list[ScoreboardState], int]: The states from the oldest to
+                the newest, and the position of the current state.
+
+        """
+        older = []
+        state = current
+        for entry in reversed(self.undo_entries):
+            if entry.before_checkpoint is not None:
+                state = entry.before_checkpoint
+            else:
+                state = apply_entry(state, entry, reverse=True)
+            older.append(state)
+        newer = []
+        state = current
+        for entry in reversed(self.redo_entries):
+            if entry.after_checkpoint is not None:
+                state = entry.after_checkpoint
+            else:
+                state = apply_entry(state, entry, reverse=False)
+            newer.append(state)
+        return [*reversed(older), current, *newer], len(older)
+
+    def memory_report(self) -> JournalMemoryReport:
+        """Report the memory used by the journal.
+
+        Returns:
+            JournalMemoryReport: The memory report.
+
+        """
+        entries = [*self.undo_entries, *self.redo_entries]
+        checkpoints = sum(
+            (entry.before_checkpoint is not None) + (entry.after_checkpoint is not None)
+            for entry in entries
+        )
+        field_changes = 0
+        delta_bytes = 0
+        for entry in entries:
+            delta_bytes += sys.getsizeof(entry) + sys.getsizeof(entry.deltas)
+            for delta in entry.deltas:
+                field_changes += len(delta.changes)
+                delta_bytes += sys.getsizeof(delta) + sys.getsizeof(delta.changes)
+                delta_bytes += sum(sys.getsizeof(change) for change in delta.changes)
+        return JournalMemoryReport(
+            undo_entries=len(self.undo_entries),
+            redo_entries=len(self.redo_entries),
+            checkpoints=checkpoints,
+            field_changes=field_changes,
+            delta_bytes=delta_bytes,
+        )
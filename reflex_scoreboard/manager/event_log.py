@@ -0,0 +1,380 @@
+import os
+import struct
+import threading
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Self
+
+from reflex_scoreboard.data_structure.mutable_scoreboard import MutableScoreboard
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.snapshot import (
+    decode_scoreboard,
+    encode_scoreboard,
+)
+from reflex_scoreboard.manager.events import ManagerEvent
+from reflex_scoreboard.operation.operation_base import OperationBase
+
+# Record header: kind, payload type and index, question count, player count.
+RECORD_HEADER = struct.Struct("<BbiII")
+# Changed player: index, answers, misses, score, breaks and state value.
+PLAYER_RECORD = struct.Struct("<iiiiib")
+# Checkpoint header: log offset to replay from, followed by a snapshot.
+CHECKPOINT_HEADER = struct.Struct("<Q")
+NO_PAYLOAD_TYPE = -128
+NO_PAYLOAD_INDEX = -1
+
+
+def checkpoint_path(path: Path) -> Path:
+    """Get the path of the checkpoint file of an event log.
+
+    Args:
+        path (Path): The path of the event log.
+
+    Returns:
+        Path: The path of the checkpoint file.
+
+    """
+    return path.with_name(path.name + ".checkpoint")
+
+
+def encode_record(event: ManagerEvent) -> bytes:
+    """Encode a state change as a log record.
+
+    A payload without a value is recorded by itself and replayed through
+    the operation, so the hot path never compares the states. Other
+    changes hold the new values of every changed player, so replaying them
+    does not depend on the history.
+
+    Args:
+        event (ManagerEvent): The state change to encode.
+
+    Returns:
+        bytes: The encoded record.
+
+    """
+    payload = event.payload
+    current = event.current
+    if payload is not None and payload.value is None:
+        index = payload.extended_index
+        return RECORD_HEADER.pack(
+            event.kind.value,
+            payload.payload_type.value,
+            NO_PAYLOAD_INDEX if index is None else index,
+            current.question_count,
+            0,
+        )
+    indices = list(event.previous.changed_indices(current))
+    header = RECORD_HEADER.pack(
+        event.kind.value,
+        NO_PAYLOAD_TYPE,
+        NO_PAYLOAD_INDEX,
+        current.question_count,
+        len(indices),
+    )
+    pack = PLAYER_RECORD.pack
+    return header + b"".join(
+        [
+            pack(
+                index,
+                player.answers,
+                player.misses,
+                player.score,
+                player.breaks,
+                player.state.value,
+            )
+            for index, player in zip(
+                indices, map(current.__getitem__, indices), strict=True
+            )
+        ]
+    )
+
+
+def dump_checkpoint(path: Path, scoreboard: ScoreboardState, offset: int) -> None:
+    """Atomically write a checkpoint of the scoreboard.
+
+    The checkpoint is the log offset followed by a binary snapshot of the
+    scoreboard, so writing it costs about one copy of the player fields.
+
+    Args:
+        path (Path): The path of the event log.
+        scoreboard (ScoreboardState): The state to write.
+        offset (int): The log offset right after the state's last record.
+
+    """
+    target = checkpoint_path(path)
+    temporary = target.with_name(target.name + ".tmp")
+    with temporary.open("wb") as file:
+        file.write(CHECKPOINT_HEADER.pack(offset))
+        file.write(encode_scoreboard(scoreboard))
+        file.flush()
+        os.fsync(file.fileno())
+    temporary.replace(target)
+
+
+def load_checkpoint(path: Path) -> tuple[ScoreboardState, int]:
+    """Read the checkpoint of an event log.
+
+    Args:
+        path (Path): The path of the event log.
+
+    Raises:
+        ValueError: If the checkpoint is truncated or not a valid snapshot.
+
+    Returns:
+        tuple[ScoreboardState, int]: The checkpointed state and the log
+            offset to replay from.
+
+    """
+    data = checkpoint_path(path).read_bytes()
+    if len(data) < CHECKPOINT_HEADER.size:
+        raise ValueError("Checkpoint is truncated.")
+    (offset,) = CHECKPOINT_HEADER.unpack_from(data)
+    return decode_scoreboard(data, CHECKPOINT_HEADER.size), offset
+
+
+def iter_records(
+    data: bytes,
+) -> Iterator[tuple[tuple[int, ...], list[tuple[int, ...]]]]:
+    """Iterate over the complete records of a log.
+
+    A truncated record at the end, left by a crash in the middle of a write,
+    is ignored.
+
+    Args:
+        data (bytes): The log contents from the replay offset.
+
+    Yields:
+        tuple[tuple[int, ...], list[tuple[int, ...]]]: The header fields and
+            the changed player values of each record.
+
+    """
+    position = 0
+    while position + RECORD_HEADER.size <= len(data):
+        header = RECORD_HEADER.unpack_from(data, position)
+        end = position + RECORD_HEADER.size + header[-1] * PLAYER_RECORD.size
+        if end > len(data):
+            return
+        players = PLAYER_RECORD.iter_unpack(data[position + RECORD_HEADER.size : end])
+        yield header, list(players)
+        position = end
+
+
+def replay(path: Path, operation: OperationBase) -> ScoreboardState:
+    """Restore the latest state from the checkpoint and the log.
+
+    Args:
+        path (Path): The path of the event log.
+        operation (OperationBase): The operation the payloads were applied
+            with.
+
+    Returns:
+        ScoreboardState: The state after the last complete record.
+
+    """
+    scoreboard, offset = load_checkpoint(path)
+    with path.open("rb") as file:
+        file.seek(offset)
+        data = file.read()
+    scratch = MutableScoreboard(scoreboard)
+    for header, players in iter_records(data):
+        _, payload_type, payload_index, question_count, _ = header
+        if payload_type != NO_PAYLOAD_TYPE:
+            index = None if payload_index == NO_PAYLOAD_INDEX else payload_index
+            scratch = operation(scratch, Payload.of(PayloadType(payload_type), index))
+            continue
+        for index, answers, misses, score, breaks, state in players:
+            player = scratch[index]
+            scratch.replace_player(
+                index,
+                PlayerScore(
+                    player.player_id,
+                    player.name,
+                    answers,
+                    misses,
+                    score,
+                    breaks,
+                    PlayerState(state),
+                ),
+            )
+        scratch.set_question_count(question_count)
+    return scratch.freeze()
+
+
+class EventLog:
+    """Class for an append-only on-disk log of ScoreManager state changes.
+
+    Register an instance as a ScoreManager listener. The listener only queues
+    the event; a background thread encodes the queue, appends it to the log,
+    fsyncs every ``sync_interval`` seconds and writes a binary checkpoint of
+    the board every ``checkpoint_interval`` events, or every board size in
+    events for larger boards. Payload records hold only the payload, and
+    other records hold the changed players. Since states are immutable,
+    they can be encoded off the calling thread without copying. If the
+    thread fails, the error is raised by the next call and by ``close``.
+
+    Attributes:
+        path (Path): The path of the log file.
+        sync_interval (float): Seconds between two fsync calls.
+        checkpoint_interval (int): Minimum number of events between
+            checkpoints.
+
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        scoreboard: ScoreboardState,
+        sync_interval: float = 0.05,
+        checkpoint_interval: int = 4096,
+    ) -> None:
+        """Open the log and write a checkpoint of the initial state.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the log file. New
+                records are appended to an existing file.
+            scoreboard (ScoreboardState): The current state of the scoreboard.
+            sync_interval (float): Seconds between two fsync calls.
+                Default is 0.05.
+            checkpoint_interval (int): Minimum number of events between
+                checkpoints. Default is 4096.
+
+        Raises:
+            ValueError: If sync_interval or checkpoint_interval is not positive.
+
+        """
+        if sync_interval <= 0:
+            raise ValueError("Sync interval must be positive.")
+        if checkpoint_interval <= 0:
+            raise ValueError("Checkpoint interval must be positive.")
+
+        self.path = Path(path)
+        self.sync_interval = sync_interval
+        self.checkpoint_interval = checkpoint_interval
+        self._file = self.path.open("ab")
+        self._pending: deque[ManagerEvent | ScoreboardState] = deque()
+        self._checkpoint(scoreboard)
+        self._error: Exception | None = None
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._run, daemon=True)
+        self._writer.start()
+
+    def __call__(self, event: ManagerEvent) -> None:
+        """Queue a state change of the ScoreManager.
+
+        Args:
+            event (ManagerEvent): The state change.
+
+        Raises:
+            Exception: The error that stopped the background writer.
+
+        """
+        if self._error is not None:
+            raise self._error
+        self._since_checkpoint += 1
+        # Records hold only the numbers, so identity changes need a checkpoint.
+        if event.previous.player_index is not event.current.player_index:
+            self._checkpoint(event.current)
+            return
+        self._pending.append(event)
+        if self._since_checkpoint >= self._checkpoint_every:
+            self._checkpoint(event.current)
+
+    def _checkpoint(self, scoreboard: ScoreboardState) -> None:
+        """Queue a checkpoint of the scoreboard.
+
+        A checkpoint costs O(players) to write, so at least as many events
+        as players are logged between two checkpoints. This keeps its cost
+        per event constant, and replaying those records costs about as much
+        as reading the checkpoint.
+
+        Args:
+            scoreboard (ScoreboardState): The state to write.
+
+        """
+        self._pending.append(scoreboard)
+        self._since_checkpoint = 0
+        self._checkpoint_every = max(self.checkpoint_interval, len(scoreboard))
+
+    def _write(self, records: list[bytes]) -> None:
+        """Append encoded records to the log and sync it.
+
+        Args:
+            records (list[bytes]): The records, oldest first.
+
+        """
+        if records:
+            self._file.write(b"".join(records))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _drain(self) -> None:
+        """Write the queued records and checkpoints to disk.
+
+        The records between two checkpoints are written in one call. Items
+        that fail to be written go back to the queue, so ``close`` retries
+        them. Records hold absolute values, so writing one twice is harmless.
+        """
+        taken: list[ManagerEvent | ScoreboardState] = []
+        records: list[bytes] = []
+        try:
+            while self._pending:
+                item = self._pending.popleft()
+                taken.append(item)
+                if isinstance(item, ManagerEvent):
+                    records.append(encode_record(item))
+                    continue
+                self._write(records)
+                records = []
+                taken = [item]
+                dump_checkpoint(self.path, item, self._file.tell())
+                taken = []
+            if records:
+                self._write(records)
+        except Exception:
+            self._pending.extendleft(reversed(taken))
+            raise
+
+    def _run(self) -> None:
+        """Drain the queue periodically until the log is closed or fails."""
+        while not self._closed.wait(self.sync_interval):
+            try:
+                self._drain()
+            except Exception as error:  # noqa: BLE001
+                # Kept for the calling thread, which raises it.
+                self._error = error
+                return
+
+    def close(self) -> None:
+        """Write everything queued and close the log.
+
+        Raises:
+            Exception: The error that stopped the background writer, or
+                the error of the last write.
+
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._writer.join()
+        try:
+            self._drain()
+        finally:
+            self._file.close()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> Self:
+        """Use the log as a context manager.
+
+        Returns:
+            Self: This log.
+
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the log when leaving the context."""
+        self.close()
@@ -0,0 +1,41 @@
+import dataclasses
+from collections.abc import Callable
+from enum import Enum
+
+from reflex_scoreboard.data_structure.payload import Payload
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+
+class ManagerEventKind(Enum):
+    """Enum for the kinds of ScoreManager state changes."""
+
+    PAYLOAD = 1
+    BATCH = 2
+    UNDO = 3
+    REDO = 4
+    EDIT = 5
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ManagerEvent:
+    """The dataclass to describe a state change of a ScoreManager.
+
+    Attributes:
+        kind (ManagerEventKind): What changed the state.
+        previous (ScoreboardState): The state before the change.
+        current (ScoreboardState): The state after the change.
+        payload (Payload | None): The applied payload for PAYLOAD events.
+            Default is None.
+        version (int): The version of the manager after the change.
+            Default is 0.
+
+    """
+
+    kind: ManagerEventKind
+    previous: ScoreboardState
+    current: ScoreboardState
+    payload: Payload | None = None
+    version: int = 0
+
+
+type ManagerListener = Callable[[ManagerEvent], None]
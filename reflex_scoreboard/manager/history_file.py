@@ -0,0 +1,489 @@
+import mmap
+import os
+import struct
+from collections.abc import Buffer, Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO, Self
+
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.snapshot import (
+    SnapshotLayout,
+    decode_scoreboard,
+    encode_scoreboard,
+)
+
+# A history file holds the states of a ScoreManager history in order:
+#   header
+#   one entry per state: a keyframe holding a whole snapshot, or a delta
+#   holding the changed players of the previous state
+#   an end entry, so a stream can be read without the index
+#   the offset of each entry as uint64
+#   footer
+# All numbers are little-endian, and entries start at multiples of 8 bytes.
+HISTORY_MAGIC = b"RSBH"
+HISTORY_VERSION = 1
+# Header: magic, version, reserved.
+HISTORY_HEADER = struct.Struct("<4sHH")
+# Entry header: kind and body size.
+ENTRY_HEADER = struct.Struct("<B3xI")
+# Delta body: question count and number of changed players.
+DELTA_HEADER = struct.Struct("<II")
+# Changed player: index, answers, misses, score, breaks and state value.
+DELTA_PLAYER = struct.Struct("<Iqqqqb")
+# Footer: index offset, number of states, position of the current state.
+HISTORY_FOOTER = struct.Struct("<QII4s")
+FOOTER_MAGIC = b"RSBE"
+KEYFRAME = 0
+DELTA = 1
+END = 2
+
+_STATES = {state.value: state for state in PlayerState}
+
+
+def _padding(size: int) -> bytes:
+    """Get the padding that brings a size to a multiple of 8.
+
+    Args:
+        size (int): The size.
+
+    Returns:
+        bytes: The padding.
+
+    """
+    return bytes(-size % 8)
+
+
+def _encode_delta(previous: ScoreboardState, current: ScoreboardState) -> bytes:
+    """Encode the changed players of a transition.
+
+    Args:
+        previous (ScoreboardState): The state before the transition.
+        current (ScoreboardState): The state after the transition.
+
+    Returns:
+        bytes: The encoded delta.
+
+    """
+    indices = list(previous.changed_indices(current))
+    parts = [DELTA_HEADER.pack(current.question_count, len(indices))]
+    for index in indices:
+        player = current[index]
+        parts.append(
+            DELTA_PLAYER.pack(
+                index,
+                player.answers,
+                player.misses,
+                player.score,
+                player.breaks,
+                player.state.value,
+            )
+        )
+    return b"".join(parts)
+
+
+def _apply_delta(
+    scoreboard: ScoreboardState, data: Buffer, offset: int
+) -> ScoreboardState:
+    """Apply an encoded delta to the previous state.
+
+    Args:
+        scoreboard (ScoreboardState): The previous state.
+        data (Buffer): The buffer holding the delta.
+        offset (int): The offset of the delta in the buffer.
+
+    Raises:
+        ValueError: If a player state in the delta is not valid.
+
+    Returns:
+        ScoreboardState: The state after the delta.
+
+    """
+    question_count, count = DELTA_HEADER.unpack_from(data, offset)
+    start = offset + DELTA_HEADER.size
+    players = memoryview(data)[start : start + count * DELTA_PLAYER.size]
+    for index, answers, misses, score, breaks, state in DELTA_PLAYER.iter_unpack(
+        players
+    ):
+        if state not in _STATES:
+            raise ValueError("History entry is not valid.")
+        scoreboard = scoreboard.replace_player(
+            index,
+            scoreboard[index].with_results(
+                answers, misses, score, breaks, _STATES[state]
+            ),
+        )
+    return scoreboard.set_question_count(question_count)
+
+
+def _encode_entry(
+    previous: ScoreboardState | None, state: ScoreboardState, *, keyframe: bool
+) -> bytes:
+    """Encode one state as an entry, padded to a multiple of 8 bytes.
+
+    The state is written as a keyframe if asked, if there is no previous
+    state, or if the players differ from the previous state.
+
+    Args:
+        previous (ScoreboardState | None): The state before it, or None.
+        state (ScoreboardState): The state to encode.
+        keyframe (bool): Whether to write a whole snapshot.
+
+    Returns:
+        bytes: The encoded entry.
+
+    """
+    if keyframe or previous is None or previous.player_index is not state.player_index:
+        kind, body = KEYFRAME, encode_scoreboard(state)
+    else:
+        kind, body = DELTA, _encode_delta(previous, state)
+    return ENTRY_HEADER.pack(kind, len(body)) + body + _padding(len(body))
+
+
+def encode_segment(states: Sequence[ScoreboardState]) -> bytes:
+    """Encode states as a self-contained run of entries.
+
+    The first state is a keyframe and the others are deltas where the
+    players allow it, as in a history file. The run ends with an end entry.
+
+    Args:
+        states (Sequence[ScoreboardState]): The states, oldest first.
+
+    Returns:
+        bytes: The encoded segment.
+
+    """
+    parts = []
+    previous: ScoreboardState | None = None
+    for state in states:
+        parts.append(_encode_entry(previous, state, keyframe=previous is None))
+        previous = state
+    parts.append(ENTRY_HEADER.pack(END, 0))
+    return b"".join(parts)
+
+
+def decode_segment(data: Buffer) -> list[ScoreboardState]:
+    """Decode the states of a segment written by ``encode_segment``.
+
+    Consecutive states share their unchanged players.
+
+    Args:
+        data (Buffer): The buffer holding the segment.
+
+    Raises:
+        ValueError: If the data is not a valid segment.
+
+    Returns:
+        list[ScoreboardState]: The states, oldest first.
+
+    """
+    size = memoryview(data).nbytes
+    states: list[ScoreboardState] = []
+    offset = 0
+    while offset + ENTRY_HEADER.size <= size:
+        kind, length = ENTRY_HEADER.unpack_from(data, offset)
+        offset += ENTRY_HEADER.size
+        if kind == END:
+            return states
+        if offset + length > size:
+            break
+        if kind == KEYFRAME:
+            states.append(decode_scoreboard(data, offset))
+        elif kind == DELTA and states:
+            states.append(_apply_delta(states[-1], data, offset))
+        else:
+            raise ValueError("History entry is not valid.")
+        offset += length + len(_padding(length))
+    raise ValueError("History segment is truncated.")
+
+
+def write_history(
+    path: str | os.PathLike[str],
+    states: Sequence[ScoreboardState],
+    position: int,
+    keyframe_interval: int = 64,
+) -> None:
+    """Atomically write a history file.
+
+    A state is written as a keyframe every ``keyframe_interval`` states and
+    whenever the players differ from the previous state; otherwise only the
+    changed players are written.
+
+    Args:
+        path (str | os.PathLike[str]): The path of the history file.
+        states (Sequence[ScoreboardState]): The states, oldest first.
+        position (int): The position of the current state in states.
+        keyframe_interval (int): Number of states between keyframes.
+            Default is 64.
+
+    Raises:
+        ValueError: If there are no states, the position is out of range, or
+            keyframe_interval is not positive.
+
+    """
+    if not states:
+        raise ValueError("History must have at least one state.")
+    if not 0 <= position < len(states):
+        raise ValueError("Position is out of range.")
+    if keyframe_interval <= 0:
+        raise ValueError("Keyframe interval must be positive.")
+
+    target = Path(path)
+    temporary = target.with_name(target.name + ".tmp")
+    offsets: list[int] = []
+    with temporary.open("wb") as file:
+        file.write(HISTORY_HEADER.pack(HISTORY_MAGIC, HISTORY_VERSION, 0))
+        file.write(_padding(HISTORY_HEADER.size))
+        previous: ScoreboardState | None = None
+        for number, state in enumerate(states):
+            offsets.append(file.tell())
+            file.write(
+                _encode_entry(previous, state, keyframe=number % keyframe_interval == 0)
+            )
+            previous = state
+        file.write(ENTRY_HEADER.pack(END, 0))
+        index_offset = file.tell()
+        file.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        file.write(
+            HISTORY_FOOTER.pack(index_offset, len(states), position, FOOTER_MAGIC)
+        )
+        file.flush()
+        os.fsync(file.fileno())
+    temporary.replace(target)
+
+
+def _check_header(data: Buffer) -> None:
+    """Validate the header of a history file.
+
+    Args:
+        data (Buffer): The buffer starting with the header.
+
+    Raises:
+        ValueError: If the data is not a history file or has an unsupported
+            version.
+
+    """
+    if memoryview(data).nbytes < HISTORY_HEADER.size:
+        raise ValueError("History file is truncated.")
+    magic, version, _ = HISTORY_HEADER.unpack_from(data)
+    if magic != HISTORY_MAGIC:
+        raise ValueError("Data is not a history file.")
+    if version != HISTORY_VERSION:
+        raise ValueError("History file version is not supported.")
+
+
+def _read_exactly(file: BinaryIO, size: int) -> bytes:
+    """Read exactly the given number of bytes from a stream.
+
+    Args:
+        file (BinaryIO): The stream.
+        size (int): The number of bytes.
+
+    Raises:
+        ValueError: If the stream ends first.
+
+    Returns:
+        bytes: The bytes read.
+
+    """
+    data = file.read(size)
+    if len(data) < size:
+        raise ValueError("History file is truncated.")
+    return data
+
+
+def iter_history(file: BinaryIO) -> Iterator[ScoreboardState]:
+    """Read the states of a history file one by one from a stream.
+
+    Only the current entry is held in memory, so this works on pipes and on
+    histories larger than memory. Consecutive states share their unchanged
+    players.
+
+    Args:
+        file (BinaryIO): The stream, positioned at the start of the file.
+
+    Raises:
+        ValueError: If the stream is not a valid history file.
+
+    Yields:
+        ScoreboardState: The states, oldest first.
+
+    """
+    header_size = HISTORY_HEADER.size + len(_padding(HISTORY_HEADER.size))
+    _check_header(_read_exactly(file, header_size))
+    state: ScoreboardState | None = None
+    while True:
+        kind, size = ENTRY_HEADER.unpack(_read_exactly(file, ENTRY_HEADER.size))
+        if kind == END:
+            return
+        body = _read_exactly(file, size + len(_padding(size)))
+        if kind == KEYFRAME:
+            state = decode_scoreboard(body)
+        elif kind == DELTA and state is not None:
+            state = _apply_delta(state, body, 0)
+        else:
+            raise ValueError("History entry is not valid.")
+        yield state
+
+
+def _read_index(data: Buffer) -> tuple[tuple[int, ...], int]:
+    """Read the entry offsets and the position of a whole history file.
+
+    Args:
+        data (Buffer): The buffer holding the history file.
+
+    Raises:
+        ValueError: If the data is not a complete history file.
+
+    Returns:
+        tuple[tuple[int, ...], int]: The offset of each entry and the
+            position of the current state.
+
+    """
+    _check_header(data)
+    size = memoryview(data).nbytes
+    if size < HISTORY_FOOTER.size:
+        raise ValueError("History file is truncated.")
+    index_offset, count, position, magic = HISTORY_FOOTER.unpack_from(
+        data, size - HISTORY_FOOTER.size
+    )
+    if magic != FOOTER_MAGIC or index_offset + 8 * count > size:
+        raise ValueError("History file is truncated.")
+    return struct.unpack_from(f"<{count}Q", data, index_offset), position
+
+
+class HistoryReader:
+    """Class for random access to a memory-mapped history file.
+
+    Opening a history reads only the header, the footer and the entry
+    offsets. A state is decoded on access from the nearest keyframe before
+    it, and the last decoded state is kept so reading forward applies one
+    delta per state.
+
+    Attributes:
+        position (int): The position of the current state.
+
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open a history file.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the history file.
+
+        Raises:
+            ValueError: If the file is not a valid history file.
+
+        """
+        with Path(path).open("rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._offsets, position = _read_index(self._map)
+        except BaseException:
+            self._map.close()
+            raise
+        self.position = position
+        self._last: tuple[int, ScoreboardState] | None = None
+
+    def __len__(self) -> int:
+        """Get the number of states.
+
+        Returns:
+            int: The number of states.
+
+        """
+        return len(self._offsets)
+
+    def _kind(self, number: int) -> int:
+        """Get the kind of an entry.
+
+        Args:
+            number (int): The number of the entry.
+
+        Returns:
+            int: The kind of the entry.
+
+        """
+        kind, _ = ENTRY_HEADER.unpack_from(self._map, self._offsets[number])
+        return kind
+
+    def __getitem__(self, number: int) -> ScoreboardState:
+        """Get a state of the history.
+
+        Args:
+            number (int): The position of the state. Negative positions
+                count from the newest state.
+
+        Raises:
+            IndexError: If the position is out of range.
+
+        Returns:
+            ScoreboardState: The state.
+
+        """
+        if number < 0:
+            number += len(self)
+        if not 0 <= number < len(self):
+            raise IndexError("History index is out of range.")
+        # Start from the nearest keyframe at or before the state, or from the
+        # last decoded state if no keyframe lies between it and the state.
+        last = self._last
+        start = number
+        while (last is None or last[0] != start) and self._kind(start) != KEYFRAME:
+            start -= 1
+        if last is not None and last[0] == start:
+            state = last[1]
+        else:
+            state = decode_scoreboard(
+                self._map, self._offsets[start] + ENTRY_HEADER.size
+            )
+        for current in range(start + 1, number + 1):
+            state = _apply_delta(
+                state, self._map, self._offsets[current] + ENTRY_HEADER.size
+            )
+        self._last = (number, state)
+        return state
+
+    def __iter__(self) -> Iterator[ScoreboardState]:
+        """Iterate over the states, oldest first.
+
+        Yields:
+            ScoreboardState: The states.
+
+        """
+        for number in range(len(self)):
+            yield self[number]
+
+    def snapshot_layout(self, number: int) -> tuple[int, SnapshotLayout] | None:
+        """Get where the snapshot of a keyframe is in the memory map.
+
+        Args:
+            number (int): The position of the state.
+
+        Returns:
+            tuple[int, SnapshotLayout] | None: The offset and the layout of
+                the snapshot, or None if the state is stored as a delta.
+
+        """
+        if self._kind(number) != KEYFRAME:
+            return None
+        offset = self._offsets[number] + ENTRY_HEADER.size
+        return offset, SnapshotLayout.read(self._map, offset)
+
+    def close(self) -> None:
+        """Close the memory map."""
+        self._last = None
+        self._map.close()
+
+    def __enter__(self) -> Self:
+        """Enter the context.
+
+        Returns:
+            Self: The reader.
+
+        """
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the reader when leaving the context."""
+        self.close()
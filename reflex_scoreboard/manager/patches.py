@@ -0,0 +1,89 @@
+from collections.abc import Sequence
+
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.delta_journal import diff_players
+
+type ClientValue = int | str
+type FieldPatch = tuple[int, str, ClientValue]
+
+
+def client_value(value: object) -> ClientValue:
+    """Convert a PlayerScore field value to the value shown to clients.
+
+    Args:
+        value (object): The field value.
+
+    Returns:
+        ClientValue: The name of a PlayerState, otherwise the value itself.
+
+    """
+    if isinstance(value, PlayerState):
+        return value.name
+    if isinstance(value, int | str):
+        return value
+    return str(value)
+
+
+def player_row(player: PlayerScore) -> dict[str, ClientValue]:
+    """Convert a player to the row sent to clients on a full render.
+
+    Args:
+        player (PlayerScore): The player.
+
+    Returns:
+        dict[str, ClientValue]: The client values keyed by field name.
+
+    """
+    return {
+        "player_id": player.player_id,
+        "name": player.name,
+        "answers": player.answers,
+        "misses": player.misses,
+        "score": player.score,
+        "breaks": player.breaks,
+        "state": client_value(player.state),
+    }
+
+
+def field_patches(
+    previous: ScoreboardState, current: ScoreboardState
+) -> list[FieldPatch] | None:
+    """Compute the player fields to update on clients after a change.
+
+    Only the changed fields of the changed players are returned, so the
+    size of the patch does not depend on the size of the roster.
+
+    Args:
+        previous (ScoreboardState): The state shown on the clients.
+        current (ScoreboardState): The new state.
+
+    Returns:
+        list[FieldPatch] | None: The (player index, field name, new value)
+            of each changed field, or None if the roster changed and the
+            clients need a full render.
+
+    """
+    if len(previous) != len(current):
+        return None
+    return [
+        (delta.index, change.name, client_value(change.after))
+        for delta in diff_players(previous, current)
+        for change in delta.changes
+    ]
+
+
+def apply_patches(targets: Sequence[object], patches: list[FieldPatch]) -> None:
+    """Write field patches into the objects showing the players on a client.
+
+    Each patch sets one attribute, so a client state that tracks changes
+    per attribute sends only the patched fields.
+
+    Args:
+        targets (Sequence[object]): The object showing each player, with
+            the fields of ``player_row`` as attributes.
+        patches (list[FieldPatch]): The patches from ``field_patches``.
+
+    """
+    for index, field, value in patches:
+        setattr(targets[index], field, value)
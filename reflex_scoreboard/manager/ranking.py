@@ -0,0 +1,183 @@
+import bisect
+import itertools
+from collections.abc import Callable, Iterator
+
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.events import ManagerEvent
+
+type RankKey = tuple[int, ...]
+
+
+class RankingIndex:
+    """Class for a ranking of the players kept up to date incrementally.
+
+    Players are grouped in buckets by rank key, for example
+    OperationBase.rank_key. The distinct keys are kept sorted and each bucket
+    holds its player indices in order, so only the changed players move when
+    the scoreboard changes. Register an instance as a ScoreManager listener to
+    follow its state; the changed players are found with
+    ScoreboardState.changed_indices, which skips the unchanged parts of the
+    board.
+
+    Rank queries use the number of players before each key, which is
+    computed once after each update in time proportional to the number of
+    distinct keys. Quiz scoreboards have few distinct keys, so this is much
+    cheaper than sorting the players.
+
+    Attributes:
+        key (Callable[[PlayerScore], RankKey]): Function giving the rank key
+            of a player. Smaller keys rank higher.
+
+    """
+
+    def __init__(
+        self, scoreboard: ScoreboardState, key: Callable[[PlayerScore], RankKey]
+    ) -> None:
+        """Initialize the RankingIndex.
+
+        Args:
+            scoreboard (ScoreboardState): The scoreboard state to rank.
+            key (Callable[[PlayerScore], RankKey]): Function giving the rank
+                key of a player. Smaller keys rank higher.
+
+        """
+        self.key = key
+        self.rebuild(scoreboard)
+
+    def rebuild(self, scoreboard: ScoreboardState) -> None:
+        """Rank all players of a scoreboard from scratch.
+
+        Args:
+            scoreboard (ScoreboardState): The scoreboard state to rank.
+
+        """
+        self._player_keys = [self.key(player) for player in scoreboard.players]
+        self._buckets: dict[RankKey, list[int]] = {}
+        for index, key in enumerate(self._player_keys):
+            self._buckets.setdefault(key, []).append(index)
+        self._keys = sorted(self._buckets)
+        self._offsets: dict[RankKey, int] | None = None
+
+    def _move(self, index: int, key: RankKey) -> None:
+        """Move a player to the bucket of a new key.
+
+        Args:
+            index (int): The index of the player.
+            key (RankKey): The new rank key of the player.
+
+        """
+        old_key = self._player_keys[index]
+        if old_key == key:
+            return
+        bucket = self._buckets[old_key]
+        del bucket[bisect.bisect_left(bucket, index)]
+        if not bucket:
+            del self._buckets[old_key]
+            del self._keys[bisect.bisect_left(self._keys, old_key)]
+        bucket = self._buckets.get(key, [])
+        if not bucket:
+            self._buckets[key] = bucket
+            bisect.insort(self._keys, key)
+        bisect.insort(bucket, index)
+        self._player_keys[index] = key
+        self._offsets = None
+
+    def update(self, previous: ScoreboardState, current: ScoreboardState) -> None:
+        """Follow a change of the scoreboard.
+
+        Args:
+            previous (ScoreboardState): The state the index currently ranks.
+            current (ScoreboardState): The new state.
+
+        """
+        if len(previous) != len(current):
+            self.rebuild(current)
+            return
+        for index in previous.changed_indices(current):
+            self._move(index, self.key(current[index]))
+
+    def __call__(self, event: ManagerEvent) -> None:
+        """Follow a state change of a ScoreManager.
+
+        Args:
+            event (ManagerEvent): The state change.
+
+        """
+        self.update(event.previous, event.current)
+
+    def _key_offsets(self) -> dict[RankKey, int]:
+        """Get the number of players ranked before each key.
+
+        Returns:
+            dict[RankKey, int]: The number of players before each key.
+
+        """
+        if self._offsets is None:
+            sizes = (len(self._buckets[key]) for key in self._keys)
+            self._offsets = dict(
+                zip(self._keys, itertools.accumulate(sizes, initial=0), strict=False)
+            )
+        return self._offsets
+
+    def __len__(self) -> int:
+        """Get the number of ranked players.
+
+        Returns:
+            int: The number of ranked players.
+
+        """
+        return len(self._player_keys)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the player indices from the first to the last rank.
+
+        Players with the same key are ordered by index.
+
+        Yields:
+            int: The player indices.
+
+        """
+        for key in self._keys:
+            yield from self._buckets[key]
+
+    def rank_of(self, index: int) -> int:
+        """Get the rank of a player.
+
+        Players with the same key share a rank, and the next rank skips the
+        tied players, as in 1, 2, 2, 4.
+
+        Args:
+            index (int): The index of the player.
+
+        Returns:
+            int: The rank of the player, starting from 1.
+
+        """
+        return self._key_offsets()[self._player_keys[index]] + 1
+
+    def position_of(self, index: int) -> int:
+        """Get the position of a player in the ranking order.
+
+        Args:
+            index (int): The index of the player.
+
+        Returns:
+            int: The position of the player, starting from 0.
+
+        """
+        key = self._player_keys[index]
+        bucket = self._buckets[key]
+        return self._key_offsets()[key] + bisect.bisect_left(bucket, index)
+
+    def top_k(self, k: int) -> list[int]:
+        """Get the player indices of the first k positions.
+
+        Args:
+            k (int): The number of players.
+
+        Returns:
+            list[int]: The player indices from the first position.
+
+        """
+        return list(itertools.islice(self, k))
@@ -0,0 +1,335 @@
+import asyncio
+import dataclasses
+import time
+from collections.abc import Callable
+
+from reflex_scoreboard.data_structure.payload import Payload
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.metrics.histogram import HistogramSnapshot, LatencyHistogram
+
+type MatchLoader = Callable[[str], ScoreManager]
+type MatchSaver = Callable[[str, ScoreManager], None]
+
+
+@dataclasses.dataclass
+class _MatchSlot:
+    """The dataclass to store the runtime state of one match.
+
+    Attributes:
+        lock (asyncio.Lock): Lock serializing the operations of the match.
+        histogram (LatencyHistogram): Latency of the operations of the match.
+        manager (ScoreManager | None): The loaded manager, or None if evicted.
+        waiting (int): Number of operations waiting for or holding the lock.
+        last_used (float): Clock time of the last operation.
+
+    """
+
+    lock: asyncio.Lock = dataclasses.field(default_factory=asyncio.Lock)
+    histogram: LatencyHistogram = dataclasses.field(default_factory=LatencyHistogram)
+    manager: ScoreManager | None = None
+    waiting: int = 0
+    last_used: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class MatchMetrics:
+    """The dataclass to report the metrics of one match.
+
+    Attributes:
+        loaded (bool): Whether the manager is in memory.
+        queue_depth (int): Number of operations waiting for or holding the lock.
+        latency (HistogramSnapshot): Latency of the operations, including
+            the time spent waiting for the lock.
+
+    """
+
+    loaded: bool
+    queue_depth: int
+    latency: HistogramSnapshot
+
+
+@dataclasses.dataclass(frozen=True)
+class RegistryMetrics:
+    """The dataclass to report the metrics of a MatchRegistry.
+
+    Attributes:
+        active_matches (int): Number of matches with a manager in memory.
+        known_matches (int): Number of matches seen by the registry.
+        queue_depth (int): Total number of queued operations.
+        matches (dict[str, MatchMetrics]): Metrics of each match.
+
+    """
+
+    active_matches: int
+    known_matches: int
+    queue_depth: int
+    matches: dict[str, MatchMetrics]
+
+
+class MatchRegistry:
+    """Class for hosting many ScoreManagers in one asyncio process.
+
+    Each match has its own asyncio lock, so operations on different matches
+    never wait for each other. Matches that are not in memory are loaded
+    with ``loader`` in a worker thread on first use, and matches idle for
+    ``idle_timeout`` seconds can be evicted after being passed to ``saver``.
+
+    Attributes:
+        loader (MatchLoader | None): Callback creating the manager of a match
+            that is not in memory, for example ScoreManager.recover.
+        saver (MatchSaver | None): Callback called with a manager before it
+            is evicted.
+        idle_timeout (float): Seconds without operations before eviction.
+
+    """
+
+    def __init__(
+        self,
+        loader: MatchLoader | None = None,
+        saver: MatchSaver | None = None,
+        idle_timeout: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the MatchRegistry.
+
+        Args:
+            loader (MatchLoader | None): Callback creating the manager of a
+                match that is not in memory. Default is None (no lazy loading).
+            saver (MatchSaver | None): Callback called with a manager before
+                it is evicted. Default is None.
+            idle_timeout (float): Seconds without operations before a match
+                can be evicted. Default is 600.
+            clock (Callable[[], float]): Clock used for idle times.
+                Default is time.monotonic.
+
+        Raises:
+            ValueError: If idle_timeout is not positive.
+
+        """
+        if idle_timeout <= 0:
+            raise ValueError("Idle timeout must be positive.")
+
+        self.loader = loader
+        self.saver = saver
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._slots: dict[str, _MatchSlot] = {}
+
+    def __contains__(self, match_id: str) -> bool:
+        """Check if a match is known to the registry.
+
+        Args:
+            match_id (str): The match ID.
+
+        Returns:
+            bool: True if the match was registered or loaded.
+
+        """
+        return match_id in self._slots
+
+    def register(self, match_id: str, manager: ScoreManager) -> None:
+        """Add a match with its manager.
+
+        Args:
+            match_id (str): The match ID.
+            manager (ScoreManager): The manager of the match.
+
+        Raises:
+            ValueError: If the match is already registered.
+
+        """
+        if match_id in self._slots:
+            raise ValueError("Match is already registered.")
+        self._slots[match_id] = _MatchSlot(manager=manager, last_used=self._clock())
+
+    async def _load(self, match_id: str, slot: _MatchSlot) -> ScoreManager:
+        """Get the manager of a match, loading it if needed.
+
+        Must be called while holding the lock of the match.
+
+        Args:
+            match_id (str): The match ID.
+            slot (_MatchSlot): The slot of the match.
+
+        Raises:
+            KeyError: If the match is not in memory and there is no loader.
+
+        Returns:
+            ScoreManager: The manager of the match.
+
+        """
+        if slot.manager is None:
+            if self.loader is None:
+                raise KeyError("Match not found.")
+            slot.manager = await asyncio.to_thread(self.loader, match_id)
+        return slot.manager
+
+    async def _run(
+        self, match_id: str, action: Callable[[ScoreManager], None]
+    ) -> ScoreboardState:
+        """Run an action on the manager of a match under its lock.
+
+        Args:
+            match_id (str): The match ID.
+            action (Callable[[ScoreManager], None]): The action to run.
+
+        Returns:
+            ScoreboardState: The state of the match after the action.
+
+        """
+        slot = self._slots.get(match_id)
+        if slot is None:
+            if self.loader is None:
+                raise KeyError("Match not found.")
+            slot = self._slots.setdefault(match_id, _MatchSlot())
+        start = time.perf_counter_ns()
+        slot.waiting += 1
+        try:
+            async with slot.lock:
+                manager = await self._load(match_id, slot)
+                action(manager)
+                scoreboard = manager.scoreboard
+        finally:
+            slot.waiting -= 1
+            slot.last_used = self._clock()
+            if (
+                slot.manager is None
+                and not slot.waiting
+                and self._slots.get(match_id) is slot
+            ):
+                # Loading failed, so the slot is dropped and unknown or
+                # corrupt IDs do not pile up.
+                del self._slots[match_id]
+        slot.histogram.record(time.perf_counter_ns() - start)
+        return scoreboard
+
+    async def get(self, match_id: str) -> ScoreboardState:
+        """Get the current state of a match.
+
+        Args:
+            match_id (str): The match ID.
+
+        Returns:
+            ScoreboardState: The current state of the match.
+
+        """
+        return await self._run(match_id, lambda _: None)
+
+    async def submit(self, match_id: str, payload: Payload) -> ScoreboardState:
+        """Apply a payload to a match.
+
+        Args:
+            match_id (str): The match ID.
+            payload (Payload): The payload to apply.
+
+        Returns:
+            ScoreboardState: The state of the match after the payload.
+
+        """
+        return await self._run(match_id, lambda manager: manager(payload))
+
+    async def undo(self, match_id: str) -> ScoreboardState:
+        """Undo the last operation of a match.
+
+        Args:
+            match_id (str): The match ID.
+
+        Returns:
+            ScoreboardState: The state of the match after the undo.
+
+        """
+        return await self._run(match_id, ScoreManager.undo)
+
+    async def redo(self, match_id: str) -> ScoreboardState:
+        """Redo the last undone operation of a match.
+
+        Args:
+            match_id (str): The match ID.
+
+        Returns:
+            ScoreboardState: The state of the match after the redo.
+
+        """
+        return await self._run(match_id, ScoreManager.redo)
+
+    def _idle(self, slot: _MatchSlot) -> bool:
+        """Check if a match can be evicted.
+
+        Args:
+            slot (_MatchSlot): The slot of the match.
+
+        Returns:
+            bool: True if the manager is in memory, no operation is queued
+                and the match is idle for longer than the idle timeout.
+
+        """
+        return (
+            slot.manager is not None
+            and not slot.waiting
+            and self._clock() - slot.last_used >= self.idle_timeout
+        )
+
+    async def evict_idle(self) -> list[str]:
+        """Evict the matches idle for longer than the idle timeout.
+
+        Matches with queued operations are kept. Each match is saved under
+        its lock in a worker thread, so a slow save neither races with its
+        operations nor stalls the other matches. Without a loader, an
+        evicted match is removed from the registry.
+
+        Returns:
+            list[str]: The IDs of the evicted matches.
+
+        """
+        evicted = []
+        for match_id, slot in list(self._slots.items()):
+            if not self._idle(slot):
+                continue
+            async with slot.lock:
+                manager = slot.manager
+                if manager is None or not self._idle(slot):
+                    continue
+                if self.saver is not None:
+                    await asyncio.to_thread(self.saver, match_id, manager)
+                # An operation queued during the save keeps the manager.
+                if slot.waiting:
+                    continue
+                slot.manager = None
+            if self.loader is None:
+                del self._slots[match_id]
+            evicted.append(match_id)
+        return evicted
+
+    async def run_evictor(self, interval: float) -> None:
+        """Evict idle matches periodically until cancelled.
+
+        Args:
+            interval (float): Seconds between two evictions.
+
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.evict_idle()
+
+    def metrics(self) -> RegistryMetrics:
+        """Report the metrics of the registry.
+
+        Returns:
+            RegistryMetrics: The metrics.
+
+        """
+        matches = {
+            match_id: MatchMetrics(
+                loaded=slot.manager is not None,
+                queue_depth=slot.waiting,
+                latency=slot.histogram.snapshot(),
+            )
+            for match_id, slot in self._slots.items()
+        }
+        return RegistryMetrics(
+            active_matches=sum(metrics.loaded for metrics in matches.values()),
+            known_matches=len(matches),
+            queue_depth=sum(metrics.queue_depth for metrics in matches.values()),
+            matches=matches,
+        )
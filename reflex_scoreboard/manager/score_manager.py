@@ -1,31 +1,147 @@
+import contextlib
+import itertools
+import os
+import time
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from reflex_scoreboard.data_structure.mutable_scoreboard import MutableScoreboard
 from reflex_scoreboard.data_structure.payload import Payload
 from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.events import (
+    ManagerEvent,
+    ManagerEventKind,
+    ManagerListener,
+)
 from reflex_scoreboard.operation.operation_base import OperationBase
 
+# The history, log and metrics modules are only needed by the features that
+# use them, so they are imported there and the CLI starts without them.
+if TYPE_CHECKING:
+    from reflex_scoreboard.manager.delta_journal import DeltaJournal
+    from reflex_scoreboard.manager.spill import HistoryPolicy, SpillStack
+    from reflex_scoreboard.metrics.instrumentation import Instrumentation
+
 
 class ScoreManager:
     """Class for common manager of scoreboard operations.
 
+    By default the history keeps a whole ScoreboardState per payload in
+    undo_stack and redo_stack. When a DeltaJournal is given, the history is
+    recorded in the journal instead and both stacks stay empty. When a
+    HistoryPolicy is given, the stacks keep only their newest states in
+    memory and spill the older ones to disk.
+
+    Listeners are called with a ManagerEvent after every call, batch, edit,
+    undo and redo that changed the state, and each such change adds 1 to
+    ``version``.
+
     Attributes:
         scoreboard (ScoreboardState): The current state of the scoreboard.
         operation (OperationBase): The operation to perform on the scoreboard.
-        undo_stack (list[ScoreboardState]): Stack for undo operations.
-        redo_stack (list[ScoreboardState]): Stack for redo operations.
+        journal (DeltaJournal | None): Delta history used instead of the stacks.
+        undo_stack (list[ScoreboardState] | SpillStack): Stack for undo
+            operations.
+        redo_stack (list[ScoreboardState] | SpillStack): Stack for redo
+            operations.
+        listeners (list[ManagerListener]): Callbacks notified of state changes.
+        instrumentation (Instrumentation | None): Statistics the operations
+            are timed into, or None when not instrumented.
+        version (int): Number of state changes since the manager was
+            created. Clients can compare it to tell if they are up to date.
 
     """
 
-    def __init__(self, scoreboard: ScoreboardState, operation: OperationBase) -> None:
+    def __init__(
+        self,
+        scoreboard: ScoreboardState,
+        operation: OperationBase,
+        journal: "DeltaJournal | None" = None,
+        history_policy: "HistoryPolicy | None" = None,
+    ) -> None:
         """Initialize the ScoreManager with a scoreboard state.
 
         Args:
             scoreboard (ScoreboardState): The initial scoreboard state.
             operation (OperationBase): The operation to perform on the scoreboard.
+            journal (DeltaJournal | None): Delta history to record the
+                operations in. Default is None (whole-state stacks).
+            history_policy (HistoryPolicy | None): Limits of the states the
+                stacks keep in memory. Default is None (unbounded lists).
 
         """
         self.scoreboard = scoreboard
         self.operation = operation
-        self.undo_stack: list[ScoreboardState] = []
-        self.redo_stack: list[ScoreboardState] = []
+        self.journal = journal
+        self.undo_stack: list[ScoreboardState] | SpillStack
+        self.redo_stack: list[ScoreboardState] | SpillStack
+        if history_policy is not None:
+            from reflex_scoreboard.manager import spill  # noqa: PLC0415
+
+            self.undo_stack = spill.SpillStack(history_policy)
+            self.redo_stack = spill.SpillStack(history_policy)
+        else:
+            self.undo_stack = []
+            self.redo_stack = []
+        self.listeners: list[ManagerListener] = []
+        self.instrumentation: Instrumentation | None = None
+        self.version = 0
+
+    def instrument(self, instrumentation: "Instrumentation | None") -> None:
+        """Start or stop timing the operations.
+
+        The instrumentation is attached to the operation as well, so its
+        dispatch branches are timed and the payloads counted. An operation
+        shared between managers records into the last attached
+        instrumentation.
+
+        Args:
+            instrumentation (Instrumentation | None): The statistics to
+                record into, or None to stop timing.
+
+        """
+        self.instrumentation = instrumentation
+        self.operation.instrumentation = instrumentation
+
+    def add_listener(self, listener: ManagerListener) -> None:
+        """Register a callback notified after every state change.
+
+        Args:
+            listener (ManagerListener): The callback to register.
+
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: ManagerListener) -> None:
+        """Unregister a callback.
+
+        Args:
+            listener (ManagerListener): The callback to unregister.
+
+        """
+        self.listeners.remove(listener)
+
+    def _notify(
+        self,
+        kind: ManagerEventKind,
+        previous: ScoreboardState,
+        payload: Payload | None = None,
+    ) -> None:
+        """Count a state change and notify the listeners of it.
+
+        Args:
+            kind (ManagerEventKind): What changed the state.
+            previous (ScoreboardState): The state before the change.
+            payload (Payload | None): The applied payload. Default is None.
+
+        """
+        if previous is self.scoreboard:
+            return
+        self.version += 1
+        if self.listeners:
+            event = ManagerEvent(kind, previous, self.scoreboard, payload, self.version)
+            for listener in self.listeners:
+                listener(event)
 
     def stack_to_undo(self) -> None:
         """Add the current state to the undo stack."""
@@ -37,15 +153,53 @@ class ScoreManager:
 
     def undo(self) -> None:
         """Undo the last operation."""
-        if self.undo_stack:
+        instrumentation = self.instrumentation
+        start = time.perf_counter_ns() if instrumentation is not None else 0
+        previous = self.scoreboard
+        if self.journal is not None:
+            restored = self.journal.undo(self.scoreboard)
+            if restored is not None:
+                self.scoreboard = restored
+        elif self.undo_stack:
             self.stack_to_redo()
             self.scoreboard = self.undo_stack.pop()
+        self._notify(ManagerEventKind.UNDO, previous)
+        if instrumentation is not None:
+            instrumentation.record("manager.undo", time.perf_counter_ns() - start)
 
     def redo(self) -> None:
         """Redo the last undone operation."""
-        if self.redo_stack:
+        instrumentation = self.instrumentation
+        start = time.perf_counter_ns() if instrumentation is not None else 0
+        previous = self.scoreboard
+        if self.journal is not None:
+            restored = self.journal.redo(self.scoreboard)
+            if restored is not None:
+                self.scoreboard = restored
+        elif self.redo_stack:
             self.stack_to_undo()
             self.scoreboard = self.redo_stack.pop()
+        self._notify(ManagerEventKind.REDO, previous)
+        if instrumentation is not None:
+            instrumentation.record("manager.redo", time.perf_counter_ns() - start)
+
+    def _commit(self, scoreboard: ScoreboardState) -> None:
+        """Record the current state in the history and replace it.
+
+        The same state object is not recorded, so every history entry is a
+        change the listeners were notified of and undo never skips one.
+
+        Args:
+            scoreboard (ScoreboardState): The new state of the scoreboard.
+
+        """
+        if scoreboard is self.scoreboard:
+            return
+        if self.journal is not None:
+            self.journal.record(self.scoreboard, scoreboard)
+        else:
+            self.stack_to_undo()
+        self.scoreboard = scoreboard
 
     def __call__(self, payload: Payload) -> None:
         """Perform the operation on the scoreboard.
@@ -54,5 +208,167 @@ class ScoreManager:
             payload (Payload): The payload containing the operation details.
 
         """
-        self.stack_to_undo()
-        self.scoreboard = self.operation(self.scoreboard, payload)
+        instrumentation = self.instrumentation
+        start = time.perf_counter_ns() if instrumentation is not None else 0
+        previous = self.scoreboard
+        self._commit(self.operation(previous, payload))
+        self._notify(ManagerEventKind.PAYLOAD, previous, payload)
+        if instrumentation is not None:
+            instrumentation.record("manager.call", time.perf_counter_ns() - start)
+
+    def extend(
+        self, payloads: Iterable[Payload], *, single_undo_entry: bool = True
+    ) -> None:
+        """Perform the operation for a sequence of payloads.
+
+        Args:
+            payloads (Iterable[Payload]): The payloads to apply, in order.
+            single_undo_entry (bool): Whether to apply the payloads in one
+                batch recorded as a single undo entry. Otherwise each payload
+                gets its own entry. Default is True.
+
+        """
+        if single_undo_entry:
+            instrumentation = self.instrumentation
+            start = time.perf_counter_ns() if instrumentation is not None else 0
+            previous = self.scoreboard
+            self._commit(self.operation.apply_batch(previous, payloads))
+            self._notify(ManagerEventKind.BATCH, previous)
+            if instrumentation is not None:
+                instrumentation.record("manager.batch", time.perf_counter_ns() - start)
+            return
+        for payload in payloads:
+            self(payload)
+
+    @contextlib.contextmanager
+    def edit(self) -> Iterator[MutableScoreboard]:
+        """Edit the scoreboard in place and record it as a single undo entry.
+
+        The draft is frozen into the new state when the block exits. If the
+        block raises, the draft is discarded and the state is unchanged. With
+        instrumentation, the freeze and commit are timed, not the block.
+
+        Yields:
+            MutableScoreboard: The draft of the current state.
+
+        """
+        previous = self.scoreboard
+        draft = previous.edit()
+        yield draft
+        instrumentation = self.instrumentation
+        start = time.perf_counter_ns() if instrumentation is not None else 0
+        scoreboard = draft.freeze()
+        if scoreboard is previous:
+            return
+        self._commit(scoreboard)
+        self._notify(ManagerEventKind.EDIT, previous)
+        if instrumentation is not None:
+            instrumentation.record("manager.edit", time.perf_counter_ns() - start)
+
+    @classmethod
+    def recover(
+        cls,
+        path: str | os.PathLike[str],
+        operation: OperationBase,
+        journal: "DeltaJournal | None" = None,
+        history_policy: "HistoryPolicy | None" = None,
+    ) -> "ScoreManager":
+        """Create a ScoreManager from the state stored in an EventLog.
+
+        The last checkpoint is loaded and the records written after it are
+        replayed. The recovered manager starts with an empty history.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the event log.
+            operation (OperationBase): The operation to perform on the scoreboard.
+            journal (DeltaJournal | None): Delta history to record the
+                operations in. Default is None (whole-state stacks).
+            history_policy (HistoryPolicy | None): Limits of the states the
+                stacks keep in memory. Default is None (unbounded lists).
+
+        Returns:
+            ScoreManager: The recovered manager.
+
+        """
+        from pathlib import Path  # noqa: PLC0415
+
+        from reflex_scoreboard.manager.event_log import replay  # noqa: PLC0415
+
+        return cls(replay(Path(path), operation), operation, journal, history_policy)
+
+    def history(self) -> tuple[list[ScoreboardState], int]:
+        """Get every state reachable by undo and redo.
+
+        Returns:
+            tuple[list[ScoreboardState], int]: The states from the oldest to
+                the newest, and the position of the current state.
+
+        """
+        if self.journal is not None:
+            return self.journal.timeline(self.scoreboard)
+        states = [*self.undo_stack, self.scoreboard, *reversed(self.redo_stack)]
+        return states, len(self.undo_stack)
+
+    def save_history(
+        self, path: str | os.PathLike[str], keyframe_interval: int = 64
+    ) -> None:
+        """Write the history and the current state to a history file.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the history file.
+            keyframe_interval (int): Number of states between keyframes.
+                Default is 64.
+
+        """
+        from reflex_scoreboard.manager.history_file import (  # noqa: PLC0415
+            write_history,
+        )
+
+        states, position = self.history()
+        write_history(path, states, position, keyframe_interval)
+
+    @classmethod
+    def load_history(
+        cls,
+        path: str | os.PathLike[str],
+        operation: OperationBase,
+        journal: "DeltaJournal | None" = None,
+        history_policy: "HistoryPolicy | None" = None,
+    ) -> "ScoreManager":
+        """Create a ScoreManager from a history file.
+
+        The undo and redo history is restored along with the current state.
+
+        Args:
+            path (str | os.PathLike[str]): The path of the history file.
+            operation (OperationBase): The operation to perform on the scoreboard.
+            journal (DeltaJournal | None): Delta history to record the
+                operations in. Default is None (whole-state stacks).
+            history_policy (HistoryPolicy | None): Limits of the states the
+                stacks keep in memory. Default is None (unbounded lists).
+
+        Returns:
+            ScoreManager: The restored manager.
+
+        """
+        from reflex_scoreboard.manager.history_file import (  # noqa: PLC0415
+            HistoryReader,
+        )
+
+        with HistoryReader(path) as reader:
+            states = list(reader)
+            position = reader.position
+        manager = cls(states[0], operation, journal, history_policy)
+        if journal is not None:
+            for previous, current in itertools.pairwise(states):
+                journal.record(previous, current)
+            manager.scoreboard = states[-1]
+            for _ in range(len(states) - 1 - position):
+                manager.scoreboard = (
+                    journal.undo(manager.scoreboard) or manager.scoreboard
+                )
+        else:
+            manager.undo_stack.extend(states[:position])
+            manager.scoreboard = states[position]
+            manager.redo_stack.extend(states[:position:-1])
+        return manager
@@ -0,0 +1,369 @@
+import dataclasses
+import os
+import sys
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+from reflex_scoreboard.data_structure.persistent_vector import PersistentVector
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.history_file import decode_segment, encode_segment
+
+# Approximate sizes used to estimate the memory held by one entry: a state
+# derived from the one before it owns the state and vector objects, the
+# replaced players, and one copied node per level of the vector.
+_STATE_BYTES = sys.getsizeof(ScoreboardState(PersistentVector())) + sys.getsizeof(
+    PersistentVector()
+)
+_PLAYER_BYTES = sys.getsizeof(PlayerScore(0, ""))
+_NODE_BYTES = sys.getsizeof((None,) * 32)
+
+
+def estimate_entry_bytes(
+    previous: ScoreboardState | None, state: ScoreboardState
+) -> int:
+    """Estimate the memory kept alive by one history entry.
+
+    States derived from each other share their unchanged players, so only
+    the replaced players and the copied path to them are counted. A state
+    with other players than the one before it is counted as a whole. The
+    estimate errs on the high side.
+
+    Args:
+        previous (ScoreboardState | None): The entry before it, or None.
+        state (ScoreboardState): The entry.
+
+    Returns:
+        int: The estimated number of bytes.
+
+    """
+    if previous is None or previous.player_index is not state.player_index:
+        return _STATE_BYTES + len(state) * (_PLAYER_BYTES + 8)
+    changed = sum(1 for _ in previous.changed_indices(state))
+    # Number of 32-way levels holding len(state) elements.
+    levels = max(1, ((len(state) - 1).bit_length() + 4) // 5)
+    return _STATE_BYTES + changed * (_PLAYER_BYTES + levels * _NODE_BYTES)
+
+
+@dataclasses.dataclass(frozen=True)
+class HistoryPolicy:
+    """The dataclass to configure how much undo history stays in memory.
+
+    The newest entries stay in memory up to both limits. Older entries are
+    written to a spill file in chunks and read back when undo reaches them.
+
+    Attributes:
+        max_entries (int | None): Maximum number of entries in memory, or
+            None for no limit on the count. Default is 256.
+        max_bytes (int | None): Maximum estimated bytes of the entries in
+            memory, or None for no limit on the size. Default is None.
+        chunk_size (int): Maximum number of entries spilled or read back at
+            once. A chunk also holds at most half of each limit, so reading
+            one back leaves room for new entries. Default is 64.
+        directory (str | os.PathLike[str] | None): Directory of the spill
+            files, or None for the temporary directory. Default is None.
+
+    """
+
+    max_entries: int | None = 256
+    max_bytes: int | None = None
+    chunk_size: int = 64
+    directory: str | os.PathLike[str] | None = None
+
+    def __post_init__(self) -> None:
+        """Validate the limits.
+
+        Raises:
+            ValueError: If a limit or chunk_size is not positive, or
+                chunk_size exceeds max_entries.
+
+        """
+        if self.max_entries is not None and self.max_entries <= 0:
+            raise ValueError("Max entries must be positive.")
+        if self.max_bytes is not None and self.max_bytes <= 0:
+            raise ValueError("Max bytes must be positive.")
+        if self.chunk_size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        if self.max_entries is not None and self.chunk_size > self.max_entries:
+            raise ValueError("Chunk size must not exceed max entries.")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Chunk:
+    """The dataclass to locate one spilled chunk in the spill file.
+
+    Attributes:
+        offset (int): Offset of the chunk in the file.
+        size (int): Size of the encoded chunk in bytes.
+        count (int): Number of entries in the chunk.
+
+    """
+
+    offset: int
+    size: int
+    count: int
+
+
+class SpillStack:
+    """Class for a stack of states that spills its oldest entries to disk.
+
+    Pushing and popping the newest entries only touch the in-memory window.
+    When the window exceeds the limits of the policy, its oldest entries
+    are encoded as a keyframe and deltas and appended to the spill file.
+    Popping past the window reads the last chunk back and truncates the
+    file, so the file holds exactly the entries that are not in memory.
+
+    The spill file is an anonymous temporary file, removed when the stack
+    is closed or collected.
+
+    Attributes:
+        policy (HistoryPolicy): The limits of the in-memory window.
+
+    """
+
+    def __init__(
+        self, policy: HistoryPolicy, states: Iterable[ScoreboardState] = ()
+    ) -> None:
+        """Initialize the SpillStack.
+
+        Args:
+            policy (HistoryPolicy): The limits of the in-memory window.
+            states (Iterable[ScoreboardState]): Initial entries, oldest
+                first. Default is empty.
+
+        """
+        self.policy = policy
+        self._window: deque[ScoreboardState] = deque()
+        self._sizes: deque[int] = deque()
+        self._window_bytes = 0
+        self._chunks: list[_Chunk] = []
+        self._spilled = 0
+        self._file = tempfile.TemporaryFile(dir=policy.directory)  # noqa: SIM115
+        self.extend(states)
+
+    def __len__(self) -> int:
+        """Get the number of entries, in memory and spilled.
+
+        Returns:
+            int: The number of entries.
+
+        """
+        return self._spilled + len(self._window)
+
+    @property
+    def spilled(self) -> int:
+        """Get the number of entries in the spill file.
+
+        Returns:
+            int: The number of spilled entries.
+
+        """
+        return self._spilled
+
+    @property
+    def memory_bytes(self) -> int:
+        """Get the estimated bytes of the entries in memory.
+
+        Returns:
+            int: The estimate from ``estimate_entry_bytes``, or 0 if the
+                policy does not limit the bytes.
+
+        """
+        return self._window_bytes
+
+    def _push(self, state: ScoreboardState) -> None:
+        """Add an entry to the window without enforcing the limits.
+
+        The size is only estimated when the policy limits the bytes.
+
+        Args:
+            state (ScoreboardState): The entry.
+
+        """
+        size = (
+            estimate_entry_bytes(self._window[-1] if self._window else None, state)
+            if self.policy.max_bytes is not None
+            else 0
+        )
+        self._window.append(state)
+        self._sizes.append(size)
+        self._window_bytes += size
+
+    def _over_limit(self) -> bool:
+        """Check if the window exceeds a limit of the policy.
+
+        Returns:
+            bool: True if entries must be spilled.
+
+        """
+        policy = self.policy
+        return (
+            policy.max_entries is not None and len(self._window) > policy.max_entries
+        ) or (policy.max_bytes is not None and self._window_bytes > policy.max_bytes)
+
+    def _chunk_count(self) -> int:
+        """Get the number of oldest entries to spill as one chunk.
+
+        A chunk holds at most half of each limit, counting its first entry
+        as a whole state since it is read back as a keyframe. Otherwise a
+        chunk read back by undo would fill the window, and the next push
+        would spill it again. The newest entry is never spilled.
+
+        Returns:
+            int: The number of entries, at least 1.
+
+        """
+        policy = self.policy
+        limit = min(policy.chunk_size, len(self._window) - 1)
+        if policy.max_entries is not None:
+            limit = min(limit, policy.max_entries // 2)
+        if policy.max_bytes is None:
+            return max(1, limit)
+        count = 0
+        chunk_bytes = estimate_entry_bytes(None, self._window[0])
+        while count < limit:
+            count += 1
+            if count == len(self._sizes):
+                break
+            chunk_bytes += self._sizes[count]
+            if chunk_bytes > policy.max_bytes // 2:
+                break
+        return max(1, count)
+
+    def _spill(self) -> None:
+        """Write the oldest chunk of the window to the spill file."""
+        count = self._chunk_count()
+        states = [self._window.popleft() for _ in range(count)]
+        for _ in range(count):
+            self._window_bytes -= self._sizes.popleft()
+        data = encode_segment(states)
+        offset = self._chunks[-1].offset + self._chunks[-1].size if self._chunks else 0
+        self._file.seek(offset)
+        self._file.write(data)
+        self._chunks.append(_Chunk(offset, len(data), count))
+        self._spilled += count
+
+    def _read_chunk(self, chunk: _Chunk) -> list[ScoreboardState]:
+        """Read the entries of a spilled chunk.
+
+        Args:
+            chunk (_Chunk): The chunk.
+
+        Returns:
+            list[ScoreboardState]: The entries, oldest first.
+
+        """
+        self._file.seek(chunk.offset)
+        return decode_segment(self._file.read(chunk.size))
+
+    def append(self, state: ScoreboardState) -> None:
+        """Push an entry, spilling the oldest ones if over a limit.
+
+        Args:
+            state (ScoreboardState): The entry.
+
+        """
+        self._push(state)
+        while self._over_limit() and len(self._window) > 1:
+            self._spill()
+
+    def extend(self, states: Iterable[ScoreboardState]) -> None:
+        """Push entries in order.
+
+        Args:
+            states (Iterable[ScoreboardState]): The entries, oldest first.
+
+        """
+        for state in states:
+            self.append(state)
+
+    def pop(self) -> ScoreboardState:
+        """Pop the newest entry, reading the last chunk back if needed.
+
+        Raises:
+            IndexError: If the stack is empty.
+
+        Returns:
+            ScoreboardState: The newest entry.
+
+        """
+        if not self._window:
+            if not self._chunks:
+                raise IndexError("Pop from an empty stack.")
+            chunk = self._chunks.pop()
+            states = self._read_chunk(chunk)
+            self._file.truncate(chunk.offset)
+            self._spilled -= chunk.count
+            for state in states:
+                self._push(state)
+        self._window_bytes -= self._sizes.pop()
+        return self._window.pop()
+
+    def clear(self) -> None:
+        """Remove every entry and empty the spill file."""
+        self._window.clear()
+        self._sizes.clear()
+        self._window_bytes = 0
+        self._chunks.clear()
+        self._spilled = 0
+        self._file.truncate(0)
+
+    def __getitem__(self, index: int) -> ScoreboardState:
+        """Get an entry without removing it.
+
+        A spilled entry is decoded from its chunk and not kept in memory.
+
+        Args:
+            index (int): The position of the entry, oldest first. Negative
+                positions count from the newest entry.
+
+        Raises:
+            IndexError: If the position is out of range.
+
+        Returns:
+            ScoreboardState: The entry.
+
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Stack index is out of range.")
+        if index >= self._spilled:
+            return self._window[index - self._spilled]
+        for chunk in self._chunks:
+            if index < chunk.count:
+                return self._read_chunk(chunk)[index]
+            index -= chunk.count
+        raise IndexError("Stack index is out of range.")
+
+    def __iter__(self) -> Iterator[ScoreboardState]:
+        """Iterate over the entries, oldest first.
+
+        Spilled entries are decoded one chunk at a time and not kept.
+
+        Yields:
+            ScoreboardState: The entries.
+
+        """
+        for chunk in list(self._chunks):
+            yield from self._read_chunk(chunk)
+        yield from list(self._window)
+
+    def __reversed__(self) -> Iterator[ScoreboardState]:
+        """Iterate over the entries, newest first.
+
+        Yields:
+            ScoreboardState: The entries.
+
+        """
+        yield from reversed(list(self._window))
+        for chunk in reversed(list(self._chunks)):
+            yield from reversed(self._read_chunk(chunk))
+
+    def close(self) -> None:
+        """Close and remove the spill file. The stack must not be used after."""
+        self._window.clear()
+        self._sizes.clear()
+        self._chunks.clear()
+        self._file.close()
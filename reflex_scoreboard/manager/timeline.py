@@ -0,0 +1,217 @@
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.delta_journal import (
+    JournalEntry,
+    apply_entry,
+    diff_players,
+)
+from reflex_scoreboard.manager.events import ManagerEvent, ManagerEventKind
+
+if TYPE_CHECKING:
+    from reflex_scoreboard.manager.score_manager import ScoreManager
+
+
+class Timeline:
+    """Class for random access to the states of a match by question number.
+
+    The timeline holds the states from the start of the match to the current
+    state. Every ``checkpoint_interval`` states the whole state is kept, and
+    each state in between is stored as the delta from the state before it,
+    so reading any state applies at most ``checkpoint_interval - 1`` deltas.
+
+    A Timeline can be registered as a ScoreManager listener: payloads and
+    batches append the new state, and undo drops the last state.
+
+    Attributes:
+        checkpoint_interval (int): Number of states between checkpoints.
+
+    """
+
+    def __init__(self, initial: ScoreboardState, checkpoint_interval: int = 64) -> None:
+        """Initialize the Timeline with the state at the start of the match.
+
+        Args:
+            initial (ScoreboardState): The first state.
+            checkpoint_interval (int): Number of states between checkpoints.
+                Default is 64.
+
+        Raises:
+            ValueError: If checkpoint_interval is not positive.
+
+        """
+        if checkpoint_interval <= 0:
+            raise ValueError("Checkpoint interval must be positive.")
+
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoints = [initial]
+        # Entry i leads from state i to state i + 1.
+        self._entries: list[JournalEntry] = []
+        # Highest question count up to each state, for bisecting.
+        self._reached = [initial.question_count]
+        self._last = initial
+
+    @staticmethod
+    def from_states(
+        states: Iterable[ScoreboardState], checkpoint_interval: int = 64
+    ) -> "Timeline":
+        """Create a Timeline from the states of a match.
+
+        Args:
+            states (Iterable[ScoreboardState]): The states, oldest first.
+            checkpoint_interval (int): Number of states between checkpoints.
+                Default is 64.
+
+        Raises:
+            ValueError: If there are no states.
+
+        Returns:
+            Timeline: The created timeline.
+
+        """
+        iterator = iter(states)
+        initial = next(iterator, None)
+        if initial is None:
+            raise ValueError("Timeline must have at least one state.")
+        timeline = Timeline(initial, checkpoint_interval)
+        for state in iterator:
+            timeline.append(state)
+        return timeline
+
+    @staticmethod
+    def follow(manager: "ScoreManager", checkpoint_interval: int = 64) -> "Timeline":
+        """Create a Timeline from a manager's history and keep it up to date.
+
+        The states up to the current state are added, and the timeline is
+        registered as a listener of the manager.
+
+        Args:
+            manager (ScoreManager): The manager to follow.
+            checkpoint_interval (int): Number of states between checkpoints.
+                Default is 64.
+
+        Returns:
+            Timeline: The created timeline.
+
+        """
+        states, position = manager.history()
+        timeline = Timeline.from_states(states[: position + 1], checkpoint_interval)
+        manager.add_listener(timeline)
+        return timeline
+
+    def __len__(self) -> int:
+        """Get the number of states.
+
+        Returns:
+            int: The number of states.
+
+        """
+        return len(self._reached)
+
+    def append(self, state: ScoreboardState) -> None:
+        """Add the next state of the match.
+
+        Args:
+            state (ScoreboardState): The state after the last state.
+
+        """
+        previous = self._last
+        if len(previous) != len(state):
+            entry = JournalEntry(
+                previous.question_count,
+                state.question_count,
+                (),
+                after_checkpoint=state,
+            )
+        else:
+            entry = JournalEntry(
+                previous.question_count,
+                state.question_count,
+                diff_players(previous, state),
+            )
+        self._entries.append(entry)
+        if len(self._entries) % self.checkpoint_interval == 0:
+            self._checkpoints.append(state)
+        self._reached.append(max(self._reached[-1], state.question_count))
+        self._last = state
+
+    def pop(self) -> ScoreboardState:
+        """Remove the last state.
+
+        Raises:
+            ValueError: If only the first state is left.
+
+        Returns:
+            ScoreboardState: The new last state.
+
+        """
+        if not self._entries:
+            raise ValueError("The first state cannot be removed.")
+        if len(self._entries) % self.checkpoint_interval == 0:
+            self._checkpoints.pop()
+        self._entries.pop()
+        self._reached.pop()
+        self._last = self[len(self) - 1]
+        return self._last
+
+    def __getitem__(self, number: int) -> ScoreboardState:
+        """Get a state by its position in the match.
+
+        Args:
+            number (int): The position of the state. Negative positions
+                count from the last state.
+
+        Raises:
+            IndexError: If the position is out of range.
+
+        Returns:
+            ScoreboardState: The state.
+
+        """
+        if number < 0:
+            number += len(self)
+        if not 0 <= number < len(self):
+            raise IndexError("Timeline index is out of range.")
+        start = number - number % self.checkpoint_interval
+        state = self._checkpoints[start // self.checkpoint_interval]
+        for entry in self._entries[start:number]:
+            if entry.after_checkpoint is not None:
+                state = entry.after_checkpoint
+            else:
+                state = apply_entry(state, entry, reverse=False)
+        return state
+
+    def state_at(self, question_count: int) -> ScoreboardState:
+        """Get the state of the board as of a question.
+
+        This is the last state before the question count first went past
+        the given count.
+
+        Args:
+            question_count (int): The question count.
+
+        Raises:
+            ValueError: If the match started after the question count.
+
+        Returns:
+            ScoreboardState: The state.
+
+        """
+        number = bisect_right(self._reached, question_count) - 1
+        if number < 0:
+            raise ValueError("Question count is before the first state.")
+        return self[number]
+
+    def __call__(self, event: ManagerEvent) -> None:
+        """Follow a state change of a ScoreManager.
+
+        Args:
+            event (ManagerEvent): The state change.
+
+        """
+        if event.kind is ManagerEventKind.UNDO:
+            self.pop()
+        else:
+            self.append(event.current)
@@ -0,0 +1,125 @@
+import bisect
+import dataclasses
+from itertools import pairwise
+
+# Upper bounds in nanoseconds: 1 us to about 17 s in powers of two.
+DEFAULT_BOUNDS_NS = tuple(1_000 << shift for shift in range(25))
+
+
+@dataclasses.dataclass(frozen=True)
+class HistogramSnapshot:
+    """The dataclass to store a copy of a LatencyHistogram.
+
+    Attributes:
+        bounds_ns (tuple[int, ...]): Upper bound of each bucket in nanoseconds.
+        counts (tuple[int, ...]): Number of samples in each bucket. The last
+            count is for samples above the last bound.
+        count (int): Number of samples.
+        total_ns (int): Sum of the samples in nanoseconds.
+        max_ns (int): Largest sample in nanoseconds.
+
+    """
+
+    bounds_ns: tuple[int, ...]
+    counts: tuple[int, ...]
+    count: int
+    total_ns: int
+    max_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        """Get the mean of the samples.
+
+        Returns:
+            float: The mean in nanoseconds, or 0 without samples.
+
+        """
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """Get the upper bound of the bucket holding a percentile.
+
+        Args:
+            fraction (float): The percentile as a fraction between 0 and 1.
+
+        Raises:
+            ValueError: If fraction is not between 0 and 1.
+
+        Returns:
+            int: The bucket bound in nanoseconds, the largest sample for the
+                overflow bucket, or 0 without samples.
+
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError("Fraction must be between 0 and 1.")
+        if not self.count:
+            return 0
+        rank = max(1, round(fraction * self.count))
+        seen = 0
+        for bound, bucket_count in zip(self.bounds_ns, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return bound
+        return self.max_ns
+
+
+class LatencyHistogram:
+    """Class for a latency histogram with fixed buckets.
+
+    Recording a sample is a binary search and an increment, and the memory
+    does not grow with the number of samples.
+
+    Attributes:
+        bounds_ns (tuple[int, ...]): Upper bound of each bucket in nanoseconds.
+
+    """
+
+    def __init__(self, bounds_ns: tuple[int, ...] = DEFAULT_BOUNDS_NS) -> None:
+        """Initialize the LatencyHistogram.
+
+        Args:
+            bounds_ns (tuple[int, ...]): Increasing upper bounds of the buckets
+                in nanoseconds. Default is powers of two from 1 us.
+
+        Raises:
+            ValueError: If bounds_ns is empty or not increasing.
+
+        """
+        if not bounds_ns or any(low >= high for low, high in pairwise(bounds_ns)):
+            raise ValueError("Bounds must be increasing.")
+        self.bounds_ns = bounds_ns
+        self._counts = [0] * (len(bounds_ns) + 1)
+        self._total_ns = 0
+        self._max_ns = 0
+
+    def record(self, elapsed_ns: int) -> None:
+        """Record a sample.
+
+        Args:
+            elapsed_ns (int): The latency in nanoseconds.
+
+        """
+        self._counts[bisect.bisect_left(self.bounds_ns, elapsed_ns)] += 1
+        self._total_ns += elapsed_ns
+        self._max_ns = max(self._max_ns, elapsed_ns)
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Copy the current counts.
+
+        Returns:
+            HistogramSnapshot: The copy.
+
+        """
+        return HistogramSnapshot(
+            bounds_ns=self.bounds_ns,
+            counts=tuple(self._counts),
+            count=sum(self._counts),
+            total_ns=self._total_ns,
+            max_ns=self._max_ns,
+        )
+
+    def reset(self) -> None:
+        """Remove all samples."""
+        self._counts = [0] * (len(self.bounds_ns) + 1)
+        self._total_ns = 0
+        self._max_ns = 0
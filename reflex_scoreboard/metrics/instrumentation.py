@@ -0,0 +1,174 @@
+import dataclasses
+from typing import Any
+
+from reflex_scoreboard.data_structure.payload import PayloadType
+from reflex_scoreboard.metrics.histogram import (
+    DEFAULT_BOUNDS_NS,
+    HistogramSnapshot,
+    LatencyHistogram,
+)
+
+# Name of the latency histogram of each operation dispatch branch.
+PAYLOAD_LATENCY_NAMES = {
+    payload_type: f"operation.{payload_type.name.lower()}"
+    for payload_type in PayloadType
+}
+
+
+def _percentile(latency: HistogramSnapshot, fraction: float) -> int:
+    """Get a percentile, capped at the largest sample.
+
+    Args:
+        latency (HistogramSnapshot): The histogram.
+        fraction (float): The percentile as a fraction between 0 and 1.
+
+    Returns:
+        int: The percentile in nanoseconds.
+
+    """
+    return min(latency.percentile(fraction), latency.max_ns)
+
+
+@dataclasses.dataclass(frozen=True)
+class InstrumentationSnapshot:
+    """The dataclass to store a copy of the statistics of an Instrumentation.
+
+    Attributes:
+        latencies (dict[str, HistogramSnapshot]): Latency of each timed
+            operation, by name.
+        payload_counts (dict[PayloadType, int]): Number of dispatched
+            payloads of each type.
+
+    """
+
+    latencies: dict[str, HistogramSnapshot]
+    payload_counts: dict[PayloadType, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the statistics to JSON-compatible values.
+
+        Returns:
+            dict[str, Any]: The latencies with their percentiles and buckets,
+                and the payload counts by type name.
+
+        """
+        return {
+            "latencies": {
+                name: {
+                    "count": latency.count,
+                    "mean_ns": latency.mean_ns,
+                    "p50_ns": _percentile(latency, 0.5),
+                    "p99_ns": _percentile(latency, 0.99),
+                    "max_ns": latency.max_ns,
+                    "bounds_ns": list(latency.bounds_ns),
+                    "counts": list(latency.counts),
+                }
+                for name, latency in self.latencies.items()
+            },
+            "payload_counts": {
+                payload_type.name: count
+                for payload_type, count in self.payload_counts.items()
+            },
+        }
+
+    def format_report(self) -> str:
+        """Format the statistics as a text table in microseconds.
+
+        Returns:
+            str: The table, one line per timed operation, followed by the
+                payload counts.
+
+        """
+        header = ("operation", "count", "mean", "p50", "p99", "max")
+        lines = [
+            f"{header[0]:<20} {header[1]:>8} "
+            + " ".join(f"{title:>9}" for title in header[2:])
+        ]
+        lines.extend(
+            f"{name:<20} {latency.count:>8} {latency.mean_ns / 1000:>9.1f} "
+            f"{_percentile(latency, 0.5) / 1000:>9.1f} "
+            f"{_percentile(latency, 0.99) / 1000:>9.1f} {latency.max_ns / 1000:>9.1f}"
+            for name, latency in sorted(self.latencies.items())
+        )
+        lines.append(
+            "payloads: "
+            + ", ".join(
+                f"{payload_type.name}={count}"
+                for payload_type, count in self.payload_counts.items()
+            )
+        )
+        return "\n".join(lines)
+
+
+class Instrumentation:
+    """Class for opt-in latency histograms and payload counters.
+
+    Attach an instance with ``ScoreManager.instrument`` to time the manager
+    calls, batches, edits, undo and redo, and each operation dispatch branch.
+    Nothing is timed while no instance is attached: each hook is then a
+    single ``is not None`` check.
+
+    The statistics are updated without a lock, so a snapshot taken from
+    another thread can be off by the samples being recorded.
+
+    Attributes:
+        bounds_ns (tuple[int, ...]): Upper bounds of the histogram buckets
+            in nanoseconds.
+
+    """
+
+    def __init__(self, bounds_ns: tuple[int, ...] = DEFAULT_BOUNDS_NS) -> None:
+        """Initialize the Instrumentation.
+
+        Args:
+            bounds_ns (tuple[int, ...]): Increasing upper bounds of the buckets
+                in nanoseconds. Default is powers of two from 1 us.
+
+        """
+        self.bounds_ns = bounds_ns
+        self._latencies: dict[str, LatencyHistogram] = {}
+        self._payload_counts = dict.fromkeys(PayloadType, 0)
+
+    def record(self, name: str, elapsed_ns: int) -> None:
+        """Record the latency of a timed operation.
+
+        Args:
+            name (str): The name of the operation.
+            elapsed_ns (int): The latency in nanoseconds.
+
+        """
+        histogram = self._latencies.get(name)
+        if histogram is None:
+            histogram = self._latencies[name] = LatencyHistogram(self.bounds_ns)
+        histogram.record(elapsed_ns)
+
+    def record_payload(self, payload_type: PayloadType, elapsed_ns: int) -> None:
+        """Count a dispatched payload and record the latency of its branch.
+
+        Args:
+            payload_type (PayloadType): The type of the payload.
+            elapsed_ns (int): The latency in nanoseconds.
+
+        """
+        self._payload_counts[payload_type] += 1
+        self.record(PAYLOAD_LATENCY_NAMES[payload_type], elapsed_ns)
+
+    def snapshot(self) -> InstrumentationSnapshot:
+        """Copy the current statistics.
+
+        Returns:
+            InstrumentationSnapshot: The copy.
+
+        """
+        return InstrumentationSnapshot(
+            latencies={
+                name: histogram.snapshot()
+                for name, histogram in self._latencies.items()
+            },
+            payload_counts=dict(self._payload_counts),
+        )
+
+    def reset(self) -> None:
+        """Remove all samples and counts."""
+        self._latencies.clear()
+        self._payload_counts = dict.fromkeys(PayloadType, 0)
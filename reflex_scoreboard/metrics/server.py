@@ -0,0 +1,70 @@
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from reflex_scoreboard.metrics.instrumentation import Instrumentation
+
+METRICS_PATH = "/metrics"
+
+
+def serve_metrics(
+    instrumentation: Instrumentation, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """Serve the statistics as JSON over HTTP from a background thread.
+
+    ``GET /metrics`` returns the snapshot of the instrumentation, and
+    ``POST /metrics/reset`` removes all samples. Call ``shutdown`` on the
+    returned server to stop it.
+
+    Args:
+        instrumentation (Instrumentation): The statistics to serve.
+        host (str): The address to bind. Default is the loopback address, so
+            the statistics are only available locally.
+        port (int): The port to bind. Default is 0 (any free port).
+
+    Returns:
+        ThreadingHTTPServer: The running server. Its ``server_address``
+            holds the bound port.
+
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Handler returning the statistics of the instrumentation."""
+
+        def _reply(self, status: HTTPStatus, body: bytes = b"") -> None:
+            """Send a JSON response.
+
+            Args:
+                status (HTTPStatus): The status of the response.
+                body (bytes): The body of the response. Default is empty.
+
+            """
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            """Return the snapshot of the instrumentation."""
+            if self.path != METRICS_PATH:
+                self._reply(HTTPStatus.NOT_FOUND)
+                return
+            body = json.dumps(instrumentation.snapshot().to_dict()).encode()
+            self._reply(HTTPStatus.OK, body)
+
+        def do_POST(self) -> None:
+            """Remove all samples of the instrumentation."""
+            if self.path != METRICS_PATH + "/reset":
+                self._reply(HTTPStatus.NOT_FOUND)
+                return
+            instrumentation.reset()
+            self._reply(HTTPStatus.NO_CONTENT)
+
+        def log_message(self, *_: object) -> None:
+            """Do not log the requests."""
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
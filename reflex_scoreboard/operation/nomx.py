@@ -1,6 +1,5 @@
-from reflex_scoreboard.data_structure.payload import Payload
 from reflex_scoreboard.data_structure.player import PlayerState
-from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardLike
 from reflex_scoreboard.operation.operation_base import OperationBase
 
 
@@ -32,15 +31,15 @@ class NoMxOperation(OperationBase):
         self.win_threshold = win_threshold
         self.lose_threshold = lose_threshold
 
-    def answer_right(self, scoreboard: ScoreboardState, index: int) -> ScoreboardState:
+    def answer_right[S: ScoreboardLike](self, scoreboard: S, index: int) -> S:
         """Perform the answer right operation on the scoreboard.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
             index (int): The index of the player who answered correctly.
 
         Returns:
-            ScoreboardState: The updated scoreboard state with the correct answer.
+            S: The updated scoreboard state with the correct answer.
 
         """
         new_scoreboard = scoreboard.add_answer(index)
@@ -48,15 +47,15 @@ class NoMxOperation(OperationBase):
             new_scoreboard = new_scoreboard.update_state(index, PlayerState.WIN)
         return new_scoreboard.set_question_count(new_scoreboard.question_count + 1)
 
-    def make_miss(self, scoreboard: ScoreboardState, index: int) -> ScoreboardState:
+    def make_miss[S: ScoreboardLike](self, scoreboard: S, index: int) -> S:
         """Perform the make miss operation on the scoreboard.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
             index (int): The index of the player who made a miss.
 
         Returns:
-            ScoreboardState: The updated scoreboard state with the miss.
+            S: The updated scoreboard state with the miss.
 
         """
         new_scoreboard = scoreboard.add_miss(index)
@@ -64,29 +63,14 @@ class NoMxOperation(OperationBase):
             new_scoreboard = new_scoreboard.update_state(index, PlayerState.LOSE)
         return new_scoreboard.set_question_count(new_scoreboard.question_count + 1)
 
-    def through(self, scoreboard: ScoreboardState) -> ScoreboardState:
+    def through[S: ScoreboardLike](self, scoreboard: S) -> S:
         """Perform the through operation on the scoreboard.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
 
         Returns:
-            ScoreboardState: The updated scoreboard state with the through operation.
+            S: The updated scoreboard state with the through operation.
 
         """
         return scoreboard.set_question_count(scoreboard.question_count + 1)
-
-    def __call__(
-        self, scoreboard: ScoreboardState, payload: Payload
-    ) -> ScoreboardState:
-        """Update the scoreboard state.
-
-        Args:
-            scoreboard (ScoreboardState): The scoreboard state.
-            payload (int | None): The payload containing the operation type and index.
-
-        Returns:
-            ScoreboardState: The updated scoreboard state.
-
-        """
-        return super().__call__(scoreboard, payload)
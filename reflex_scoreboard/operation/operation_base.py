@@ -1,80 +1,324 @@
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
+from reflex_scoreboard.data_structure.mutable_scoreboard import MutableScoreboard
 from reflex_scoreboard.data_structure.payload import Payload, PayloadType
-from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import (
+    ScoreboardLike,
+    ScoreboardState,
+)
+
+if TYPE_CHECKING:
+    from reflex_scoreboard.metrics.instrumentation import Instrumentation
+
+# Handler of a payload type: called with the operation, the scoreboard and
+# the payload, and returns the updated scoreboard.
+type PayloadHandler = Callable[[Any, Any, Payload], Any]
+
+
+def handles[F: Callable[..., Any]](payload_type: PayloadType) -> Callable[[F], F]:
+    """Declare a method of an operation as the handler of a payload type.
+
+    The method is called with the scoreboard and the payload, and returns
+    the updated scoreboard. A handler declared in a subclass replaces the
+    inherited handler of the same type.
+
+    Args:
+        payload_type (PayloadType): The payload type to handle.
+
+    Returns:
+        Callable[[F], F]: The decorator.
+
+    """
+
+    def declare(method: F) -> F:
+        method.__payload_type__ = payload_type  # type: ignore[attr-defined]
+        return method
+
+    return declare
 
 
 class OperationBase(ABC):
     """Base class for scoreboard operations.
 
-    This class provides static methods to manipulate the scoreboard state.
+    Payloads are dispatched through a table from payload type to handler,
+    built once per class from the methods declared with ``handles``. The
+    base class handles RIGHT, MISS and THROUGH with ``answer_right``,
+    ``make_miss`` and ``through``, and the corrections ADJUST, SET_STATE and
+    REST without moving to the next question. Subclasses add payload types
+    or change a rule by declaring handlers, and payloads without a handler
+    leave the scoreboard unchanged.
+
+    Attributes:
+        instrumentation (Instrumentation | None): Statistics the dispatch
+            branches are timed into, or None to not time them. Set by
+            ScoreManager.instrument.
+
     """
 
+    instrumentation: "Instrumentation | None" = None
+    _handler_names: ClassVar[dict[PayloadType, str]] = {}
+    _payload_handlers: ClassVar[dict[PayloadType, PayloadHandler]] = {}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Build the dispatch table of the subclass.
+
+        Args:
+            **kwargs (object): Arguments for the parent classes.
+
+        """
+        super().__init_subclass__(**kwargs)
+        cls._build_payload_handlers()
+
+    @classmethod
+    def _build_payload_handlers(cls) -> None:
+        """Build the dispatch table from the declared handlers.
+
+        Handlers are looked up by name, so overriding a handler method
+        without declaring it again still replaces the handler.
+        """
+        names = dict(cls._handler_names)
+        for name, value in vars(cls).items():
+            payload_type = getattr(value, "__payload_type__", None)
+            if isinstance(payload_type, PayloadType):
+                names[payload_type] = name
+        cls._handler_names = names
+        cls._payload_handlers = {
+            payload_type: getattr(cls, name) for payload_type, name in names.items()
+        }
+
+    @classmethod
+    def handled_payload_types(cls) -> frozenset[PayloadType]:
+        """Get the payload types the operation has handlers for.
+
+        Returns:
+            frozenset[PayloadType]: The handled payload types.
+
+        """
+        return frozenset(cls._payload_handlers)
+
     @abstractmethod
-    def through(self, scoreboard: ScoreboardState) -> ScoreboardState:
+    def through[S: ScoreboardLike](self, scoreboard: S) -> S:
         """Update the scoreboard by passing the question.
 
         This method should be implemented by subclasses.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
             index (int): The index of the player who passed the question.
 
         Returns:
-            ScoreboardState: The updated scoreboard state with the passed question.
+            S: The updated scoreboard state with the passed question.
 
         """
 
     @abstractmethod
-    def answer_right(self, scoreboard: ScoreboardState, index: int) -> ScoreboardState:
+    def answer_right[S: ScoreboardLike](self, scoreboard: S, index: int) -> S:
         """Update the scoreboard by correct answers.
 
         This method should be implemented by subclasses.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
             index (int): The index of the player who answered correctly.
 
         Returns:
-            ScoreboardState: The updated scoreboard state with the correct answer.
+            S: The updated scoreboard state with the correct answer.
 
         """
 
     @abstractmethod
-    def make_miss(self, scoreboard: ScoreboardState, index: int) -> ScoreboardState:
+    def make_miss[S: ScoreboardLike](self, scoreboard: S, index: int) -> S:
         """Update scoreboard by incorrect answers.
 
         This method should be implemented by subclasses.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
             index (int): The index of the player who answered incorrectly.
 
         Returns:
-            ScoreboardState: The updated scoreboard state with the incorrect answer.
+            S: The updated scoreboard state with the incorrect answer.
 
         """
 
-    def __call__(
-        self, scoreboard: ScoreboardState, payload: Payload
-    ) -> ScoreboardState:
+    @handles(PayloadType.RIGHT)
+    def _handle_right[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
+        """Handle a RIGHT payload with ``answer_right``.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            payload (Payload): The payload.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        return self.answer_right(scoreboard, payload.index)
+
+    @handles(PayloadType.MISS)
+    def _handle_miss[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
+        """Handle a MISS payload with ``make_miss``.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            payload (Payload): The payload.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        return self.make_miss(scoreboard, payload.index)
+
+    @handles(PayloadType.THROUGH)
+    def _handle_through[S: ScoreboardLike](self, scoreboard: S, _: Payload) -> S:
+        """Handle a THROUGH payload with ``through``.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            _ (Payload): The payload.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        return self.through(scoreboard)
+
+    @handles(PayloadType.ADJUST)
+    def adjust_score[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
+        """Add the value of the payload to the score of the player.
+
+        The state is kept, so a correction does not make the player win or
+        lose. Follow it with a SET_STATE payload to change the state too.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            payload (Payload): The ADJUST payload.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        index = payload.index
+        return scoreboard.update_score(
+            index, scoreboard[index].score + cast("int", payload.value)
+        )
+
+    @handles(PayloadType.SET_STATE)
+    def override_state[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
+        """Set the state of the player to the value of the payload.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            payload (Payload): The SET_STATE payload.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        return scoreboard.update_state(
+            payload.index, PlayerState(cast("int", payload.value))
+        )
+
+    @handles(PayloadType.REST)
+    def set_rest[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
+        """Rest the player for the value of the payload in questions.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            payload (Payload): The REST payload.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        return scoreboard.set_breaks(payload.index, cast("int", payload.value))
+
+    def __call__[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
         """Update the scoreboard state.
 
-        This method should be implemented by subclasses.
+        The handler is found with one lookup in the dispatch table.
 
         Args:
-            scoreboard (ScoreboardState): The scoreboard state.
+            scoreboard (S): The scoreboard state.
             payload (Payload): The payload containing the operation type and index.
 
         Returns:
-            ScoreboardState: The updated scoreboard state.
+            S: The updated scoreboard state, or the same state if no handler
+                is declared for the payload type.
 
         """
-        if payload.payload_type == PayloadType.RIGHT:
-            return self.answer_right(scoreboard, payload.index)
-        if payload.payload_type == PayloadType.MISS:
-            return self.make_miss(scoreboard, payload.index)
-        if payload.payload_type == PayloadType.THROUGH:
-            return self.through(scoreboard)
+        if self.instrumentation is not None:
+            return self._call_instrumented(scoreboard, payload, self.instrumentation)
+        handler = self._payload_handlers.get(payload.payload_type)
+        if handler is None:
+            return scoreboard
+        return cast("S", handler(self, scoreboard, payload))
+
+    def _call_instrumented[S: ScoreboardLike](
+        self, scoreboard: S, payload: Payload, instrumentation: "Instrumentation"
+    ) -> S:
+        """Update the scoreboard state and time the dispatch branch.
 
+        Args:
+            scoreboard (S): The scoreboard state.
+            payload (Payload): The payload containing the operation type and index.
+            instrumentation (Instrumentation): The statistics to record into.
+
+        Returns:
+            S: The updated scoreboard state.
+
+        """
+        payload_type = payload.payload_type
+        handler = self._payload_handlers.get(payload_type)
+        if handler is None:
+            return scoreboard
+        start = time.perf_counter_ns()
+        scoreboard = handler(self, scoreboard, payload)
+        instrumentation.record_payload(payload_type, time.perf_counter_ns() - start)
         return scoreboard
+
+    def rank_key(self, player: PlayerScore) -> tuple[int, ...]:
+        """Get the key ordering the players by rank.
+
+        Players with smaller keys rank higher, and players with equal keys
+        share a rank. By default players are ordered by state (WIN, NORMAL,
+        LOSE), then by more answers, then by fewer misses. Subclasses can
+        override this for other rules.
+
+        Args:
+            player (PlayerScore): The player.
+
+        Returns:
+            tuple[int, ...]: The rank key of the player.
+
+        """
+        return (-player.state.value, -player.answers, player.misses)
+
+    def apply_batch(
+        self, scoreboard: ScoreboardState, payloads: Iterable[Payload]
+    ) -> ScoreboardState:
+        """Apply a sequence of payloads to the scoreboard in one pass.
+
+        The payloads are applied to a MutableScoreboard, so no intermediate
+        ScoreboardState is created. The result is the same as applying the
+        payloads one by one.
+
+        Args:
+            scoreboard (ScoreboardState): The scoreboard state.
+            payloads (Iterable[Payload]): The payloads to apply, in order.
+
+        Returns:
+            ScoreboardState: The scoreboard state after the last payload.
+
+        """
+        scratch = MutableScoreboard(scoreboard)
+        for payload in payloads:
+            scratch = self(scratch, payload)
+        return scratch.freeze()
+
+
+OperationBase._build_payload_handlers()  # noqa: SLF001
@@ -0,0 +1,338 @@
+import dataclasses
+from collections.abc import Callable
+from enum import Enum
+
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardLike
+from reflex_scoreboard.operation.operation_base import OperationBase
+
+
+class ScoreRule(Enum):
+    """Enum for how the score changes on a right answer or a miss."""
+
+    # Add right_points on a right answer and miss_points on a miss.
+    POINTS = "points"
+    # Add right_points on a right answer and reset the score on a miss.
+    UP_DOWN = "up_down"
+    # The score is answers times (lose_threshold - misses).
+    BY = "by"
+
+
+class WinCondition(Enum):
+    """Enum for the value compared with the win threshold."""
+
+    ANSWERS = "answers"
+    SCORE = "score"
+
+
+@dataclasses.dataclass(frozen=True)
+class RuleSpec:
+    """The dataclass to describe a match format declaratively.
+
+    ``compile`` turns the spec into an OperationBase. Use the class methods
+    for the common formats.
+
+    Attributes:
+        win_threshold (int): Answers or score needed to win.
+        lose_threshold (int | None): Misses that make the player lose, or
+            None if misses never make the player lose. Default is None.
+        win_condition (WinCondition): Value compared with win_threshold.
+            Default is WinCondition.ANSWERS.
+        score_rule (ScoreRule): How the score changes. Default is
+            ScoreRule.POINTS.
+        right_points (int): Points of a right answer. Default is 1.
+        miss_points (int): Points of a miss, usually 0 or negative.
+            Default is 0.
+        rest_on_miss (int): Questions a player sits out after a miss.
+            Default is 0.
+
+    """
+
+    win_threshold: int
+    lose_threshold: int | None = None
+    win_condition: WinCondition = WinCondition.ANSWERS
+    score_rule: ScoreRule = ScoreRule.POINTS
+    right_points: int = 1
+    miss_points: int = 0
+    rest_on_miss: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate the spec.
+
+        Raises:
+            ValueError: If a threshold is not positive, rest_on_miss is
+                negative, or the BY rule has no lose threshold.
+
+        """
+        if self.win_threshold <= 0:
+            raise ValueError("Win threshold must be positive.")
+        if self.lose_threshold is not None and self.lose_threshold <= 0:
+            raise ValueError("Lose threshold must be positive.")
+        if self.rest_on_miss < 0:
+            raise ValueError("Rest on miss must not be negative.")
+        if self.score_rule is ScoreRule.BY and self.lose_threshold is None:
+            raise ValueError("The BY rule needs a lose threshold.")
+
+    @staticmethod
+    def n_o_m_x(win_threshold: int, lose_threshold: int) -> "RuleSpec":
+        """Create the spec of N-o M-x: N answers win and M misses lose.
+
+        Args:
+            win_threshold (int): Answers needed to win.
+            lose_threshold (int): Misses that make the player lose.
+
+        Returns:
+            RuleSpec: The spec.
+
+        """
+        return RuleSpec(win_threshold, lose_threshold)
+
+    @staticmethod
+    def n_by_m(win_threshold: int, lose_threshold: int) -> "RuleSpec":
+        """Create the spec of N-by-M: answers times (M - misses) reaching N wins.
+
+        Args:
+            win_threshold (int): Score needed to win.
+            lose_threshold (int): Misses that make the player lose.
+
+        Returns:
+            RuleSpec: The spec.
+
+        """
+        return RuleSpec(
+            win_threshold,
+            lose_threshold,
+            win_condition=WinCondition.SCORE,
+            score_rule=ScoreRule.BY,
+        )
+
+    @staticmethod
+    def up_down(win_threshold: int, lose_threshold: int | None = None) -> "RuleSpec":
+        """Create the spec of N up-down: a miss resets the score to 0.
+
+        Args:
+            win_threshold (int): Score needed to win.
+            lose_threshold (int | None): Misses that make the player lose.
+                Default is None.
+
+        Returns:
+            RuleSpec: The spec.
+
+        """
+        return RuleSpec(
+            win_threshold,
+            lose_threshold,
+            win_condition=WinCondition.SCORE,
+            score_rule=ScoreRule.UP_DOWN,
+        )
+
+    @staticmethod
+    def rest_after_miss(
+        win_threshold: int, lose_threshold: int | None, rest: int
+    ) -> "RuleSpec":
+        """Create the spec of N-o M-x where a miss rests the player.
+
+        Args:
+            win_threshold (int): Answers needed to win.
+            lose_threshold (int | None): Misses that make the player lose.
+            rest (int): Questions the player sits out after a miss.
+
+        Returns:
+            RuleSpec: The spec.
+
+        """
+        return RuleSpec(win_threshold, lose_threshold, rest_on_miss=rest)
+
+    @staticmethod
+    def point_race(
+        win_threshold: int, right_points: int = 1, miss_points: int = -1
+    ) -> "RuleSpec":
+        """Create the spec of a point race: the first to reach N points wins.
+
+        Args:
+            win_threshold (int): Score needed to win.
+            right_points (int): Points of a right answer. Default is 1.
+            miss_points (int): Points of a miss. Default is -1.
+
+        Returns:
+            RuleSpec: The spec.
+
+        """
+        return RuleSpec(
+            win_threshold,
+            win_condition=WinCondition.SCORE,
+            right_points=right_points,
+            miss_points=miss_points,
+        )
+
+    def compile(self) -> "CompiledOperation":
+        """Compile the spec into an operation.
+
+        Returns:
+            CompiledOperation: The operation.
+
+        """
+        return CompiledOperation(self)
+
+
+type PlayerUpdate = Callable[[PlayerScore], PlayerScore]
+
+
+class CompiledOperation(OperationBase):
+    """Class for an operation compiled from a RuleSpec.
+
+    The score rule and the win and lose checks are resolved once, when the
+    operation is created, into one function per answer kind. Each payload
+    then computes the new player in one step and replaces it with a single
+    ``replace_player`` call. Breaks are only reduced when the format rests
+    players.
+
+    Attributes:
+        spec (RuleSpec): The compiled spec.
+
+    """
+
+    def __init__(self, spec: RuleSpec) -> None:
+        """Initialize the CompiledOperation.
+
+        Args:
+            spec (RuleSpec): The spec to compile.
+
+        """
+        self.spec = spec
+        self._on_right = self._compile_right()
+        self._on_miss = self._compile_miss()
+        self._uses_breaks = spec.rest_on_miss > 0
+
+    def _compile_right(self) -> PlayerUpdate:
+        """Build the player update of a right answer.
+
+        Returns:
+            PlayerUpdate: The update.
+
+        """
+        spec = self.spec
+        win_threshold = spec.win_threshold
+        right_points = spec.right_points
+        win_by_answers = spec.win_condition is WinCondition.ANSWERS
+        by_base = spec.lose_threshold or 0
+        score_by = spec.score_rule is ScoreRule.BY
+
+        def on_right(player: PlayerScore) -> PlayerScore:
+            answers = player.answers + 1
+            if score_by:
+                score = answers * max(by_base - player.misses, 0)
+            else:
+                score = player.score + right_points
+            state = player.state
+            if (answers if win_by_answers else score) >= win_threshold:
+                state = PlayerState.WIN
+            return player.with_results(
+                answers, player.misses, score, player.breaks, state
+            )
+
+        return on_right
+
+    def _compile_miss(self) -> PlayerUpdate:
+        """Build the player update of a miss.
+
+        Returns:
+            PlayerUpdate: The update.
+
+        """
+        spec = self.spec
+        lose_threshold = spec.lose_threshold
+        miss_points = spec.miss_points
+        rest = spec.rest_on_miss
+        score_rule = spec.score_rule
+        by_base = spec.lose_threshold or 0
+
+        def on_miss(player: PlayerScore) -> PlayerScore:
+            misses = player.misses + 1
+            if score_rule is ScoreRule.BY:
+                score = player.answers * max(by_base - misses, 0)
+            elif score_rule is ScoreRule.UP_DOWN:
+                score = 0
+            else:
+                score = player.score + miss_points
+            state = player.state
+            if lose_threshold is not None and misses >= lose_threshold:
+                state = PlayerState.LOSE
+            return player.with_results(
+                player.answers, misses, score, rest or player.breaks, state
+            )
+
+        return on_miss
+
+    def _next_question[S: ScoreboardLike](self, scoreboard: S) -> S:
+        """Move to the next question.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+
+        Returns:
+            S: The scoreboard state for the next question.
+
+        """
+        if self._uses_breaks:
+            scoreboard = scoreboard.reduce_breaks_all()
+        return scoreboard.set_question_count(scoreboard.question_count + 1)
+
+    def answer_right[S: ScoreboardLike](self, scoreboard: S, index: int) -> S:
+        """Perform the answer right operation on the scoreboard.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            index (int): The index of the player who answered correctly.
+
+        Returns:
+            S: The updated scoreboard state with the correct answer.
+
+        """
+        scoreboard = self._next_question(scoreboard)
+        return scoreboard.replace_player(index, self._on_right(scoreboard[index]))
+
+    def make_miss[S: ScoreboardLike](self, scoreboard: S, index: int) -> S:
+        """Perform the make miss operation on the scoreboard.
+
+        Breaks of other players are reduced before the player who missed
+        starts resting, so the rest covers the next questions.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+            index (int): The index of the player who made a miss.
+
+        Returns:
+            S: The updated scoreboard state with the miss.
+
+        """
+        scoreboard = self._next_question(scoreboard)
+        return scoreboard.replace_player(index, self._on_miss(scoreboard[index]))
+
+    def through[S: ScoreboardLike](self, scoreboard: S) -> S:
+        """Perform the through operation on the scoreboard.
+
+        Args:
+            scoreboard (S): The scoreboard state.
+
+        Returns:
+            S: The updated scoreboard state with the through operation.
+
+        """
+        return self._next_question(scoreboard)
+
+    def rank_key(self, player: PlayerScore) -> tuple[int, ...]:
+        """Get the key ordering the players by rank.
+
+        Formats won by score rank by score before answers and misses.
+
+        Args:
+            player (PlayerScore): The player.
+
+        Returns:
+            tuple[int, ...]: The rank key of the player.
+
+        """
+        if self.spec.win_condition is WinCondition.SCORE:
+            return (-player.state.value, -player.score, -player.answers, player.misses)
+        return super().rank_key(player)
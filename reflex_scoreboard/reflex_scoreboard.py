@@ -1,12 +1,205 @@
-"""Welcome to Reflex! This file outlines the steps to create a basic app."""
+"""Scoreboard app backed by a ScoreManager."""
+
+from collections.abc import Callable
+from typing import cast
 
 import reflex as rx
 
-from rxconfig import config
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.patches import (
+    apply_patches,
+    field_patches,
+    player_row,
+)
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+DEFAULT_PLAYERS = {1: "Player 1", 2: "Player 2", 3: "Player 3", 4: "Player 4"}
+DEFAULT_WIN_THRESHOLD = 7
+DEFAULT_LOSE_THRESHOLD = 3
+PLAYER_FIELDS = ("answers", "misses", "score", "breaks", "state")
+MAX_PLAYERS = 16
 
 
 class State(rx.State):
-    """The app state."""
+    """The app state.
+
+    The ScoreManager lives in a backend-only var. Each player is shown from
+    its own PlayerSlot substate, and Reflex sends only the dirty vars of
+    dirty states, so after a payload only the changed fields of the changed
+    players reach the browser. The slots are the single source of what the
+    browser shows, so reconnecting clients get current values.
+
+    """
+
+    question_count: int = 1
+    _manager: ScoreManager | None = None
+
+    def _get_manager(self) -> ScoreManager:
+        """Get the ScoreManager of the session, creating it if needed.
+
+        Returns:
+            ScoreManager: The ScoreManager.
+
+        """
+        if self._manager is None:
+            self._manager = ScoreManager(
+                ScoreboardState.create_from_players_dict(DEFAULT_PLAYERS),
+                NoMxOperation(
+                    win_threshold=DEFAULT_WIN_THRESHOLD,
+                    lose_threshold=DEFAULT_LOSE_THRESHOLD,
+                ),
+            )
+        return self._manager
+
+    def _slots(self) -> list["PlayerSlot"]:
+        """Get the substates showing the players, in roster order.
+
+        Returns:
+            list[PlayerSlot]: The substates.
+
+        """
+        return [
+            cast("PlayerSlot", self.get_substate([slot.get_name()]))
+            for slot in PLAYER_SLOTS
+        ]
+
+    def _render_all(self, scoreboard: ScoreboardState) -> None:
+        """Send the whole scoreboard to the browser.
+
+        Args:
+            scoreboard (ScoreboardState): The scoreboard state to show.
+
+        Raises:
+            ValueError: If the roster has more players than the app has slots.
+
+        """
+        if len(scoreboard) > len(PLAYER_SLOTS):
+            raise ValueError("Roster exceeds the player slots of the app.")
+        slots = self._slots()
+        for slot, player in zip(slots, scoreboard.players, strict=False):
+            slot.shown = True
+            for field, value in player_row(player).items():
+                setattr(slot, field, value)
+        for slot in slots[len(scoreboard) :]:
+            slot.shown = False
+        self.question_count = scoreboard.question_count
+
+    def _update(self, action: Callable[[ScoreManager], None]) -> None:
+        """Run an action on the ScoreManager and update the player slots.
+
+        Args:
+            action (Callable[[ScoreManager], None]): The action to run.
+
+        """
+        manager = self._get_manager()
+        previous = manager.scoreboard
+        action(manager)
+        current = manager.scoreboard
+        patches = field_patches(previous, current)
+        if patches is None:
+            self._render_all(current)
+            return
+        if current.question_count != self.question_count:
+            self.question_count = current.question_count
+        if patches:
+            apply_patches(self._slots(), patches)
+
+    def load(self) -> None:
+        """Show the current scoreboard when the page is loaded."""
+        self._render_all(self._get_manager().scoreboard)
+
+    def right(self, index: int) -> None:
+        """Apply a correct answer.
+
+        Args:
+            index (int): The index of the player.
+
+        """
+        self._update(lambda manager: manager(Payload.of(PayloadType.RIGHT, index)))
+
+    def miss(self, index: int) -> None:
+        """Apply a miss.
+
+        Args:
+            index (int): The index of the player.
+
+        """
+        self._update(lambda manager: manager(Payload.of(PayloadType.MISS, index)))
+
+    def through(self) -> None:
+        """Pass the question."""
+        self._update(lambda manager: manager(Payload.of(PayloadType.THROUGH)))
+
+    def undo(self) -> None:
+        """Undo the last operation."""
+        self._update(ScoreManager.undo)
+
+    def redo(self) -> None:
+        """Redo the last undone operation."""
+        self._update(ScoreManager.redo)
+
+
+class PlayerSlot(rx.State, mixin=True):  # type: ignore[call-arg]
+    """The fields of the player shown in one slot of the page.
+
+    Attributes:
+        shown (bool): Whether a player is in the slot.
+        player_id (int): The player ID.
+        name (str): The name of the player.
+        answers (int): Number of correct answers.
+        misses (int): Number of misses.
+        score (int): Total score.
+        breaks (int): Number of breaks.
+        state (str): The name of the PlayerState.
+
+    """
+
+    shown: bool = False
+    player_id: int = 0
+    name: str = ""
+    answers: int = 0
+    misses: int = 0
+    score: int = 0
+    breaks: int = 0
+    state: str = ""
+
+
+# One substate of State per slot, so each player is its own entry of the delta.
+PLAYER_SLOTS: tuple[type[PlayerSlot], ...] = tuple(
+    type(f"PlayerSlot{slot}", (PlayerSlot, State), {"__module__": __name__})
+    for slot in range(MAX_PLAYERS)
+)
+
+
+def player_card(slot: type[PlayerSlot], index: int) -> rx.Component:
+    """Return the card of one player slot, hidden while the slot is empty.
+
+    Args:
+        slot (type[PlayerSlot]): The substate of the slot.
+        index (int): The index of the player.
+
+    Returns:
+        rx.Component: The card.
+
+    """
+    return rx.cond(
+        slot.shown,
+        rx.card(
+            rx.vstack(
+                rx.heading(slot.name, size="4"),
+                *(
+                    rx.hstack(rx.text(field), rx.text(getattr(slot, field)))
+                    for field in PLAYER_FIELDS
+                ),
+                rx.hstack(
+                    rx.button("Right", on_click=State.right(index)),  # type: ignore[arg-type, call-arg, func-returns-value]
+                    rx.button("Miss", on_click=State.miss(index)),  # type: ignore[arg-type, call-arg, func-returns-value]
+                ),
+            ),
+        ),
+    )
 
 
 def index() -> rx.Component:
@@ -16,28 +209,24 @@ def index() -> rx.Component:
         rx.Component: The index page.
 
     """
-    # Welcome Page (Index)
     return rx.container(
         rx.color_mode.button(position="top-right"),
         rx.vstack(
-            rx.heading("Welcome to Reflex!", size="9"),
-            rx.text(
-                "Get started by editing ",
-                rx.code(f"{config.app_name}/{config.app_name}.py"),
-                size="5",
+            rx.heading(f"Q{State.question_count}", size="7"),
+            rx.flex(
+                *(player_card(slot, index) for index, slot in enumerate(PLAYER_SLOTS)),
+                wrap="wrap",
+                spacing="3",
             ),
-            rx.link(
-                rx.button("Check out our docs!"),
-                href="https://reflex.dev/docs/getting-started/introduction/",
-                is_external=True,
+            rx.hstack(
+                rx.button("Through", on_click=State.through),
+                rx.button("Undo", on_click=State.undo),
+                rx.button("Redo", on_click=State.redo),
             ),
             spacing="5",
-            justify="center",
-            min_height="85vh",
         ),
-        rx.logo(),
     )
 
 
 app = rx.App()
-app.add_page(index)
+app.add_page(index, on_load=State.load)
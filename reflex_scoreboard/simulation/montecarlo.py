@@ -0,0 +1,450 @@
+import dataclasses
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import numpy.typing as npt
+
+from reflex_scoreboard.data_structure.payload import PayloadType
+from reflex_scoreboard.data_structure.payload_codec import TYPE_BITS, TYPE_CODES
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+type IntArray = npt.NDArray[np.int64]
+type FloatArray = npt.NDArray[np.float64]
+type StateArray = npt.NDArray[np.int8]
+type TraceArray = npt.NDArray[np.uint32]
+
+_WIN = np.int8(PlayerState.WIN.value)
+_NORMAL = np.int8(PlayerState.NORMAL.value)
+_LOSE = np.int8(PlayerState.LOSE.value)
+_RIGHT_CODE = TYPE_CODES[PayloadType.RIGHT]
+_MISS_CODE = TYPE_CODES[PayloadType.MISS]
+
+
+@dataclasses.dataclass(frozen=True)
+class MatchConfig:
+    """The dataclass to describe a simulated N-o M-x match.
+
+    On each question every NORMAL player presses the buzzer with their buzz
+    probability. One of the players who pressed, chosen uniformly, answers
+    and is right with their accuracy; if nobody presses, the question is a
+    through. The match ends when ``seats`` players have won, when no NORMAL
+    player is left, or after ``question_cap`` questions.
+
+    Attributes:
+        win_threshold (int): Answers needed to win.
+        lose_threshold (int): Misses that make the player lose.
+        buzz (tuple[float, ...]): Probability that each player presses.
+        accuracy (tuple[float, ...]): Probability that each player is right.
+        seats (int): Number of winners that ends the match. Default is 1.
+        question_cap (int): Maximum number of questions. Default is 100.
+
+    """
+
+    win_threshold: int
+    lose_threshold: int
+    buzz: tuple[float, ...]
+    accuracy: tuple[float, ...]
+    seats: int = 1
+    question_cap: int = 100
+
+    def __post_init__(self) -> None:
+        """Validate the config.
+
+        Raises:
+            ValueError: If a threshold or the cap is not positive, the player
+                lists are empty or differ in length, a probability is out of
+                range, or seats is not between 1 and the number of players.
+
+        """
+        if self.win_threshold <= 0:
+            raise ValueError("Win threshold must be positive.")
+        if self.lose_threshold <= 0:
+            raise ValueError("Lose threshold must be positive.")
+        if self.question_cap <= 0:
+            raise ValueError("Question cap must be positive.")
+        if not self.buzz or len(self.buzz) != len(self.accuracy):
+            raise ValueError("Buzz and accuracy must be given for each player.")
+        if any(not 0.0 <= p <= 1.0 for p in (*self.buzz, *self.accuracy)):
+            raise ValueError("Probabilities must be between 0 and 1.")
+        if not 1 <= self.seats <= len(self.buzz):
+            raise ValueError("Seats must be between 1 and the number of players.")
+
+    @property
+    def num_players(self) -> int:
+        """Get the number of players.
+
+        Returns:
+            int: The number of players.
+
+        """
+        return len(self.buzz)
+
+    def operation(self) -> NoMxOperation:
+        """Get the operation with the rules that the simulator follows.
+
+        Returns:
+            NoMxOperation: The operation.
+
+        """
+        return NoMxOperation(self.win_threshold, self.lose_threshold)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class SimulationBatch:
+    """The dataclass to store the final states of a batch of matches.
+
+    Row ``m`` of each array belongs to match ``m``.
+
+    Attributes:
+        answers (IntArray): Correct answers of each player.
+        misses (IntArray): Misses of each player.
+        states (StateArray): PlayerState values of each player.
+        lengths (IntArray): Number of questions played in each match.
+        capped (npt.NDArray[np.bool_]): Whether each match hit the cap.
+        trace (TraceArray | None): Payloads of each question, encoded as in
+            payload_codec, with shape (question_cap, matches). Only the first
+            ``lengths[m]`` words of match ``m`` are meaningful. None unless
+            requested.
+
+    """
+
+    answers: IntArray
+    misses: IntArray
+    states: StateArray
+    lengths: IntArray
+    capped: npt.NDArray[np.bool_]
+    trace: TraceArray | None = None
+
+
+@dataclasses.dataclass(eq=False)
+class _WorkingSet:
+    """Arrays of the matches that may still be running in simulate_batch.
+
+    Attributes:
+        ids (IntArray): Match index of each row.
+        answers (IntArray): Correct answers of each player.
+        misses (IntArray): Misses of each player.
+        states (StateArray): PlayerState values of each player.
+        lengths (IntArray): Questions played in each match.
+        winners (IntArray): Number of players who won in each match.
+        normal (IntArray): Number of NORMAL players in each match.
+        active (npt.NDArray[np.bool_]): Whether each match is running.
+
+    """
+
+    ids: IntArray
+    answers: IntArray
+    misses: IntArray
+    states: StateArray
+    lengths: IntArray
+    winners: IntArray
+    normal: IntArray
+    active: npt.NDArray[np.bool_]
+
+    @staticmethod
+    def start(matches: int, players: int) -> "_WorkingSet":
+        """Create the working set of matches at the start.
+
+        Args:
+            matches (int): Number of matches.
+            players (int): Number of players.
+
+        Returns:
+            _WorkingSet: The working set.
+
+        """
+        shape = (matches, players)
+        return _WorkingSet(
+            ids=np.arange(matches),
+            answers=np.zeros(shape, dtype=np.int64),
+            misses=np.zeros(shape, dtype=np.int64),
+            states=np.full(shape, _NORMAL, dtype=np.int8),
+            lengths=np.zeros(matches, dtype=np.int64),
+            winners=np.zeros(matches, dtype=np.int64),
+            normal=np.full(matches, players, dtype=np.int64),
+            active=np.ones(matches, dtype=np.bool_),
+        )
+
+    def flush(
+        self,
+        answers: IntArray,
+        misses: IntArray,
+        states: StateArray,
+        lengths: IntArray,
+    ) -> "_WorkingSet":
+        """Write the finished matches to the outputs and drop them.
+
+        Args:
+            answers (IntArray): Output answers of all matches.
+            misses (IntArray): Output misses of all matches.
+            states (StateArray): Output states of all matches.
+            lengths (IntArray): Output lengths of all matches.
+
+        Returns:
+            _WorkingSet: The working set of the running matches.
+
+        """
+        done = ~self.active
+        ids = self.ids[done]
+        answers[ids] = self.answers[done]
+        misses[ids] = self.misses[done]
+        states[ids] = self.states[done]
+        lengths[ids] = self.lengths[done]
+
+        active = self.active
+        return _WorkingSet(
+            *(getattr(self, field.name)[active] for field in dataclasses.fields(self))
+        )
+
+
+def simulate_batch(
+    config: MatchConfig,
+    matches: int,
+    rng: np.random.Generator,
+    *,
+    trace: bool = False,
+) -> SimulationBatch:
+    """Simulate a batch of matches at once.
+
+    Every question is played for all unfinished matches together, so the
+    work per question is a few array operations over (matches, players).
+
+    Args:
+        config (MatchConfig): The match to simulate.
+        matches (int): Number of matches.
+        rng (np.random.Generator): The random generator.
+        trace (bool): Whether to record the payload of each question.
+            Default is False.
+
+    Returns:
+        SimulationBatch: The final states of the matches.
+
+    """
+    shape = (matches, config.num_players)
+    buzz = np.asarray(config.buzz, dtype=np.float32)
+    accuracy = np.asarray(config.accuracy, dtype=np.float32)
+    inverse_buzz = np.divide(1.0, buzz, out=np.zeros_like(buzz), where=buzz > 0)
+    answers = np.zeros(shape, dtype=np.int64)
+    misses = np.zeros(shape, dtype=np.int64)
+    states = np.full(shape, _NORMAL, dtype=np.int8)
+    lengths = np.zeros(matches, dtype=np.int64)
+    capped = np.zeros(matches, dtype=np.bool_)
+    words = np.zeros((config.question_cap, matches), dtype=np.uint32) if trace else None
+
+    # The working set holds the matches that may still be running. Finished
+    # matches stay in it, masked by `active`, until enough have piled up to
+    # be worth moving to the outputs.
+    work = _WorkingSet.start(matches, config.num_players)
+    for question in range(config.question_cap):
+        size = len(work.ids)
+        draws = rng.random(work.states.shape, dtype=np.float32)
+        pressed = (draws < buzz) & (work.states == _NORMAL) & work.active[:, None]
+        # A press draw below the buzz probability, scaled by it, is uniform,
+        # so the largest one picks one of the pressers uniformly.
+        first = np.where(pressed, draws * inverse_buzz, -1.0).argmax(axis=1)
+        rows = np.arange(size)
+        buzzed = pressed[rows, first]
+        right = buzzed & (rng.random(size, dtype=np.float32) < accuracy[first])
+        miss = buzzed & ~right
+
+        hit_rows, hit_columns = rows[right], first[right]
+        work.answers[hit_rows, hit_columns] += 1
+        won = work.answers[hit_rows, hit_columns] >= config.win_threshold
+        work.states[hit_rows[won], hit_columns[won]] = _WIN
+        np.add.at(work.winners, hit_rows[won], 1)
+
+        miss_rows, miss_columns = rows[miss], first[miss]
+        work.misses[miss_rows, miss_columns] += 1
+        lost = work.misses[miss_rows, miss_columns] >= config.lose_threshold
+        work.states[miss_rows[lost], miss_columns[lost]] = _LOSE
+
+        work.normal -= np.bincount(hit_rows[won], minlength=size)
+        work.normal -= np.bincount(miss_rows[lost], minlength=size)
+
+        if words is not None:
+            codes = np.where(right, _RIGHT_CODE, _MISS_CODE)
+            encoded = (first + 1) << TYPE_BITS | codes
+            words[question, work.ids] = np.where(buzzed, encoded, 0)
+
+        work.lengths += work.active
+        work.active &= (work.winners < config.seats) & (work.normal > 0)
+        if not work.active.any():
+            break
+        if np.count_nonzero(work.active) < size * 3 // 4:
+            work = work.flush(answers, misses, states, lengths)
+
+    capped[work.ids] = work.active
+    work.active[:] = False
+    work.flush(answers, misses, states, lengths)
+    return SimulationBatch(answers, misses, states, lengths, capped, words)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class SimulationSummary:
+    """The dataclass to store aggregated results of simulated matches.
+
+    Attributes:
+        matches (int): Number of matches.
+        wins (IntArray): Number of matches each player won.
+        losses (IntArray): Number of matches each player lost.
+        length_counts (IntArray): Number of matches by length; index ``q``
+            counts the matches that ended after ``q`` questions.
+        capped (int): Number of matches that hit the question cap.
+
+    """
+
+    matches: int
+    wins: IntArray
+    losses: IntArray
+    length_counts: IntArray
+    capped: int
+
+    @staticmethod
+    def from_batch(config: MatchConfig, batch: SimulationBatch) -> "SimulationSummary":
+        """Aggregate a batch of matches.
+
+        Args:
+            config (MatchConfig): The simulated match.
+            batch (SimulationBatch): The final states of the matches.
+
+        Returns:
+            SimulationSummary: The aggregated results.
+
+        """
+        return SimulationSummary(
+            matches=len(batch.lengths),
+            wins=(batch.states == _WIN).sum(axis=0),
+            losses=(batch.states == _LOSE).sum(axis=0),
+            length_counts=np.bincount(batch.lengths, minlength=config.question_cap + 1),
+            capped=int(batch.capped.sum()),
+        )
+
+    def merge(self, other: "SimulationSummary") -> "SimulationSummary":
+        """Combine the results of two sets of matches of the same config.
+
+        Args:
+            other (SimulationSummary): The other results.
+
+        Returns:
+            SimulationSummary: The combined results.
+
+        """
+        return SimulationSummary(
+            matches=self.matches + other.matches,
+            wins=self.wins + other.wins,
+            losses=self.losses + other.losses,
+            length_counts=self.length_counts + other.length_counts,
+            capped=self.capped + other.capped,
+        )
+
+    def win_probability(self) -> FloatArray:
+        """Get the probability that each player wins a seat.
+
+        Returns:
+            FloatArray: The probability of each player.
+
+        """
+        return self.wins / self.matches
+
+    def cap_rate(self) -> float:
+        """Get the fraction of matches that hit the question cap.
+
+        Returns:
+            float: The fraction of capped matches.
+
+        """
+        return self.capped / self.matches
+
+    def length_distribution(self) -> FloatArray:
+        """Get the distribution of match lengths.
+
+        Returns:
+            FloatArray: The probability that a match ends after ``q``
+                questions, at index ``q``.
+
+        """
+        return self.length_counts / self.matches
+
+    def mean_length(self) -> float:
+        """Get the mean number of questions of a match.
+
+        Returns:
+            float: The mean length.
+
+        """
+        lengths = np.arange(len(self.length_counts))
+        return float(lengths @ self.length_counts) / self.matches
+
+
+def _simulate_chunk(
+    config: MatchConfig, matches: int, seed: np.random.SeedSequence
+) -> SimulationSummary:
+    """Simulate and aggregate one chunk of matches in a worker.
+
+    Args:
+        config (MatchConfig): The match to simulate.
+        matches (int): Number of matches.
+        seed (np.random.SeedSequence): The seed of the chunk.
+
+    Returns:
+        SimulationSummary: The aggregated results of the chunk.
+
+    """
+    batch = simulate_batch(config, matches, np.random.default_rng(seed))
+    return SimulationSummary.from_batch(config, batch)
+
+
+def simulate(
+    config: MatchConfig,
+    matches: int,
+    seed: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = 100_000,
+) -> SimulationSummary:
+    """Simulate many matches, spread over a process pool.
+
+    The matches are split into chunks with independent random streams
+    spawned from ``seed``, so the results for a seed do not depend on the
+    number of workers.
+
+    Args:
+        config (MatchConfig): The match to simulate.
+        matches (int): Number of matches.
+        seed (int | None): The seed, or None for a random one. Default is None.
+        workers (int | None): Number of processes, or None for the number of
+            CPUs. With 1, the chunks run in this process. Default is None.
+        chunk_size (int): Matches per chunk. Default is 100,000.
+
+    Raises:
+        ValueError: If matches, workers or chunk_size is not positive.
+
+    Returns:
+        SimulationSummary: The aggregated results.
+
+    """
+    if matches <= 0:
+        raise ValueError("Number of matches must be positive.")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Number of workers must be positive.")
+
+    sizes = [
+        min(chunk_size, matches - start) for start in range(0, matches, chunk_size)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    configs = [config] * len(sizes)
+    if workers == 1 or len(sizes) == 1:
+        summaries = list(map(_simulate_chunk, configs, sizes, seeds))
+    else:
+        with ProcessPoolExecutor(min(workers, len(sizes))) as executor:
+            summaries = list(executor.map(_simulate_chunk, configs, sizes, seeds))
+
+    summary = summaries[0]
+    for other in summaries[1:]:
+        summary = summary.merge(other)
+    return summary
@@ -0,0 +1,416 @@
+import dataclasses
+import functools
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.operation.operation_base import OperationBase
+
+# Canonical state of a player: answers, misses, score, breaks and state
+# value. Players who are no longer NORMAL keep only their state, since the
+# rest no longer affects the match.
+type PlayerKey = tuple[int, int, int, int, int]
+type StateKey = tuple[PlayerKey, ...]
+type Probabilities = tuple[float, ...]
+
+_ANSWERS = 0
+_MISSES = 1
+_BREAKS = 3
+_STATE = 4
+_NORMAL = PlayerState.NORMAL.value
+_WIN = PlayerState.WIN.value
+
+
+@dataclasses.dataclass(frozen=True)
+class PlayerSkill:
+    """The dataclass to store the skill estimate of a player.
+
+    Attributes:
+        buzz (float): Probability that the player presses on a question.
+        accuracy (float): Probability that the player's answer is right.
+
+    """
+
+    buzz: float
+    accuracy: float
+
+    def __post_init__(self) -> None:
+        """Validate the skill.
+
+        Raises:
+            ValueError: If a probability is not between 0 and 1.
+
+        """
+        if not (0.0 <= self.buzz <= 1.0 and 0.0 <= self.accuracy <= 1.0):
+            raise ValueError("Probabilities must be between 0 and 1.")
+
+
+def _player_key(player: PlayerScore) -> PlayerKey:
+    """Get the canonical key of a player.
+
+    Args:
+        player (PlayerScore): The player.
+
+    Returns:
+        PlayerKey: The key.
+
+    """
+    if player.state is not PlayerState.NORMAL:
+        return (0, 0, 0, 0, player.state.value)
+    return (player.answers, player.misses, player.score, player.breaks, _NORMAL)
+
+
+@dataclasses.dataclass(slots=True)
+class _Frame:
+    """A state waiting for the probabilities of its next states.
+
+    Attributes:
+        key (StateKey): The key of the state.
+        moves (list[tuple[float, StateKey]]): Probability and key of each
+            next state.
+        finished (Probabilities): The probabilities if the match ends here.
+        totals (list[float]): Weighted sum of the next states seen so far.
+        normalizer (float): Probability that the state changes, which the
+            totals are divided by. Default is 1.0.
+        position (int): Index of the next state to add. Default is 0.
+
+    """
+
+    key: StateKey
+    moves: list[tuple[float, StateKey]]
+    finished: Probabilities
+    totals: list[float]
+    normalizer: float = 1.0
+    position: int = 0
+
+    def add(self, probabilities: Probabilities) -> None:
+        """Add the probabilities of the current next state.
+
+        Args:
+            probabilities (Probabilities): The probabilities of the state.
+
+        """
+        weight = self.moves[self.position][0]
+        for i, p in enumerate(probabilities):
+            self.totals[i] += weight * p
+        self.position += 1
+
+    def result(self) -> Probabilities:
+        """Get the probabilities once every next state is added.
+
+        Returns:
+            Probabilities: The probability of each player, by index.
+
+        """
+        if not self.moves:
+            return self.finished
+        return tuple(total / self.normalizer for total in self.totals)
+
+
+class _TransitionTable(dict[PlayerKey, PlayerKey]):
+    """Cache of the key of a player after an operation, by the key before."""
+
+    def __init__(self, apply: Callable[[ScoreboardState], ScoreboardState]) -> None:
+        """Initialize the table.
+
+        Args:
+            apply (Callable[[ScoreboardState], ScoreboardState]): Function
+                applying the operation to a one-player scoreboard.
+
+        """
+        super().__init__()
+        self.apply = apply
+
+    def __missing__(self, player: PlayerKey) -> PlayerKey:
+        """Apply the operation to a player seen for the first time.
+
+        Args:
+            player (PlayerKey): The key of the player before the operation.
+
+        Returns:
+            PlayerKey: The key of the player after the operation.
+
+        """
+        answers, misses, score, breaks, state = player
+        scoreboard = ScoreboardState(
+            [PlayerScore(0, "", answers, misses, score, breaks, PlayerState(state))]
+        )
+        result = self[player] = _player_key(self.apply(scoreboard)[0])
+        return result
+
+
+class WinProbabilityEngine:
+    """Class for computing exact win probabilities of a live match.
+
+    On each question every NORMAL player without breaks presses with their
+    buzz probability, one of the players who pressed, chosen uniformly,
+    answers, and the answer is right with their accuracy. The match ends
+    when ``seats`` players have won or no NORMAL player is left.
+
+    The rules come from the operation: what a right answer, a miss and a
+    through do to a player is found by applying the operation to a
+    one-player scoreboard, once per player state. This assumes that an
+    answer changes the other players only as a through would, which holds
+    for NoMxOperation and the compiled rule operations.
+
+    The probabilities of a state are computed from those of its next states
+    and memoized on a canonical key in an LRU cache. The states are walked
+    with an explicit stack, so long matches do not hit the recursion limit.
+    The state after a payload is one of the next states of the state before
+    it, so the update after a payload is usually a cache hit. Rules without
+    a lose threshold never end for a player who keeps missing, so a state
+    where a NORMAL player has made ``attempt_cap`` answers and misses is
+    scored as it stands. The number of states grows exponentially with the
+    roster and the cap, so the engine is meant for finals with a few
+    players.
+
+    Attributes:
+        operation (OperationBase): The operation with the rules of the match.
+        skills (tuple[PlayerSkill, ...]): Skill of each player, by index.
+        seats (int): Number of winners that ends the match.
+        attempt_cap (int): Answers and misses of a player after which the
+            state is scored as it stands.
+
+    """
+
+    def __init__(
+        self,
+        operation: OperationBase,
+        skills: Sequence[PlayerSkill],
+        seats: int = 1,
+        cache_size: int | None = 1 << 20,
+        attempt_cap: int = 32,
+    ) -> None:
+        """Initialize the WinProbabilityEngine.
+
+        Args:
+            operation (OperationBase): The operation with the rules.
+            skills (Sequence[PlayerSkill]): Skill of each player, by index.
+            seats (int): Number of winners that ends the match. Default is 1.
+            cache_size (int | None): Maximum number of memoized states, or
+                None for no limit. Default is 2**20.
+            attempt_cap (int): Answers and misses of a player after which
+                the state is scored as it stands. Rules with a lose
+                threshold below it are solved exactly. Default is 32.
+
+        Raises:
+            ValueError: If seats is not between 1 and the number of players,
+                or attempt_cap is not positive.
+
+        """
+        if not 1 <= seats <= len(skills):
+            raise ValueError("Seats must be between 1 and the number of players.")
+        if attempt_cap <= 0:
+            raise ValueError("Attempt cap must be positive.")
+
+        self.operation = operation
+        self.skills = tuple(skills)
+        self.seats = seats
+        self.attempt_cap = attempt_cap
+        self._right = _TransitionTable(
+            lambda scoreboard: operation.answer_right(scoreboard, 0)
+        )
+        self._miss = _TransitionTable(
+            lambda scoreboard: operation.make_miss(scoreboard, 0)
+        )
+        self._through = _TransitionTable(operation.through)
+        self._chances = functools.cache(self._answer_chances)
+        self._cache_size = cache_size
+        self._memo: OrderedDict[StateKey, Probabilities] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def win_probabilities(self, scoreboard: ScoreboardState) -> Probabilities:
+        """Compute the probability that each player wins.
+
+        Args:
+            scoreboard (ScoreboardState): The current scoreboard.
+
+        Returns:
+            Probabilities: The probability of each player, by index.
+
+        Raises:
+            ValueError: If the number of players does not match the skills.
+
+        """
+        if len(scoreboard) != len(self.skills):
+            raise ValueError("A skill must be given for each player.")
+        return self._solve(tuple(map(_player_key, scoreboard.players)))
+
+    def cache_info(self) -> "functools._CacheInfo":
+        """Get the statistics of the memo.
+
+        Returns:
+            functools._CacheInfo: Hits, misses and size of the memo.
+
+        """
+        return functools._CacheInfo(  # type: ignore[attr-defined]  # noqa: SLF001
+            self._hits, self._misses, self._cache_size, len(self._memo)
+        )
+
+    def clear_cache(self) -> None:
+        """Clear the memo, for example after the skills are re-estimated."""
+        self._memo.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _cached(self, key: StateKey) -> Probabilities | None:
+        """Get the memoized probabilities of a state.
+
+        Args:
+            key (StateKey): The key of the state.
+
+        Returns:
+            Probabilities | None: The probabilities, or None if the state is
+                not memoized.
+
+        """
+        probabilities = self._memo.get(key)
+        if probabilities is not None:
+            self._hits += 1
+            self._memo.move_to_end(key)
+        return probabilities
+
+    def _memoize(self, key: StateKey, probabilities: Probabilities) -> None:
+        """Memoize the probabilities of a state, evicting the oldest state.
+
+        Args:
+            key (StateKey): The key of the state.
+            probabilities (Probabilities): The probabilities of the state.
+
+        """
+        self._memo[key] = probabilities
+        if self._cache_size is not None and len(self._memo) > self._cache_size:
+            self._memo.popitem(last=False)
+
+    def _solve(self, key: StateKey) -> Probabilities:
+        """Compute the win probabilities of a state.
+
+        The next states are evaluated depth first with an explicit stack of
+        frames, and each finished frame adds its result to the frame below.
+
+        Args:
+            key (StateKey): The key of the state.
+
+        Returns:
+            Probabilities: The probability of each player, by index.
+
+        """
+        probabilities = self._cached(key)
+        if probabilities is not None:
+            return probabilities
+        memo = self._memo
+        stack = [self._expand(key)]
+        while True:
+            frame = stack[-1]
+            moves = frame.moves
+            totals = frame.totals
+            position = frame.position
+            # Next states that are already memoized are added in place.
+            while position < len(moves):
+                weight, next_key = moves[position]
+                probabilities = memo.get(next_key)
+                if probabilities is None:
+                    break
+                self._hits += 1
+                memo.move_to_end(next_key)
+                for i, p in enumerate(probabilities):
+                    totals[i] += weight * p
+                position += 1
+            frame.position = position
+            if position < len(moves):
+                stack.append(self._expand(moves[position][1]))
+                continue
+            stack.pop()
+            probabilities = frame.result()
+            self._memoize(frame.key, probabilities)
+            if not stack:
+                return probabilities
+            stack[-1].add(probabilities)
+
+    def _answer_chances(self, eligible: tuple[int, ...]) -> tuple[float, ...]:
+        """Get the probability that each eligible player answers.
+
+        A player answers if they press and win the uniform draw among the
+        players who pressed, so the chance is their buzz probability times
+        the expected value of 1 / (1 + number of other players who pressed).
+
+        Args:
+            eligible (tuple[int, ...]): Indices of the players who can press.
+
+        Returns:
+            tuple[float, ...]: The probability of each eligible player.
+
+        """
+        chances = []
+        for index in eligible:
+            # Distribution of the number of other players who press.
+            others = [1.0]
+            for other in eligible:
+                if other == index:
+                    continue
+                buzz = self.skills[other].buzz
+                others = [
+                    stay * (1.0 - buzz) + more * buzz
+                    for stay, more in zip([*others, 0.0], [0.0, *others], strict=True)
+                ]
+            share = sum(p / (count + 1) for count, p in enumerate(others))
+            chances.append(self.skills[index].buzz * share)
+        return tuple(chances)
+
+    def _expand(self, key: StateKey) -> _Frame:
+        """Find the next states of a state.
+
+        Args:
+            key (StateKey): The key of the state.
+
+        Returns:
+            _Frame: The state with its next states, or with none if the
+                match ends in it.
+
+        """
+        self._misses += 1
+        finished = tuple(float(player[_STATE] == _WIN) for player in key)
+        totals = [0.0] * len(key)
+        attempts = [
+            player[_ANSWERS] + player[_MISSES]
+            for player in key
+            if player[_STATE] == _NORMAL
+        ]
+        if (
+            sum(finished) >= self.seats
+            or not attempts
+            or max(attempts) >= self.attempt_cap
+        ):
+            return _Frame(key, [], finished, totals)
+
+        eligible = tuple(
+            i
+            for i, player in enumerate(key)
+            if player[_STATE] == _NORMAL and not player[_BREAKS]
+        )
+        through = tuple(map(self._through.__getitem__, key))
+        moves: list[tuple[float, StateKey]] = []
+        stay = 1.0
+        for index, chance in zip(eligible, self._chances(eligible), strict=True):
+            if chance == 0.0:
+                continue
+            stay -= chance
+            accuracy = self.skills[index].accuracy
+            before, player, after = through[:index], key[index], through[index + 1 :]
+            if accuracy > 0.0:
+                right = self._right[player]
+                moves.append((chance * accuracy, (*before, right, *after)))
+            if accuracy < 1.0:
+                miss = self._miss[player]
+                moves.append((chance * (1.0 - accuracy), (*before, miss, *after)))
+
+        if through != key:
+            moves.append((stay, through))
+            return _Frame(key, moves, finished, totals)
+        if stay < 1.0:
+            # Questions nobody answers leave the state as it is, so the other
+            # outcomes are renormalized.
+            return _Frame(key, moves, finished, totals, 1.0 - stay)
+        return _Frame(key, [], finished, totals)
@@ -0,0 +1,65 @@
+import pytest
+
+from reflex_scoreboard.buzzer.arbiter import BuzzArbiter, BuzzEvent
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+
+@pytest.fixture
+def prepare_arbiter() -> BuzzArbiter:
+    scoreboard = ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice"),
+            PlayerScore(player_id=2, name="Bob"),
+            PlayerScore(player_id=3, name="Carol", breaks=1),
+            PlayerScore(player_id=4, name="Dave", state=PlayerState.WIN),
+        ],
+    )
+    arbiter = BuzzArbiter(lambda: scoreboard, lockout_ns=100)
+    arbiter.open(1000)
+    return arbiter
+
+
+class TestBuzzArbiter:
+    @staticmethod
+    def test_invalid_lockout() -> None:
+        with pytest.raises(ValueError, match="Lockout must not be negative."):
+            BuzzArbiter(lambda: ScoreboardState(players=[]), lockout_ns=-1)
+
+    @staticmethod
+    def test_event_encoding() -> None:
+        event = BuzzEvent(index=3, pressed_ns=123_456_789)
+        assert BuzzEvent.decode(event.encode()) == event
+        assert len(event.encode()) == 12
+
+    @staticmethod
+    def test_earliest_press_wins(prepare_arbiter: BuzzArbiter) -> None:
+        assert prepare_arbiter.offer(BuzzEvent(index=1, pressed_ns=1020))
+        assert prepare_arbiter.offer(BuzzEvent(index=0, pressed_ns=1010))
+        assert prepare_arbiter.decide() == BuzzEvent(index=0, pressed_ns=1010)
+        assert not prepare_arbiter.is_open
+
+    @staticmethod
+    def test_ineligible_players(prepare_arbiter: BuzzArbiter) -> None:
+        assert not prepare_arbiter.offer(BuzzEvent(index=2, pressed_ns=1001))
+        assert not prepare_arbiter.offer(BuzzEvent(index=3, pressed_ns=1001))
+        assert not prepare_arbiter.offer(BuzzEvent(index=9, pressed_ns=1001))
+        assert prepare_arbiter.dropped["ineligible"] == 3
+        assert prepare_arbiter.decide() is None
+        assert prepare_arbiter.is_open
+
+    @staticmethod
+    def test_lockout(prepare_arbiter: BuzzArbiter) -> None:
+        assert not prepare_arbiter.offer(BuzzEvent(index=0, pressed_ns=950))
+        assert not prepare_arbiter.offer(BuzzEvent(index=0, pressed_ns=1040))
+        assert prepare_arbiter.dropped == {"closed": 1, "locked_out": 1}
+        assert prepare_arbiter.offer(BuzzEvent(index=0, pressed_ns=1050))
+
+    @staticmethod
+    def test_closed_after_decision(prepare_arbiter: BuzzArbiter) -> None:
+        prepare_arbiter.offer(BuzzEvent(index=0, pressed_ns=1010))
+        prepare_arbiter.decide()
+        assert not prepare_arbiter.offer(BuzzEvent(index=1, pressed_ns=1020))
+        prepare_arbiter.open(1030)
+        assert not prepare_arbiter.offer(BuzzEvent(index=1, pressed_ns=1100))
+        assert prepare_arbiter.offer(BuzzEvent(index=1, pressed_ns=1120))
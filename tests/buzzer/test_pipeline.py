@@ -0,0 +1,89 @@
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+from reflex_scoreboard.buzzer.arbiter import BuzzArbiter, BuzzEvent
+from reflex_scoreboard.buzzer.pipeline import BuzzerPipeline
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+
+def fake_buzzer(sock: socket.socket, presses: list[tuple[int, int]]) -> None:
+    """Send presses as (index, offset in ns) from now, then hang up."""
+    now_ns = time.monotonic_ns()
+    with sock:
+        for index, offset_ns in presses:
+            sock.sendall(BuzzEvent(index, now_ns + offset_ns).encode())
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice"),
+            PlayerScore(player_id=2, name="Bob"),
+            PlayerScore(player_id=3, name="Carol", breaks=1),
+        ],
+    )
+
+
+class TestBuzzerPipeline:
+    @staticmethod
+    def test_invalid_arguments(prepare_scoreboard_state: ScoreboardState) -> None:
+        arbiter = BuzzArbiter(lambda: prepare_scoreboard_state)
+        with pytest.raises(ValueError, match="Window must not be negative."):
+            BuzzerPipeline(arbiter, window_ns=-1)
+        with pytest.raises(ValueError, match="Queue capacities must be positive."):
+            BuzzerPipeline(arbiter, max_presses=0)
+
+    @staticmethod
+    def test_first_buzz(prepare_scoreboard_state: ScoreboardState) -> None:
+        lit: list[BuzzEvent] = []
+        pipeline = BuzzerPipeline(
+            BuzzArbiter(lambda: prepare_scoreboard_state),
+            window_ns=50_000_000,
+            indicator=lit.append,
+        )
+
+        async def run() -> None:
+            ours, theirs = socket.socketpair()
+            reader, writer = await asyncio.open_connection(sock=ours)
+            pipeline.open()
+            buzzer = threading.Thread(
+                target=fake_buzzer,
+                args=(theirs, [(1, 2_000_000), (2, 0), (0, 1_000_000)]),
+            )
+            buzzer.start()
+            await pipeline.run(reader)
+            buzzer.join()
+            writer.close()
+
+        asyncio.run(run())
+        assert pipeline.winners.qsize() == 1
+        winner = pipeline.winners.get_nowait()
+        assert winner.index == 0
+        assert lit == [winner]
+        assert pipeline.arbiter.dropped["ineligible"] == 1
+        assert pipeline.latency.snapshot().count == 1
+
+    @staticmethod
+    def test_backpressure(prepare_scoreboard_state: ScoreboardState) -> None:
+        pipeline = BuzzerPipeline(
+            BuzzArbiter(lambda: prepare_scoreboard_state), max_presses=1
+        )
+
+        async def run() -> None:
+            reader = asyncio.StreamReader()
+            for index in range(3):
+                reader.feed_data(BuzzEvent(index, index).encode())
+            reader.feed_eof()
+            task = asyncio.create_task(pipeline.read(reader))
+            await asyncio.sleep(0.01)
+            assert not task.done()
+            assert pipeline.presses.qsize() == 1
+            task.cancel()
+
+        asyncio.run(run())
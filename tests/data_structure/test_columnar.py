@@ -0,0 +1,150 @@
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.snapshot import encode_scoreboard
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+pytest.importorskip("numpy")
+
+from reflex_scoreboard.data_structure.columnar import ColumnarScoreboardState
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice"),
+            PlayerScore(player_id=2, name="Bob", answers=2, misses=1, breaks=2),
+            PlayerScore(player_id=3, name="Charlie", answers=2),
+        ],
+        question_count=4,
+    )
+
+
+class TestColumnarScoreboardState:
+    @staticmethod
+    def test_round_trip(prepare_scoreboard_state: ScoreboardState) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+
+        assert len(columnar) == 3
+        assert columnar[1] == prepare_scoreboard_state[1]
+        assert columnar.to_scoreboard() == prepare_scoreboard_state
+
+    @staticmethod
+    def test_create_from_players_dict() -> None:
+        columnar = ColumnarScoreboardState.create_from_players_dict(
+            {1: "Alice", 2: "Bob"}
+        )
+        assert columnar.to_scoreboard() == ScoreboardState.create_from_players_dict(
+            {1: "Alice", 2: "Bob"}
+        )
+
+    @staticmethod
+    def test_value_error() -> None:
+        columnar = ColumnarScoreboardState.create_from_players_dict({1: "Alice"})
+        with pytest.raises(ValueError, match="Question count must be at least 1."):
+            columnar.set_question_count(0)
+        with pytest.raises(ValueError, match="Columns must have the same length."):
+            ColumnarScoreboardState(
+                player_ids=columnar.player_ids,
+                names=(),
+                answers=columnar.answers,
+                misses=columnar.misses,
+                scores=columnar.scores,
+                breaks=columnar.breaks,
+                states=columnar.states,
+            )
+
+    @staticmethod
+    def test_get_item_out_of_range(prepare_scoreboard_state: ScoreboardState) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+        with pytest.raises(IndexError, match="Index out of range."):
+            _ = columnar[3]
+
+    @staticmethod
+    def test_updates_keep_previous_state(
+        prepare_scoreboard_state: ScoreboardState,
+    ) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+        updated = (
+            columnar.add_answer(0)
+            .add_miss(0)
+            .update_score(0, 10)
+            .set_breaks(0, 3)
+            .update_state(0, PlayerState.WIN)
+        )
+
+        assert updated[0] == PlayerScore(1, "Alice", 1, 1, 10, 3, PlayerState.WIN)
+        assert columnar[0] == prepare_scoreboard_state[0]
+
+    @staticmethod
+    def test_reduce_breaks_all(prepare_scoreboard_state: ScoreboardState) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+        assert (
+            columnar.reduce_breaks_all().to_scoreboard()
+            == prepare_scoreboard_state.reduce_breaks_all()
+        )
+
+    @staticmethod
+    def test_apply_thresholds(prepare_scoreboard_state: ScoreboardState) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+        updated = columnar.apply_thresholds(win_threshold=2, lose_threshold=1)
+
+        assert [updated[i].state for i in range(3)] == [
+            PlayerState.NORMAL,
+            PlayerState.WIN,
+            PlayerState.WIN,
+        ]
+
+    @staticmethod
+    def test_ranking(prepare_scoreboard_state: ScoreboardState) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(
+            prepare_scoreboard_state
+        ).update_state(0, PlayerState.WIN)
+        assert columnar.ranking().tolist() == [0, 2, 1]
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            Payload(PayloadType.RIGHT, extended_index=1),
+            Payload(PayloadType.MISS, extended_index=1),
+            Payload(PayloadType.THROUGH),
+        ],
+    )
+    def test_operation(
+        prepare_scoreboard_state: ScoreboardState, payload: Payload
+    ) -> None:
+        operation = NoMxOperation(win_threshold=3, lose_threshold=2)
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+
+        assert operation(columnar, payload).to_scoreboard() == operation(
+            prepare_scoreboard_state, payload
+        )
+
+    @staticmethod
+    def test_replace_player(prepare_scoreboard_state: ScoreboardState) -> None:
+        columnar = ColumnarScoreboardState.from_scoreboard(prepare_scoreboard_state)
+        new_player = PlayerScore(4, "Dave", 1, 2, 3, 0, PlayerState.LOSE)
+        updated = columnar.replace_player(1, new_player)
+
+        assert updated[1] == new_player
+        assert updated.to_scoreboard() == prepare_scoreboard_state.replace_player(
+            1, new_player
+        )
+        assert columnar[1] == prepare_scoreboard_state[1]
+        assert columnar.replace_player(0, columnar[0]) is columnar
+        with pytest.raises(IndexError, match="Index out of range."):
+            columnar.replace_player(3, new_player)
+
+    @staticmethod
+    def test_from_snapshot(prepare_scoreboard_state: ScoreboardState) -> None:
+        scoreboard = prepare_scoreboard_state.update_state(2, PlayerState.LOSE)
+        data = bytes(8) + encode_scoreboard(scoreboard)
+        columnar = ColumnarScoreboardState.from_snapshot(data, 8)
+
+        assert columnar == ColumnarScoreboardState.from_scoreboard(scoreboard)
+        assert not columnar.answers.flags.writeable
+        assert columnar.add_answer(0).to_scoreboard() == scoreboard.add_answer(0)
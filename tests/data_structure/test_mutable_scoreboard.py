@@ -0,0 +1,94 @@
+import pytest
+
+from reflex_scoreboard.data_structure.mutable_scoreboard import MutableScoreboard
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice"),
+            PlayerScore(player_id=2, name="Bob", breaks=2),
+        ]
+    )
+
+
+class TestMutableScoreboard:
+    @staticmethod
+    def test_updates_match_scoreboard_state(
+        prepare_scoreboard_state: ScoreboardState,
+    ) -> None:
+        scratch = MutableScoreboard(prepare_scoreboard_state)
+        result = (
+            scratch.add_answer(0)
+            .add_miss(1)
+            .update_score(0, 10)
+            .set_breaks(0, 1)
+            .update_state(1, PlayerState.LOSE)
+            .reduce_breaks_all()
+            .set_question_count(5)
+        )
+        expected = (
+            prepare_scoreboard_state.add_answer(0)
+            .add_miss(1)
+            .update_score(0, 10)
+            .set_breaks(0, 1)
+            .update_state(1, PlayerState.LOSE)
+            .reduce_breaks_all()
+            .set_question_count(5)
+        )
+
+        assert result is scratch
+        assert len(scratch) == 2
+        assert scratch[1] == expected[1]
+        assert scratch.freeze() == expected
+        assert prepare_scoreboard_state[0].answers == 0
+
+    @staticmethod
+    def test_freeze_shares_unchanged_players() -> None:
+        scoreboard = ScoreboardState.create_from_players_dict(
+            {player_id: f"Player {player_id}" for player_id in range(1000)}
+        )
+        frozen = MutableScoreboard(scoreboard).add_answer(500).freeze()
+
+        assert list(scoreboard.changed_indices(frozen)) == [500]
+        assert frozen[500].answers == 1
+
+    @staticmethod
+    def test_edit_bulk(prepare_scoreboard_state: ScoreboardState) -> None:
+        draft = prepare_scoreboard_state.edit()
+        draft.update_players(lambda player: player.set_breaks(3))
+        draft.update_players(lambda player: player.update_score(7), indices=[1])
+        draft.add_players([PlayerScore(3, "Charlie")])
+        frozen = draft.freeze()
+
+        assert [player.breaks for player in frozen.players] == [3, 3, 0]
+        assert frozen[1].score == 7
+        assert frozen.index_of(3) == 2
+        assert [player.breaks for player in prepare_scoreboard_state.players] == [0, 2]
+        # Editing after freezing does not change the frozen state.
+        draft.update_score(0, 5)
+        assert frozen[0].score == 0
+
+    @staticmethod
+    def test_freeze_unchanged(prepare_scoreboard_state: ScoreboardState) -> None:
+        draft = prepare_scoreboard_state.edit()
+        draft.update_players(lambda player: player)
+
+        assert draft.freeze() is prepare_scoreboard_state
+
+    @staticmethod
+    def test_add_duplicate_players(prepare_scoreboard_state: ScoreboardState) -> None:
+        draft = prepare_scoreboard_state.edit().add_players([PlayerScore(1, "Alice")])
+        with pytest.raises(ValueError, match="Players must be different."):
+            draft.freeze()
+
+    @staticmethod
+    def test_value_error(prepare_scoreboard_state: ScoreboardState) -> None:
+        scratch = MutableScoreboard(prepare_scoreboard_state)
+        with pytest.raises(IndexError, match="Index out of range."):
+            _ = scratch[2]
+        with pytest.raises(ValueError, match="Question count must be at least 1."):
+            scratch.set_question_count(0)
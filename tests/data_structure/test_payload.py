@@ -1,6 +1,6 @@
 import pytest
 
-from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.payload import INTERN_SIZE, Payload, PayloadType
 
 
 class TestPayload:
@@ -29,7 +29,7 @@ class TestPayload:
     )
     def test_value_error(payload_type: PayloadType, index: int | None) -> None:
         with pytest.raises(
-            ValueError, match="Index must be provided for RIGHT and MISS payloads."
+            ValueError, match="Index must be provided for payloads other than THROUGH."
         ):
             Payload(payload_type=payload_type, extended_index=index)
 
@@ -40,3 +40,42 @@ class TestPayload:
             ValueError, match="Index is not available for THROUGH payloads."
         ):
             _ = payload.index
+
+    @staticmethod
+    def test_of() -> None:
+        payload = Payload.of(PayloadType.RIGHT, 3)
+        assert payload == Payload(PayloadType.RIGHT, extended_index=3)
+        assert Payload.of(PayloadType.RIGHT, 3) is payload
+        assert Payload.of(PayloadType.MISS, 3) is not payload
+        assert Payload.of(PayloadType.THROUGH) is Payload.of(PayloadType.THROUGH)
+        with pytest.raises(
+            ValueError, match="Index must be provided for payloads other than THROUGH."
+        ):
+            Payload.of(PayloadType.MISS)
+
+    @staticmethod
+    def test_value() -> None:
+        payload = Payload.of(PayloadType.ADJUST, 1, value=-2)
+        assert payload.index == 1
+        assert payload.value == -2
+        assert Payload.of(PayloadType.ADJUST, 1, value=-2) is payload
+        assert Payload.of(PayloadType.ADJUST, 1, value=2) is not payload
+        with pytest.raises(
+            ValueError, match="Value must be provided for correction payloads."
+        ):
+            Payload.of(PayloadType.REST, 1)
+
+    @staticmethod
+    def test_of_is_bounded() -> None:
+        for value in range(3 * INTERN_SIZE):
+            Payload.of(PayloadType.ADJUST, 2**30, value=value)
+            assert len(Payload._interned) <= INTERN_SIZE  # noqa: SLF001
+        payload = Payload.of(PayloadType.RIGHT, 3)
+        assert Payload.of(PayloadType.RIGHT, 3) is payload
+        Payload._interned.clear()  # noqa: SLF001
+
+    @staticmethod
+    def test_frozen() -> None:
+        payload = Payload.of(PayloadType.RIGHT, 3)
+        with pytest.raises(AttributeError):
+            payload.extended_index = 4  # type: ignore[misc]
@@ -0,0 +1,89 @@
+import pytest
+
+from reflex_scoreboard.data_structure.payload import INTERN_SIZE, Payload, PayloadType
+from reflex_scoreboard.data_structure.payload_codec import (
+    _PAYLOAD_TABLE,
+    MAX_INDEX,
+    PAYLOAD_WIDTH,
+    decode_payload,
+    decode_payloads,
+    encode_payload,
+    encode_payloads,
+)
+
+
+@pytest.fixture
+def prepare_payloads() -> list[Payload]:
+    return [
+        Payload(PayloadType.RIGHT, extended_index=0),
+        Payload(PayloadType.MISS, extended_index=5),
+        Payload(PayloadType.THROUGH),
+        Payload(PayloadType.THROUGH, extended_index=2),
+        Payload(PayloadType.RIGHT, extended_index=MAX_INDEX),
+    ]
+
+
+class TestPayloadCodec:
+    @staticmethod
+    def test_round_trip(prepare_payloads: list[Payload]) -> None:
+        data = encode_payloads(prepare_payloads)
+        assert len(data) == PAYLOAD_WIDTH * len(prepare_payloads)
+        decoded = list(decode_payloads(data))
+        assert decoded == prepare_payloads
+
+    @staticmethod
+    def test_decoded_payloads_are_interned(prepare_payloads: list[Payload]) -> None:
+        data = encode_payloads(prepare_payloads * 2)
+        decoded = list(decode_payloads(memoryview(data)))
+        assert decoded[0] is Payload.of(PayloadType.RIGHT, 0)
+        for first, second in zip(
+            decoded[: len(prepare_payloads)],
+            decoded[len(prepare_payloads) :],
+            strict=True,
+        ):
+            assert first is second
+
+    @staticmethod
+    def test_table_is_bounded() -> None:
+        payloads = [
+            Payload(PayloadType.MISS, extended_index=index)
+            for index in range(MAX_INDEX - 3 * INTERN_SIZE, MAX_INDEX)
+        ]
+        decoded = list(decode_payloads(encode_payloads(payloads)))
+        assert decoded == payloads
+        assert len(_PAYLOAD_TABLE) <= INTERN_SIZE
+        assert len(Payload._interned) <= INTERN_SIZE  # noqa: SLF001
+        _PAYLOAD_TABLE.clear()
+        Payload._interned.clear()  # noqa: SLF001
+
+    @staticmethod
+    def test_little_endian() -> None:
+        payload = Payload(PayloadType.RIGHT, extended_index=1)
+        assert encode_payloads([payload]) == bytes([9, 0, 0, 0])
+        assert encode_payload(payload) == 9
+        assert decode_payload(9) is Payload.of(PayloadType.RIGHT, 1)
+
+    @staticmethod
+    def test_invalid_index() -> None:
+        with pytest.raises(ValueError, match="Index is out of the encodable range."):
+            encode_payload(Payload(PayloadType.RIGHT, extended_index=MAX_INDEX + 1))
+        with pytest.raises(ValueError, match="Index is out of the encodable range."):
+            encode_payload(Payload(PayloadType.RIGHT, extended_index=-1))
+
+    @staticmethod
+    def test_correction_is_not_encoded() -> None:
+        with pytest.raises(ValueError, match="Payload type cannot be encoded."):
+            encode_payload(Payload.of(PayloadType.ADJUST, 0, value=1))
+
+    @staticmethod
+    def test_invalid_data() -> None:
+        with pytest.raises(
+            ValueError, match="Data length must be a multiple of the payload width."
+        ):
+            decode_payloads(b"\x00\x00\x00")
+        with pytest.raises(ValueError, match="Unknown payload type code."):
+            list(decode_payloads(bytes([3, 0, 0, 0])))
+        with pytest.raises(
+            ValueError, match="Index must be provided for payloads other than THROUGH."
+        ):
+            decode_payload(1)
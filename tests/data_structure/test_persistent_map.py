@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from reflex_scoreboard.data_structure.persistent_map import PersistentMap
+
+# Integers that differ by the hash modulus have the same hash.
+HASH_MODULUS = 2**61 - 1
+
+
+class TestPersistentMap:
+    @staticmethod
+    @pytest.mark.parametrize("size", [0, 1, 32, 33, 1024, 1025, 40000])
+    def test_build(size: int) -> None:
+        mapping = PersistentMap((key, -key) for key in range(size))
+        assert len(mapping) == size
+        assert dict(mapping) == {key: -key for key in range(size)}
+        assert mapping.get(size) is None
+        assert size not in mapping
+        with pytest.raises(KeyError):
+            _ = mapping[size]
+
+    @staticmethod
+    def test_set_keeps_old_version() -> None:
+        mapping = PersistentMap({key: key for key in range(2000)})
+        updated = mapping.set(5, -1).set(2000, 2000)
+        assert updated[5] == -1
+        assert updated[2000] == 2000
+        assert len(updated) == 2001
+        assert mapping[5] == 5
+        assert 2000 not in mapping
+        assert len(mapping) == 2000
+
+    @staticmethod
+    def test_delete_keeps_old_version() -> None:
+        mapping = PersistentMap({key: key for key in range(100)})
+        deleted = mapping.delete(50)
+        assert 50 not in deleted
+        assert len(deleted) == 99
+        assert mapping[50] == 50
+        with pytest.raises(KeyError):
+            _ = deleted.delete(50)
+
+    @staticmethod
+    def test_random_updates() -> None:
+        rng = random.Random(0)  # noqa: S311
+        expected: dict[int, int] = {}
+        mapping: PersistentMap[int, int] = PersistentMap()
+        keys = [rng.randrange(-5000, 5000) for _ in range(20000)]
+        colliding = [7 + HASH_MODULUS * factor for factor in range(50)]
+        for value, key in enumerate([*keys, *colliding]):
+            if expected and value % 3 == 0:
+                removed = rng.choice(list(expected))
+                del expected[removed]
+                mapping = mapping.delete(removed)
+            expected[key] = value
+            mapping = mapping.set(key, value)
+        assert len(mapping) == len(expected)
+        assert dict(mapping) == expected
+
+    @staticmethod
+    def test_to_dict() -> None:
+        mapping = PersistentMap({key: str(key) for key in range(2000)})
+        copied = mapping.to_dict()
+        copied[0] = "changed"
+        assert mapping[0] == "0"
+        assert copied == {**{key: str(key) for key in range(2000)}, 0: "changed"}
@@ -0,0 +1,82 @@
+import pytest
+
+from reflex_scoreboard.data_structure.persistent_vector import PersistentVector
+
+
+class TestPersistentVector:
+    @staticmethod
+    @pytest.mark.parametrize("size", [0, 1, 32, 33, 1024, 1057, 40000])
+    def test_build(size: int) -> None:
+        vector = PersistentVector(range(size))
+        assert len(vector) == size
+        assert list(vector) == list(range(size))
+        if size:
+            assert vector[size - 1] == size - 1
+            assert vector[-1] == size - 1
+
+    @staticmethod
+    @pytest.mark.parametrize("size", [0, 31, 32, 1023, 1024, 1056, 33000])
+    def test_append(size: int) -> None:
+        vector = PersistentVector(range(size))
+        appended = vector.append(-1).append(-2)
+        assert list(appended) == [*range(size), -1, -2]
+        assert len(vector) == size
+
+    @staticmethod
+    def test_extend_from_empty() -> None:
+        vector = PersistentVector[int]().extend(range(2000))
+        assert list(vector) == list(range(2000))
+        assert vector == PersistentVector(range(2000))
+
+    @staticmethod
+    @pytest.mark.parametrize("index", [0, 31, 32, 500, 1023, 1099])
+    def test_set_keeps_old_version(index: int) -> None:
+        vector = PersistentVector(range(1100))
+        updated = vector.set(index, -1)
+        assert updated[index] == -1
+        assert vector[index] == index
+        assert list(updated) == [-1 if i == index else i for i in range(1100)]
+
+    @staticmethod
+    def test_index_error() -> None:
+        vector = PersistentVector(range(3))
+        with pytest.raises(IndexError, match="Index out of range."):
+            _ = vector[3]
+        with pytest.raises(IndexError, match="Index out of range."):
+            _ = vector.set(-4, 0)
+
+    @staticmethod
+    def test_slice() -> None:
+        vector = PersistentVector(range(100))
+        assert list(vector[10:20]) == list(range(10, 20))
+
+    @staticmethod
+    def test_equality() -> None:
+        vector = PersistentVector([1, 2, 3])
+        assert vector == PersistentVector([1, 2, 3])
+        assert vector == [1, 2, 3]
+        assert vector == (1, 2, 3)
+        assert vector != [1, 2]
+        assert vector != PersistentVector([1, 2, 4])
+        assert hash(vector) == hash(PersistentVector([1, 2, 3]))
+
+    @staticmethod
+    @pytest.mark.parametrize("size", [5, 40, 2000])
+    def test_diff(size: int) -> None:
+        vector = PersistentVector(range(size))
+        indices = sorted({0, size // 2, size - 1})
+        updated = vector
+        for index in indices:
+            updated = updated.set(index, -1)
+        assert list(vector.diff(updated)) == indices
+        assert not list(vector.diff(vector))
+        fresh = PersistentVector(object() for _ in range(size))
+        assert list(fresh.diff(PersistentVector(fresh))) == []
+        assert list(fresh.diff(PersistentVector(object() for _ in range(size)))) == (
+            list(range(size))
+        )
+
+    @staticmethod
+    def test_diff_value_error() -> None:
+        with pytest.raises(ValueError, match="Vectors must have the same length."):
+            _ = list(PersistentVector(range(3)).diff(PersistentVector(range(4))))
@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
@@ -100,3 +102,40 @@ class TestPlayerScore:
         assert updated_player.score == 0
         assert updated_player.breaks == 0
         assert updated_player.state == PlayerState.WIN
+
+    @staticmethod
+    def test_slots() -> None:
+        player = PlayerScore(player_id=1, name="Alice")
+        assert not hasattr(player, "__dict__")
+
+    @staticmethod
+    def test_copies_match_replace() -> None:
+        player = PlayerScore(
+            player_id=1, name="Alice", answers=2, misses=1, score=3, breaks=1
+        )
+        assert player.add_answer() == dataclasses.replace(player, answers=3)
+        assert player.add_miss() == dataclasses.replace(player, misses=2)
+        assert player.update_score(7) == dataclasses.replace(player, score=7)
+        assert player.set_breaks(0) == dataclasses.replace(player, breaks=0)
+        assert player.update_state(PlayerState.WIN) == dataclasses.replace(
+            player, state=PlayerState.WIN
+        )
+        updated = player.add_answer()
+        assert hash(updated) == hash(dataclasses.replace(player, answers=3))
+        with pytest.raises(AttributeError):
+            updated.answers = 0  # type: ignore[misc]
+
+    @staticmethod
+    def test_with_results() -> None:
+        player = PlayerScore(player_id=1, name="Alice", answers=2, misses=1)
+        updated = player.with_results(3, 2, 5, 1, PlayerState.WIN)
+        assert updated == PlayerScore(
+            player_id=1,
+            name="Alice",
+            answers=3,
+            misses=2,
+            score=5,
+            breaks=1,
+            state=PlayerState.WIN,
+        )
+        assert player.answers == 2
@@ -83,3 +83,109 @@ class TestScoreboardState:
         assert updated_scoreboard[0].name == "Charlie"
         assert updated_scoreboard[1].player_id == 2
         assert updated_scoreboard[1].name == "Bob"
+
+    @staticmethod
+    def test_updates_keep_previous_state(
+        prepare_scoreboard_state: ScoreboardState,
+    ) -> None:
+        updated_scoreboard = (
+            prepare_scoreboard_state.add_answer(0)
+            .add_miss(1)
+            .add_players([PlayerScore(player_id=3, name="Charlie")])
+        )
+
+        assert len(prepare_scoreboard_state) == 2
+        assert prepare_scoreboard_state[0].answers == 0
+        assert prepare_scoreboard_state[1].misses == 0
+        assert len(updated_scoreboard) == 3
+        assert updated_scoreboard[0].answers == 1
+        assert updated_scoreboard[1].misses == 1
+
+    @staticmethod
+    def test_reduce_breaks_all(prepare_scoreboard_state: ScoreboardState) -> None:
+        current_scoreboard = prepare_scoreboard_state.set_breaks(0, 2)
+        updated_scoreboard = current_scoreboard.reduce_breaks_all()
+
+        assert updated_scoreboard[0].breaks == 1
+        assert updated_scoreboard[1].breaks == 0
+        assert updated_scoreboard[1] is current_scoreboard[1]
+        assert current_scoreboard[0].breaks == 2
+
+    @staticmethod
+    def test_index_of(prepare_scoreboard_state: ScoreboardState) -> None:
+        assert prepare_scoreboard_state.index_of(2) == 1
+        assert prepare_scoreboard_state.get_player(1).name == "Alice"
+        with pytest.raises(KeyError, match="Player not found."):
+            prepare_scoreboard_state.index_of(3)
+
+    @staticmethod
+    def test_contains_player(prepare_scoreboard_state: ScoreboardState) -> None:
+        assert prepare_scoreboard_state.contains_player(
+            PlayerScore(player_id=1, name="Alice", answers=3)
+        )
+        assert not prepare_scoreboard_state.contains_player(
+            PlayerScore(player_id=1, name="Bob")
+        )
+
+    @staticmethod
+    def test_player_index_is_shared(prepare_scoreboard_state: ScoreboardState) -> None:
+        updated_scoreboard = prepare_scoreboard_state.add_answer(0).add_miss(1)
+        assert updated_scoreboard.player_index is prepare_scoreboard_state.player_index
+
+    @staticmethod
+    def test_player_index_after_replace(
+        prepare_scoreboard_state: ScoreboardState,
+    ) -> None:
+        updated_scoreboard = prepare_scoreboard_state.replace_player(
+            0, PlayerScore(player_id=3, name="Charlie")
+        )
+        assert updated_scoreboard.index_of(3) == 0
+        with pytest.raises(KeyError, match="Player not found."):
+            updated_scoreboard.index_of(1)
+        assert prepare_scoreboard_state.index_of(1) == 0
+
+    @staticmethod
+    def test_player_index_with_shared_ids() -> None:
+        scoreboard = ScoreboardState(
+            [
+                PlayerScore(player_id=1, name="Alice"),
+                PlayerScore(player_id=2, name="Bob"),
+                PlayerScore(player_id=1, name="Carol"),
+            ]
+        )
+        renamed = scoreboard.replace_player(0, PlayerScore(player_id=3, name="Alice"))
+        assert renamed.index_of(1) == 2
+        assert renamed.index_of(3) == 0
+        assert renamed.contains_player(PlayerScore(player_id=3, name="Alice"))
+        assert not renamed.contains_player(PlayerScore(player_id=1, name="Alice"))
+
+        restored = renamed.replace_player(0, PlayerScore(player_id=1, name="Alice"))
+        assert restored.index_of(1) == 0
+        with pytest.raises(KeyError, match="Player not found."):
+            restored.index_of(3)
+        with pytest.raises(ValueError, match="Players must be different."):
+            restored.replace_player(0, PlayerScore(player_id=2, name="Bob"))
+
+    @staticmethod
+    def test_add_players_index(prepare_scoreboard_state: ScoreboardState) -> None:
+        new_players = [
+            PlayerScore(player_id=player_id, name=f"Player {player_id}")
+            for player_id in range(3, 5003)
+        ]
+        updated_scoreboard = prepare_scoreboard_state.add_players(new_players)
+
+        assert len(updated_scoreboard) == 5002
+        assert updated_scoreboard.index_of(5002) == 5001
+        assert updated_scoreboard[5001] == new_players[-1]
+        with pytest.raises(KeyError, match="Player not found."):
+            prepare_scoreboard_state.index_of(3)
+
+    @staticmethod
+    def test_duplicate_players_in_new_players(
+        prepare_scoreboard_state: ScoreboardState,
+    ) -> None:
+        player3 = PlayerScore(player_id=3, name="Charlie")
+        with pytest.raises(ValueError, match="Players must be different."):
+            _ = prepare_scoreboard_state.add_players([player3, player3])
+        with pytest.raises(ValueError, match="Players must be different."):
+            _ = ScoreboardState([player3, player3])
@@ -0,0 +1,66 @@
+import pytest
+
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.data_structure.snapshot import (
+    SNAPSHOT_HEADER,
+    SnapshotLayout,
+    decode_scoreboard,
+    encode_scoreboard,
+)
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice", answers=5, state=PlayerState.WIN),
+            PlayerScore(player_id=2, name="ボブ", misses=2, state=PlayerState.LOSE),
+            PlayerScore(player_id=2, name="Charlie", score=-3, breaks=1),
+            PlayerScore(player_id=4, name=""),
+        ],
+        question_count=9,
+    )
+
+
+class TestSnapshot:
+    @staticmethod
+    def test_round_trip(prepare_scoreboard_state: ScoreboardState) -> None:
+        data = encode_scoreboard(prepare_scoreboard_state)
+        decoded = decode_scoreboard(data)
+
+        assert decoded == prepare_scoreboard_state
+        assert decoded.question_count == 9
+        assert decoded.index_of(2) == 1
+        assert decoded.contains_player(prepare_scoreboard_state[2])
+        assert SnapshotLayout.read(data).size == len(data)
+
+    @staticmethod
+    def test_empty() -> None:
+        assert decode_scoreboard(encode_scoreboard(ScoreboardState([]))) == (
+            ScoreboardState([])
+        )
+
+    @staticmethod
+    def test_offset(prepare_scoreboard_state: ScoreboardState) -> None:
+        data = bytes(8) + encode_scoreboard(prepare_scoreboard_state)
+        assert decode_scoreboard(memoryview(data), 8) == prepare_scoreboard_state
+
+    @staticmethod
+    def test_value_error(prepare_scoreboard_state: ScoreboardState) -> None:
+        data = encode_scoreboard(prepare_scoreboard_state)
+        with pytest.raises(ValueError, match="Snapshot is truncated."):
+            decode_scoreboard(data[: SNAPSHOT_HEADER.size - 1])
+        with pytest.raises(ValueError, match="Snapshot is truncated."):
+            decode_scoreboard(data[:-1])
+        with pytest.raises(ValueError, match="Data is not a scoreboard snapshot."):
+            decode_scoreboard(b"XXXX" + data[4:])
+        with pytest.raises(ValueError, match="Snapshot version is not supported."):
+            decode_scoreboard(data[:4] + b"\x09\x00" + data[6:])
+
+    @staticmethod
+    def test_invalid_state(prepare_scoreboard_state: ScoreboardState) -> None:
+        data = bytearray(encode_scoreboard(prepare_scoreboard_state))
+        data[SnapshotLayout.read(data).states + 1] = 9
+        with pytest.raises(ValueError, match="Snapshot has an invalid player state."):
+            decode_scoreboard(data)
@@ -0,0 +1,283 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.broadcast import Broadcaster, Frame, encode_frame
+from reflex_scoreboard.manager.broadcast_server import serve_broadcast
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_score_manager() -> ScoreManager:
+    scoreboard = ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})
+    return ScoreManager(scoreboard, NoMxOperation(win_threshold=5, lose_threshold=2))
+
+
+def decode(frame: Frame) -> tuple[int, str, dict[str, object]]:
+    """Split an SSE message into its sequence, event name and JSON data."""
+    fields = dict(
+        line.split(": ", 1) for line in frame.data.decode().splitlines() if line
+    )
+    sequence = int(fields["id"].rpartition("-")[2])
+    return sequence, fields["event"], json.loads(fields["data"])
+
+
+class TestBroadcaster:
+    @staticmethod
+    def test_encode_frame(prepare_score_manager: ScoreManager) -> None:
+        previous = prepare_score_manager.scoreboard
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 1))
+        current = prepare_score_manager.scoreboard
+
+        full = encode_frame(3, None, current)
+        assert full.full
+        assert decode(full)[:2] == (3, "full")
+        assert decode(full)[2]["players"][1]["answers"] == 1  # type: ignore[index]
+        patch = encode_frame(4, previous, current)
+        assert not patch.full
+        assert decode(patch) == (
+            4,
+            "patch",
+            {"version": 4, "question_count": 2, "patches": [[1, "answers", 1]]},
+        )
+        assert patch.data.startswith(b"id: 4\n")
+        assert encode_frame(4, previous, current, "abc").data.startswith(b"id: abc-4\n")
+
+    @staticmethod
+    def test_invalid_capacity(prepare_score_manager: ScoreManager) -> None:
+        with pytest.raises(ValueError, match="Capacity must be positive."):
+            Broadcaster(prepare_score_manager.scoreboard, capacity=0)
+
+    @staticmethod
+    def test_encoded_once(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        subscriptions = [broadcaster.subscribe(0) for _ in range(3)]
+        prepare_score_manager(Payload.of(PayloadType.MISS, 0))
+
+        frames = [subscription.poll(0) for subscription in subscriptions]
+        assert all(received[0] is frames[0][0] for received in frames)
+        assert broadcaster.sequence == 1
+        assert all(subscription.sequence == 1 for subscription in subscriptions)
+
+    @staticmethod
+    def test_new_client(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        first, second = broadcaster.subscribe(), broadcaster.subscribe()
+
+        frame = first.poll(0)[0]
+        assert frame.full
+        assert frame.sequence == 1
+        assert second.poll(0)[0] is frame
+        assert not first.poll(0)
+
+    @staticmethod
+    def test_slow_client(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager, capacity=4)
+        slow, fast = broadcaster.subscribe(0), broadcaster.subscribe(0)
+        for _ in range(3):
+            prepare_score_manager(Payload.of(PayloadType.THROUGH))
+        assert [frame.sequence for frame in fast.poll(0)] == [1, 2, 3]
+        for _ in range(3):
+            prepare_score_manager(Payload.of(PayloadType.THROUGH))
+
+        frames = slow.poll(0)
+        assert [(frame.sequence, frame.full) for frame in frames] == [(6, True)]
+        assert slow.resyncs == 1
+        assert [frame.sequence for frame in fast.poll(0)] == [4, 5, 6]
+        assert fast.resyncs == 0
+
+    @staticmethod
+    def test_undo_and_roster_change(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        subscription = broadcaster.subscribe(0)
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        prepare_score_manager.undo()
+        with prepare_score_manager.edit() as draft:
+            draft.add_players([PlayerScore(3, "Carol")])
+
+        frames = subscription.poll(0)
+        assert [frame.full for frame in frames] == [False, False, True]
+        assert decode(frames[1])[2]["patches"] == [[0, "answers", 0]]
+        assert len(decode(frames[2])[2]["players"]) == 3  # type: ignore[arg-type]
+
+    @staticmethod
+    def test_poll_timeout_and_close(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster(prepare_score_manager.scoreboard)
+        subscription = broadcaster.subscribe(0)
+        assert not subscription.poll(0.01)
+
+        results: list[list[Frame]] = []
+        waiter = threading.Thread(target=lambda: results.append(subscription.poll()))
+        waiter.start()
+        broadcaster.close()
+        waiter.join(5)
+
+        assert results == [[]]
+        assert broadcaster.closed
+
+    @staticmethod
+    def test_follow_uses_version(prepare_score_manager: ScoreManager) -> None:
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        prepare_score_manager.undo()
+
+        assert broadcaster.sequence == prepare_score_manager.version == 2
+
+    @staticmethod
+    def test_parse_event_id(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        frame = broadcaster.subscribe().poll(0)[0]
+        last_event_id = frame.data.decode().splitlines()[0].removeprefix("id: ")
+
+        assert broadcaster.parse_event_id(last_event_id) == 1
+        assert broadcaster.parse_event_id("1") is None
+        assert broadcaster.parse_event_id("0123abcd-1") is None
+        assert broadcaster.parse_event_id(f"{broadcaster.run_id}-x") is None
+        # A client of an earlier run is new, even at the same sequence.
+        restarted = Broadcaster(prepare_score_manager.scoreboard, sequence=1)
+        assert restarted.parse_event_id(last_event_id) is None
+
+    @staticmethod
+    def test_state_document(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        document = broadcaster.state_document()
+        assert broadcaster.state_document() is document
+        assert json.loads(document.body)["version"] == 0
+        assert document.body in broadcaster.full_frame().data
+
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        changed = broadcaster.state_document()
+        assert changed.sequence == 1
+        assert changed.etag != document.etag
+        assert Broadcaster(prepare_score_manager.scoreboard).state_document().etag != (
+            Broadcaster(prepare_score_manager.scoreboard).state_document().etag
+        )
+
+
+def get_state(
+    port: int, path: str, headers: dict[str, str] | None = None
+) -> tuple[int, str | None, bytes]:
+    """Send one GET request and return the status, ETag and body."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("ETag"), response.read()
+    finally:
+        connection.close()
+
+
+class TestServeBroadcast:
+    @staticmethod
+    def test_events(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        server = serve_broadcast(broadcaster)
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        try:
+            connection.request("GET", "/events")
+            response = connection.getresponse()
+            first = [response.readline() for _ in range(4)]
+            prepare_score_manager(Payload.of(PayloadType.RIGHT, 1))
+            second = [response.readline() for _ in range(4)]
+        finally:
+            broadcaster.close()
+            connection.close()
+            server.shutdown()
+            server.server_close()
+
+        run_id = broadcaster.run_id.encode()
+        assert response.getheader("Content-Type") == "text/event-stream"
+        assert first[:2] == [b"id: " + run_id + b"-0\n", b"event: full\n"]
+        assert second == [
+            b"id: " + run_id + b"-1\n",
+            b"event: patch\n",
+            b'data: {"version":1,"question_count":2,"patches":[[1,"answers",1]]}\n',
+            b"\n",
+        ]
+
+    @staticmethod
+    def test_reconnect_from_other_run(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        server = serve_broadcast(broadcaster)
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        try:
+            connection.request("GET", "/events", headers={"Last-Event-ID": "0"})
+            response = connection.getresponse()
+            first = [response.readline() for _ in range(2)]
+        finally:
+            broadcaster.close()
+            connection.close()
+            server.shutdown()
+            server.server_close()
+
+        assert first == [
+            b"id: " + broadcaster.run_id.encode() + b"-0\n",
+            b"event: full\n",
+        ]
+
+    @staticmethod
+    def test_not_found(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster(prepare_score_manager.scoreboard)
+        server = serve_broadcast(broadcaster)
+        connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1])
+        try:
+            connection.request("GET", "/missing")
+            status = connection.getresponse().status
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+
+        assert status == http.client.NOT_FOUND
+
+    @staticmethod
+    def test_state(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        server = serve_broadcast(broadcaster)
+        port = server.server_address[1]
+        try:
+            status, etag, body = get_state(port, "/state")
+            unchanged = get_state(port, "/state", {"If-None-Match": etag or ""})
+            prepare_score_manager(Payload.of(PayloadType.MISS, 1))
+            changed = get_state(port, "/state", {"If-None-Match": etag or ""})
+            invalid = get_state(port, "/state?after=x")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert status == http.client.OK
+        assert json.loads(body)["players"][0]["name"] == "Alice"
+        assert unchanged == (http.client.NOT_MODIFIED, etag, b"")
+        assert changed[0] == http.client.OK
+        assert json.loads(changed[2])["version"] == 1
+        assert invalid[0] == http.client.BAD_REQUEST
+
+    @staticmethod
+    def test_long_poll(prepare_score_manager: ScoreManager) -> None:
+        broadcaster = Broadcaster.follow(prepare_score_manager)
+        server = serve_broadcast(broadcaster)
+        port = server.server_address[1]
+        results: list[tuple[int, str | None, bytes]] = []
+        poller = threading.Thread(
+            target=lambda: results.append(get_state(port, "/state?after=0"))
+        )
+        try:
+            timed_out = get_state(port, "/state?after=0&timeout=0.01")
+            poller.start()
+            prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+            poller.join(5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert timed_out[0] == http.client.NOT_MODIFIED
+        assert results[0][0] == http.client.OK
+        assert json.loads(results[0][2])["version"] == 1
@@ -0,0 +1,166 @@
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.delta_journal import (
+    DeltaJournal,
+    FieldChange,
+    PlayerDelta,
+    diff_players,
+)
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+PAYLOADS = [
+    Payload(PayloadType.RIGHT, extended_index=0),
+    Payload(PayloadType.MISS, extended_index=1),
+    Payload(PayloadType.THROUGH),
+    Payload(PayloadType.RIGHT, extended_index=0),
+    Payload(PayloadType.MISS, extended_index=1),
+    Payload(PayloadType.RIGHT, extended_index=1),
+]
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice"),
+            PlayerScore(player_id=2, name="Bob"),
+            PlayerScore(player_id=3, name="Charlie"),
+        ]
+    )
+
+
+class TestDeltaJournal:
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("max_depth", "checkpoint_interval", "message"),
+        [
+            (0, 1, "Max depth must be positive."),
+            (None, 0, "Checkpoint interval must be positive."),
+        ],
+    )
+    def test_value_error(
+        max_depth: int | None, checkpoint_interval: int, message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=message):
+            DeltaJournal(max_depth=max_depth, checkpoint_interval=checkpoint_interval)
+
+    @staticmethod
+    def test_diff_players(prepare_scoreboard_state: ScoreboardState) -> None:
+        updated_scoreboard = prepare_scoreboard_state.add_miss(1).update_state(
+            1, PlayerState.LOSE
+        )
+        assert diff_players(prepare_scoreboard_state, updated_scoreboard) == (
+            PlayerDelta(
+                1,
+                (
+                    FieldChange("misses", 0, 1),
+                    FieldChange("state", PlayerState.NORMAL, PlayerState.LOSE),
+                ),
+            ),
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("checkpoint_interval", [1, 2, 100])
+    def test_matches_snapshot_history(
+        prepare_scoreboard_state: ScoreboardState, checkpoint_interval: int
+    ) -> None:
+        operation = NoMxOperation(win_threshold=2, lose_threshold=2)
+        manager = ScoreManager(
+            prepare_scoreboard_state,
+            operation,
+            journal=DeltaJournal(checkpoint_interval=checkpoint_interval),
+        )
+        history = [manager.scoreboard]
+        for payload in PAYLOADS:
+            manager(payload)
+            history.append(manager.scoreboard)
+        assert not manager.undo_stack
+
+        for expected in reversed(history[:-1]):
+            manager.undo()
+            assert manager.scoreboard == expected
+        manager.undo()
+        assert manager.scoreboard == history[0]
+
+        for expected in history[1:]:
+            manager.redo()
+            assert manager.scoreboard == expected
+        manager.redo()
+        assert manager.scoreboard == history[-1]
+
+    @staticmethod
+    def test_record_clears_redo(prepare_scoreboard_state: ScoreboardState) -> None:
+        journal = DeltaJournal()
+        manager = ScoreManager(
+            prepare_scoreboard_state, NoMxOperation(5, 2), journal=journal
+        )
+        manager(PAYLOADS[0])
+        manager.undo()
+        assert len(journal.redo_entries) == 1
+        manager(PAYLOADS[1])
+        assert not journal.redo_entries
+
+    @staticmethod
+    def test_max_depth(prepare_scoreboard_state: ScoreboardState) -> None:
+        journal = DeltaJournal(max_depth=2)
+        manager = ScoreManager(
+            prepare_scoreboard_state, NoMxOperation(5, 2), journal=journal
+        )
+        for payload in PAYLOADS[:4]:
+            manager(payload)
+        assert len(journal.undo_entries) == 2
+        for _ in range(4):
+            manager.undo()
+        assert manager.scoreboard.question_count == 3
+        assert manager.scoreboard[0].answers == 1
+
+    @staticmethod
+    def test_roster_change(prepare_scoreboard_state: ScoreboardState) -> None:
+        journal = DeltaJournal(checkpoint_interval=100)
+        journal.record(ScoreboardState([]), prepare_scoreboard_state)
+        journal.record(prepare_scoreboard_state, prepare_scoreboard_state.add_answer(0))
+        assert journal.undo(prepare_scoreboard_state.add_answer(0)) == (
+            prepare_scoreboard_state
+        )
+        assert journal.undo(prepare_scoreboard_state) == ScoreboardState([])
+        assert journal.redo(ScoreboardState([])) == prepare_scoreboard_state
+
+    @staticmethod
+    def test_memory_report(prepare_scoreboard_state: ScoreboardState) -> None:
+        journal = DeltaJournal(checkpoint_interval=4)
+        manager = ScoreManager(
+            prepare_scoreboard_state, NoMxOperation(5, 2), journal=journal
+        )
+        for payload in PAYLOADS:
+            manager(payload)
+        manager.undo()
+        report = journal.memory_report()
+
+        assert report.undo_entries == 5
+        assert report.redo_entries == 1
+        assert report.checkpoints == 2
+        assert report.field_changes == 6
+        assert report.delta_bytes > 0
+
+    @staticmethod
+    def test_timeline(prepare_scoreboard_state: ScoreboardState) -> None:
+        journal = DeltaJournal(checkpoint_interval=2)
+        manager = ScoreManager(
+            prepare_scoreboard_state,
+            NoMxOperation(win_threshold=5, lose_threshold=2),
+            journal,
+        )
+        states = [manager.scoreboard]
+        for payload in PAYLOADS:
+            manager(payload)
+            states.append(manager.scoreboard)
+        manager.undo()
+        manager.undo()
+
+        assert journal.timeline(manager.scoreboard) == (states, len(PAYLOADS) - 2)
+        assert len(journal.undo_entries) == len(PAYLOADS) - 2
+        assert len(journal.redo_entries) == 2
@@ -0,0 +1,216 @@
+import dataclasses
+import random
+import struct
+import time
+from pathlib import Path
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.event_log import (
+    PLAYER_RECORD,
+    RECORD_HEADER,
+    EventLog,
+    checkpoint_path,
+    load_checkpoint,
+)
+from reflex_scoreboard.manager.events import ManagerEvent, ManagerEventKind
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_score_manager() -> ScoreManager:
+    scoreboard = ScoreboardState.create_from_players_dict(
+        {player_id: f"Player {player_id}" for player_id in range(16)}
+    )
+    return ScoreManager(scoreboard, NoMxOperation(win_threshold=7, lose_threshold=3))
+
+
+def random_payloads(count: int, size: int) -> list[Payload]:
+    rng = random.Random(count)  # noqa: S311
+    payload_types = (PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH)
+    return [
+        Payload(payload_type, extended_index=rng.randrange(size))
+        for payload_type in rng.choices(payload_types, k=count)
+    ]
+
+
+class TestEventLog:
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("sync_interval", "checkpoint_interval", "message"),
+        [
+            (0, 1, "Sync interval must be positive."),
+            (1, 0, "Checkpoint interval must be positive."),
+        ],
+    )
+    def test_value_error(
+        tmp_path: Path, sync_interval: float, checkpoint_interval: int, message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=message):
+            EventLog(
+                tmp_path / "match.log",
+                ScoreboardState([]),
+                sync_interval=sync_interval,
+                checkpoint_interval=checkpoint_interval,
+            )
+
+    @staticmethod
+    def test_recover(tmp_path: Path, prepare_score_manager: ScoreManager) -> None:
+        path = tmp_path / "match.log"
+        manager = prepare_score_manager
+        with EventLog(path, manager.scoreboard, checkpoint_interval=5) as log:
+            manager.add_listener(log)
+            for payload in random_payloads(40, len(manager.scoreboard)):
+                manager(payload)
+            manager.undo()
+            manager.undo()
+            manager.redo()
+            manager.extend(random_payloads(10, len(manager.scoreboard)))
+
+        recovered = ScoreManager.recover(path, manager.operation)
+        assert recovered.scoreboard == manager.scoreboard
+        assert not recovered.undo_stack
+
+    @staticmethod
+    def test_payload_record(
+        tmp_path: Path, prepare_score_manager: ScoreManager
+    ) -> None:
+        path = tmp_path / "match.log"
+        manager = prepare_score_manager
+        with EventLog(path, manager.scoreboard) as log:
+            manager.add_listener(log)
+            manager(Payload(PayloadType.RIGHT, extended_index=3))
+            manager.undo()
+
+        # The payload record holds no players, and the undo one holds one.
+        assert path.stat().st_size == 2 * RECORD_HEADER.size + PLAYER_RECORD.size
+        scoreboard, offset = load_checkpoint(path)
+        assert scoreboard == prepare_score_manager.scoreboard
+        assert offset == 0
+
+    @staticmethod
+    def test_recover_ignores_truncated_record(
+        tmp_path: Path, prepare_score_manager: ScoreManager
+    ) -> None:
+        path = tmp_path / "match.log"
+        manager = prepare_score_manager
+        with EventLog(path, manager.scoreboard) as log:
+            manager.add_listener(log)
+            manager(Payload(PayloadType.RIGHT, extended_index=3))
+            expected = manager.scoreboard
+            manager(Payload(PayloadType.MISS, extended_index=4))
+        path.write_bytes(path.read_bytes()[:-3])
+
+        assert ScoreManager.recover(path, manager.operation).scoreboard == expected
+
+    @staticmethod
+    def test_append_after_recover(
+        tmp_path: Path, prepare_score_manager: ScoreManager
+    ) -> None:
+        path = tmp_path / "match.log"
+        manager = prepare_score_manager
+        with EventLog(path, manager.scoreboard) as log:
+            manager.add_listener(log)
+            manager(Payload(PayloadType.MISS, extended_index=1))
+
+        recovered = ScoreManager.recover(path, manager.operation)
+        with EventLog(path, recovered.scoreboard) as log:
+            recovered.add_listener(log)
+            recovered(Payload(PayloadType.MISS, extended_index=1))
+            recovered(Payload(PayloadType.MISS, extended_index=1))
+
+        scoreboard = ScoreManager.recover(path, manager.operation).scoreboard
+        assert scoreboard[1].misses == 3
+        assert scoreboard[1].state == PlayerState.LOSE
+        assert checkpoint_path(path).exists()
+
+    @staticmethod
+    def test_recover_large_log(
+        tmp_path: Path, prepare_score_manager: ScoreManager
+    ) -> None:
+        path = tmp_path / "match.log"
+        manager = prepare_score_manager
+        manager.operation = NoMxOperation(win_threshold=10**6, lose_threshold=10**6)
+        with EventLog(path, manager.scoreboard, checkpoint_interval=10**6) as log:
+            manager.add_listener(log)
+            for payload in random_payloads(50_000, len(manager.scoreboard)):
+                manager(payload)
+
+        start = time.perf_counter()
+        recovered = ScoreManager.recover(path, manager.operation)
+        elapsed = time.perf_counter() - start
+
+        assert recovered.scoreboard == manager.scoreboard
+        assert elapsed < 1.0
+
+    @staticmethod
+    def test_recover_renamed_player(
+        tmp_path: Path, prepare_score_manager: ScoreManager
+    ) -> None:
+        path = tmp_path / "match.log"
+        manager = prepare_score_manager
+        with EventLog(path, manager.scoreboard) as log:
+            manager.add_listener(log)
+            manager(Payload(PayloadType.RIGHT, extended_index=3))
+            with manager.edit() as draft:
+                draft.replace_player(3, dataclasses.replace(draft[3], name="Renamed"))
+            manager(Payload(PayloadType.RIGHT, extended_index=3))
+
+        recovered = ScoreManager.recover(path, manager.operation)
+        assert recovered.scoreboard == manager.scoreboard
+        assert recovered.scoreboard[3].name == "Renamed"
+
+    @staticmethod
+    def test_recover_wide_record(tmp_path: Path) -> None:
+        path = tmp_path / "match.log"
+        size = 70_000
+        manager = ScoreManager(
+            ScoreboardState.create_from_players_dict(
+                {player_id: f"Player {player_id}" for player_id in range(size)}
+            ),
+            NoMxOperation(win_threshold=7, lose_threshold=3),
+        )
+        with EventLog(path, manager.scoreboard) as log:
+            manager.add_listener(log)
+            manager.extend(
+                Payload.of(PayloadType.RIGHT, index) for index in range(size)
+            )
+
+        recovered = ScoreManager.recover(path, manager.operation)
+        assert recovered.scoreboard[0].answers == 1
+        assert recovered.scoreboard[size - 1].answers == 1
+
+    @staticmethod
+    def test_writer_failure(
+        tmp_path: Path, prepare_score_manager: ScoreManager
+    ) -> None:
+        manager = prepare_score_manager
+        log = EventLog(tmp_path / "match.log", manager.scoreboard, sync_interval=0.01)
+        previous = manager.scoreboard
+        manager(Payload.of(PayloadType.RIGHT, 0))
+        # The payload index does not fit in the record, so the writer fails.
+        log(
+            ManagerEvent(
+                ManagerEventKind.PAYLOAD,
+                previous,
+                manager.scoreboard,
+                Payload.of(PayloadType.RIGHT, 2**40),
+            )
+        )
+
+        undo = ManagerEvent(ManagerEventKind.UNDO, manager.scoreboard, previous)
+        deadline = time.monotonic() + 5
+        error: Exception | None = None
+        while error is None and time.monotonic() < deadline:
+            try:
+                log(undo)
+            except struct.error as raised:
+                error = raised
+            time.sleep(0.01)
+        assert error is not None
+        with pytest.raises(struct.error):
+            log.close()
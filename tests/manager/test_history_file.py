@@ -0,0 +1,177 @@
+import io
+from collections.abc import Buffer
+from pathlib import Path
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager import history_file
+from reflex_scoreboard.manager.delta_journal import DeltaJournal
+from reflex_scoreboard.manager.history_file import (
+    HistoryReader,
+    iter_history,
+    write_history,
+)
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+PAYLOADS = [
+    Payload(PayloadType.RIGHT, extended_index=0),
+    Payload(PayloadType.MISS, extended_index=1),
+    Payload(PayloadType.THROUGH),
+    Payload(PayloadType.RIGHT, extended_index=2),
+    Payload(PayloadType.MISS, extended_index=1),
+    Payload(PayloadType.RIGHT, extended_index=0),
+    Payload(PayloadType.RIGHT, extended_index=0),
+]
+
+
+@pytest.fixture
+def prepare_states() -> list[ScoreboardState]:
+    scoreboard = ScoreboardState(
+        players=[
+            PlayerScore(player_id=1, name="Alice"),
+            PlayerScore(player_id=2, name="Bob"),
+            PlayerScore(player_id=3, name="Charlie"),
+        ]
+    )
+    operation = NoMxOperation(win_threshold=3, lose_threshold=2)
+    states = [scoreboard]
+    for payload in PAYLOADS:
+        states.append(operation(states[-1], payload))
+    # A roster change is written as a keyframe.
+    states.append(states[-1].add_players([PlayerScore(player_id=4, name="Dave")]))
+    states.append(states[-1].add_answer(3))
+    return states
+
+
+class TestHistoryFile:
+    @staticmethod
+    @pytest.mark.parametrize("keyframe_interval", [1, 3, 64])
+    def test_round_trip(
+        tmp_path: Path, prepare_states: list[ScoreboardState], keyframe_interval: int
+    ) -> None:
+        path = tmp_path / "history.bin"
+        write_history(path, prepare_states, 4, keyframe_interval)
+
+        with HistoryReader(path) as reader:
+            assert len(reader) == len(prepare_states)
+            assert reader.position == 4
+            assert list(reader) == prepare_states
+            # Random access, backwards and forwards.
+            for number in [7, 2, 9, 0, -1]:
+                assert reader[number] == prepare_states[number]
+            with pytest.raises(IndexError):
+                reader[len(prepare_states)]
+        with path.open("rb") as file:
+            assert list(iter_history(file)) == prepare_states
+
+    @staticmethod
+    def test_far_read_after_near_read(
+        tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        operation = NoMxOperation(win_threshold=10**6, lose_threshold=10**6)
+        states = [ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})]
+        for number in range(500):
+            states.append(
+                operation(states[-1], Payload.of(PayloadType.RIGHT, number % 2))
+            )
+        path = tmp_path / "history.bin"
+        write_history(path, states, 0, keyframe_interval=16)
+        applied: list[int] = []
+        apply_delta = history_file._apply_delta  # noqa: SLF001
+
+        def counting_apply_delta(
+            scoreboard: ScoreboardState, data: Buffer, offset: int
+        ) -> ScoreboardState:
+            applied.append(offset)
+            return apply_delta(scoreboard, data, offset)
+
+        monkeypatch.setattr(history_file, "_apply_delta", counting_apply_delta)
+        with HistoryReader(path) as reader:
+            assert reader[5] == states[5]
+            applied.clear()
+            assert reader[490] == states[490]
+            # Decoded from the keyframe at 480, not rolled forward from 5.
+            assert len(applied) == 490 - 480
+            applied.clear()
+            assert reader[493] == states[493]
+            assert len(applied) == 3
+
+    @staticmethod
+    def test_snapshot_layout(
+        tmp_path: Path, prepare_states: list[ScoreboardState]
+    ) -> None:
+        path = tmp_path / "history.bin"
+        write_history(path, prepare_states, 0, keyframe_interval=4)
+        with HistoryReader(path) as reader:
+            keyframe = reader.snapshot_layout(4)
+            assert keyframe is not None
+            assert keyframe[1].player_count == 3
+            assert reader.snapshot_layout(5) is None
+
+    @staticmethod
+    def test_value_error(tmp_path: Path, prepare_states: list[ScoreboardState]) -> None:
+        path = tmp_path / "history.bin"
+        with pytest.raises(ValueError, match="History must have at least one state."):
+            write_history(path, [], 0)
+        with pytest.raises(ValueError, match="Position is out of range."):
+            write_history(path, prepare_states, len(prepare_states))
+        with pytest.raises(ValueError, match="Keyframe interval must be positive."):
+            write_history(path, prepare_states, 0, keyframe_interval=0)
+
+        write_history(path, prepare_states, 0)
+        data = path.read_bytes()
+        path.write_bytes(data[:-1])
+        with pytest.raises(ValueError, match="History file is truncated."):
+            HistoryReader(path)
+        with pytest.raises(ValueError, match="History file is truncated."):
+            list(iter_history(io.BytesIO(data[:100])))
+        path.write_bytes(b"XXXX" + data[4:])
+        with pytest.raises(ValueError, match="Data is not a history file."):
+            HistoryReader(path)
+
+    @staticmethod
+    def test_invalid_state(prepare_states: list[ScoreboardState]) -> None:
+        data = bytearray(history_file.encode_segment(prepare_states[:2]))
+        delta_size = history_file.DELTA_HEADER.size + history_file.DELTA_PLAYER.size
+        # The state is the last byte of the delta, before its padding and
+        # the end entry.
+        data[-history_file.ENTRY_HEADER.size - (-delta_size % 8) - 1] = 9
+        with pytest.raises(ValueError, match="History entry is not valid."):
+            history_file.decode_segment(data)
+
+
+class TestScoreManagerHistory:
+    @staticmethod
+    @pytest.mark.parametrize("use_journal", [False, True])
+    def test_save_and_load(tmp_path: Path, *, use_journal: bool) -> None:
+        operation = NoMxOperation(win_threshold=3, lose_threshold=2)
+        manager = ScoreManager(
+            ScoreboardState.create_from_players_dict(
+                {1: "Alice", 2: "Bob", 3: "Charlie"}
+            ),
+            operation,
+            DeltaJournal(checkpoint_interval=2) if use_journal else None,
+        )
+        for payload in PAYLOADS[:5]:
+            manager(payload)
+        manager.undo()
+        manager.undo()
+        path = tmp_path / "history.bin"
+        manager.save_history(path)
+
+        loaded = ScoreManager.load_history(
+            path, operation, DeltaJournal() if use_journal else None
+        )
+        assert loaded.history() == manager.history()
+        assert loaded.scoreboard == manager.scoreboard
+        loaded.redo()
+        manager.redo()
+        assert loaded.scoreboard == manager.scoreboard
+        for _ in range(4):
+            loaded.undo()
+            manager.undo()
+        assert loaded.scoreboard == manager.scoreboard
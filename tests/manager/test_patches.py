@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.patches import (
+    apply_patches,
+    field_patches,
+    player_row,
+)
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState.create_from_players_dict(
+        {player_id: f"Player {player_id}" for player_id in range(1000)}
+    )
+
+
+class TestPatches:
+    @staticmethod
+    def test_player_row() -> None:
+        player = PlayerScore(player_id=1, name="Alice", answers=2)
+        assert player_row(player) == {
+            "player_id": 1,
+            "name": "Alice",
+            "answers": 2,
+            "misses": 0,
+            "score": 0,
+            "breaks": 0,
+            "state": "NORMAL",
+        }
+
+    @staticmethod
+    def test_field_patches(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = NoMxOperation(win_threshold=1, lose_threshold=2)
+        current = operation(
+            prepare_scoreboard_state, Payload(PayloadType.RIGHT, extended_index=500)
+        )
+        assert field_patches(prepare_scoreboard_state, current) == [
+            (500, "answers", 1),
+            (500, "state", "WIN"),
+        ]
+
+    @staticmethod
+    def test_no_change(prepare_scoreboard_state: ScoreboardState) -> None:
+        current = prepare_scoreboard_state.set_question_count(2)
+        assert field_patches(prepare_scoreboard_state, current) == []
+
+    @staticmethod
+    def test_roster_change(prepare_scoreboard_state: ScoreboardState) -> None:
+        current = prepare_scoreboard_state.add_players(
+            [PlayerScore(player_id=1000, name="Zed")]
+        )
+        assert field_patches(prepare_scoreboard_state, current) is None
+
+    @staticmethod
+    def test_apply_patches(prepare_scoreboard_state: ScoreboardState) -> None:
+        manager = ScoreManager(
+            prepare_scoreboard_state, NoMxOperation(win_threshold=2, lose_threshold=2)
+        )
+        slots = [
+            SimpleNamespace(**player_row(player))
+            for player in manager.scoreboard.players
+        ]
+        actions = [
+            lambda: manager(Payload.of(PayloadType.RIGHT, 3)),
+            lambda: manager(Payload.of(PayloadType.RIGHT, 3)),
+            lambda: manager(Payload.of(PayloadType.MISS, 999)),
+            manager.undo,
+            manager.undo,
+            manager.redo,
+        ]
+        for action in actions:
+            previous = manager.scoreboard
+            action()
+            patches = field_patches(previous, manager.scoreboard)
+            assert patches is not None
+            apply_patches(slots, patches)
+            assert [vars(slot) for slot in slots] == [
+                player_row(player) for player in manager.scoreboard.players
+            ]
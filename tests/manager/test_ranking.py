@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore, PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.ranking import RankingIndex
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_score_manager() -> ScoreManager:
+    scoreboard = ScoreboardState.create_from_players_dict(
+        {player_id: f"Player {player_id}" for player_id in range(50)}
+    )
+    return ScoreManager(scoreboard, NoMxOperation(win_threshold=4, lose_threshold=3))
+
+
+def sorted_order(manager: ScoreManager) -> list[int]:
+    players = manager.scoreboard.players
+    return sorted(
+        range(len(players)),
+        key=lambda index: (manager.operation.rank_key(players[index]), index),
+    )
+
+
+class TestRankingIndex:
+    @staticmethod
+    def test_initial_ranking() -> None:
+        scoreboard = ScoreboardState(
+            players=[
+                PlayerScore(player_id=1, name="Alice", answers=1),
+                PlayerScore(player_id=2, name="Bob", answers=2),
+                PlayerScore(player_id=3, name="Carol", state=PlayerState.LOSE),
+                PlayerScore(player_id=4, name="Dave", answers=1),
+                PlayerScore(player_id=5, name="Eve", answers=1, misses=1),
+            ],
+        )
+        operation = NoMxOperation(win_threshold=5, lose_threshold=2)
+        ranking = RankingIndex(scoreboard, operation.rank_key)
+        assert list(ranking) == [1, 0, 3, 4, 2]
+        assert [ranking.rank_of(index) for index in range(5)] == [2, 1, 5, 2, 4]
+        assert [ranking.position_of(index) for index in range(5)] == [1, 0, 4, 2, 3]
+        assert ranking.top_k(2) == [1, 0]
+        assert len(ranking) == 5
+
+    @staticmethod
+    def test_follows_manager(prepare_score_manager: ScoreManager) -> None:
+        ranking = RankingIndex(
+            prepare_score_manager.scoreboard, prepare_score_manager.operation.rank_key
+        )
+        prepare_score_manager.add_listener(ranking)
+        rng = random.Random(0)  # noqa: S311
+        payload_types = (PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH)
+        for step in range(300):
+            if step % 7 == 6:
+                prepare_score_manager.undo()
+            else:
+                payload_type = rng.choice(payload_types)
+                prepare_score_manager(
+                    Payload(payload_type, extended_index=rng.randrange(50))
+                )
+            order = sorted_order(prepare_score_manager)
+            assert list(ranking) == order
+            assert ranking.position_of(order[-1]) == 49
+
+    @staticmethod
+    def test_roster_change(prepare_score_manager: ScoreManager) -> None:
+        scoreboard = prepare_score_manager.scoreboard
+        ranking = RankingIndex(scoreboard, prepare_score_manager.operation.rank_key)
+        extended = scoreboard.add_players(
+            [PlayerScore(player_id=100, name="Zed", answers=3)]
+        )
+        ranking.update(scoreboard, extended)
+        assert ranking.top_k(1) == [50]
+        assert ranking.rank_of(0) == 2
@@ -0,0 +1,160 @@
+import asyncio
+import dataclasses
+import threading
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.registry import MatchRegistry
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@dataclasses.dataclass
+class FakeClock:
+    now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_manager(_: str = "") -> ScoreManager:
+    scoreboard = ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})
+    return ScoreManager(scoreboard, NoMxOperation(win_threshold=5, lose_threshold=2))
+
+
+@pytest.fixture
+def prepare_clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestMatchRegistry:
+    @staticmethod
+    def test_invalid_idle_timeout() -> None:
+        with pytest.raises(ValueError, match="Idle timeout must be positive."):
+            MatchRegistry(idle_timeout=0)
+
+    @staticmethod
+    def test_register_twice() -> None:
+        registry = MatchRegistry()
+        registry.register("a", create_manager())
+        with pytest.raises(ValueError, match="Match is already registered."):
+            registry.register("a", create_manager())
+
+    @staticmethod
+    def test_unknown_match() -> None:
+        registry = MatchRegistry()
+        with pytest.raises(KeyError):
+            asyncio.run(registry.get("a"))
+
+    @staticmethod
+    def test_submit_undo_redo() -> None:
+        registry = MatchRegistry()
+        registry.register("a", create_manager())
+        registry.register("b", create_manager())
+
+        async def play() -> None:
+            await registry.submit("a", Payload(PayloadType.RIGHT, extended_index=0))
+            scoreboard = await registry.submit(
+                "a", Payload(PayloadType.RIGHT, extended_index=1)
+            )
+            assert [player.answers for player in scoreboard.players] == [1, 1]
+            scoreboard = await registry.undo("a")
+            assert [player.answers for player in scoreboard.players] == [1, 0]
+            scoreboard = await registry.redo("a")
+            assert [player.answers for player in scoreboard.players] == [1, 1]
+            scoreboard = await registry.get("b")
+            assert [player.answers for player in scoreboard.players] == [0, 0]
+
+        asyncio.run(play())
+
+    @staticmethod
+    def test_concurrent_submits() -> None:
+        registry = MatchRegistry()
+        match_ids = [str(number) for number in range(10)]
+        for match_id in match_ids:
+            registry.register(match_id, create_manager())
+
+        async def play() -> None:
+            await asyncio.gather(
+                *(
+                    registry.submit(
+                        match_id, Payload(PayloadType.MISS, extended_index=0)
+                    )
+                    for match_id in match_ids
+                    for _ in range(3)
+                )
+            )
+
+        asyncio.run(play())
+        for match_id in match_ids:
+            scoreboard = asyncio.run(registry.get(match_id))
+            assert scoreboard[0].misses == 3
+            assert scoreboard.question_count == 4
+
+    @staticmethod
+    def test_lazy_load_and_evict(prepare_clock: FakeClock) -> None:
+        loaded: list[str] = []
+        saved: list[tuple[str, int]] = []
+
+        def loader(match_id: str) -> ScoreManager:
+            loaded.append(match_id)
+            return create_manager()
+
+        def saver(match_id: str, manager: ScoreManager) -> None:
+            assert threading.current_thread() is not threading.main_thread()
+            saved.append((match_id, manager.scoreboard[0].answers))
+
+        registry = MatchRegistry(
+            loader=loader, saver=saver, idle_timeout=10, clock=prepare_clock
+        )
+        asyncio.run(registry.submit("a", Payload(PayloadType.RIGHT, extended_index=0)))
+        assert loaded == ["a"]
+        assert registry.metrics().active_matches == 1
+
+        prepare_clock.now = 5
+        assert asyncio.run(registry.evict_idle()) == []
+        prepare_clock.now = 10
+        assert asyncio.run(registry.evict_idle()) == ["a"]
+        assert saved == [("a", 1)]
+        metrics = registry.metrics()
+        assert metrics.active_matches == 0
+        assert metrics.known_matches == 1
+        assert "a" in registry
+
+        asyncio.run(registry.get("a"))
+        assert loaded == ["a", "a"]
+
+    @staticmethod
+    def test_failed_load() -> None:
+        def loader(match_id: str) -> ScoreManager:
+            raise KeyError(match_id)
+
+        registry = MatchRegistry(loader=loader)
+        for _ in range(3):
+            with pytest.raises(KeyError):
+                asyncio.run(registry.get("missing"))
+
+        assert "missing" not in registry
+        assert registry.metrics().known_matches == 0
+
+    @staticmethod
+    def test_evict_without_loader(prepare_clock: FakeClock) -> None:
+        registry = MatchRegistry(idle_timeout=10, clock=prepare_clock)
+        registry.register("a", create_manager())
+        prepare_clock.now = 10
+        assert asyncio.run(registry.evict_idle()) == ["a"]
+        assert "a" not in registry
+
+    @staticmethod
+    def test_metrics() -> None:
+        registry = MatchRegistry()
+        registry.register("a", create_manager())
+        asyncio.run(registry.submit("a", Payload(PayloadType.RIGHT, extended_index=0)))
+        asyncio.run(registry.get("a"))
+        metrics = registry.metrics()
+        assert metrics.queue_depth == 0
+        assert metrics.matches["a"].loaded
+        assert metrics.matches["a"].queue_depth == 0
+        assert metrics.matches["a"].latency.count == 2
@@ -3,6 +3,7 @@ import pytest
 from reflex_scoreboard.data_structure.payload import Payload, PayloadType
 from reflex_scoreboard.data_structure.player import PlayerScore
 from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.events import ManagerEvent, ManagerEventKind
 from reflex_scoreboard.manager.score_manager import ScoreManager
 from reflex_scoreboard.operation.nomx import NoMxOperation
 
@@ -99,3 +100,135 @@ class TestScoreManager:
         assert prepare_score_manager.scoreboard == scoreboard_history_list[2]
         assert prepare_score_manager.undo_stack == scoreboard_history_list[:2]
         assert not prepare_score_manager.redo_stack
+
+    @staticmethod
+    def test_undo_restores_player_values(prepare_score_manager: ScoreManager) -> None:
+        prepare_score_manager(Payload(PayloadType.RIGHT, extended_index=0))
+        prepare_score_manager(Payload(PayloadType.RIGHT, extended_index=0))
+        prepare_score_manager.undo()
+        assert prepare_score_manager.scoreboard[0].answers == 1
+        prepare_score_manager.undo()
+        assert prepare_score_manager.scoreboard[0].answers == 0
+
+    @staticmethod
+    def test_extend(prepare_score_manager: ScoreManager) -> None:
+        initial_scoreboard = prepare_score_manager.scoreboard
+        prepare_score_manager.extend(
+            [
+                Payload(PayloadType.RIGHT, extended_index=0),
+                Payload(PayloadType.MISS, extended_index=1),
+                Payload(PayloadType.THROUGH),
+            ]
+        )
+        assert prepare_score_manager.scoreboard[0].answers == 1
+        assert prepare_score_manager.scoreboard[1].misses == 1
+        assert prepare_score_manager.scoreboard.question_count == 4
+        assert prepare_score_manager.undo_stack == [initial_scoreboard]
+
+        prepare_score_manager.undo()
+        assert prepare_score_manager.scoreboard == initial_scoreboard
+
+    @staticmethod
+    def test_extend_with_undo_entries(prepare_score_manager: ScoreManager) -> None:
+        prepare_score_manager.extend(
+            [
+                Payload(PayloadType.RIGHT, extended_index=0),
+                Payload(PayloadType.THROUGH),
+            ],
+            single_undo_entry=False,
+        )
+        assert prepare_score_manager.scoreboard.question_count == 3
+        assert len(prepare_score_manager.undo_stack) == 2
+
+    @staticmethod
+    def test_listeners(prepare_score_manager: ScoreManager) -> None:
+        events: list[ManagerEvent] = []
+        prepare_score_manager.add_listener(events.append)
+        initial_scoreboard = prepare_score_manager.scoreboard
+        payload = Payload(PayloadType.RIGHT, extended_index=0)
+
+        prepare_score_manager(payload)
+        prepare_score_manager.undo()
+        prepare_score_manager.undo()
+        prepare_score_manager.redo()
+        prepare_score_manager.extend([Payload(PayloadType.THROUGH)])
+        prepare_score_manager.remove_listener(events.append)
+        prepare_score_manager.undo()
+
+        assert [event.kind for event in events] == [
+            ManagerEventKind.PAYLOAD,
+            ManagerEventKind.UNDO,
+            ManagerEventKind.REDO,
+            ManagerEventKind.BATCH,
+        ]
+        assert events[0].previous == initial_scoreboard
+        assert events[0].payload == payload
+        assert events[1].current == initial_scoreboard
+
+    @staticmethod
+    def test_version(prepare_score_manager: ScoreManager) -> None:
+        assert prepare_score_manager.version == 0
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        prepare_score_manager.undo()
+        prepare_score_manager.undo()
+        prepare_score_manager.redo()
+        prepare_score_manager.extend([Payload.of(PayloadType.THROUGH)])
+        assert prepare_score_manager.version == 4
+
+        events: list[ManagerEvent] = []
+        prepare_score_manager.add_listener(events.append)
+        prepare_score_manager(Payload.of(PayloadType.MISS, 1))
+        assert events[0].version == prepare_score_manager.version == 5
+
+    @staticmethod
+    def test_correction(prepare_score_manager: ScoreManager) -> None:
+        prepare_score_manager(Payload.of(PayloadType.RIGHT, 0))
+        answered = prepare_score_manager.scoreboard
+        prepare_score_manager(Payload.of(PayloadType.ADJUST, 0, value=2))
+
+        assert prepare_score_manager.scoreboard[0].score == 2
+        assert prepare_score_manager.scoreboard.question_count == 2
+        prepare_score_manager.undo()
+        assert prepare_score_manager.scoreboard is answered
+        prepare_score_manager.redo()
+        assert prepare_score_manager.scoreboard[0].score == 2
+
+    @staticmethod
+    def test_edit(prepare_score_manager: ScoreManager) -> None:
+        events: list[ManagerEvent] = []
+        prepare_score_manager.add_listener(events.append)
+        prepare_score_manager(Payload(PayloadType.RIGHT, extended_index=0))
+        before = prepare_score_manager.scoreboard
+
+        with prepare_score_manager.edit() as draft:
+            draft.update_players(lambda player: player.update_score(10))
+            draft.set_breaks(1, 2)
+
+        assert [
+            player.score for player in prepare_score_manager.scoreboard.players
+        ] == [
+            10,
+            10,
+        ]
+        assert prepare_score_manager.scoreboard[1].breaks == 2
+        assert events[-1].kind is ManagerEventKind.EDIT
+        assert events[-1].previous is before
+        prepare_score_manager.undo()
+        assert prepare_score_manager.scoreboard is before
+
+    @staticmethod
+    def test_edit_discarded(prepare_score_manager: ScoreManager) -> None:
+        before = prepare_score_manager.scoreboard
+
+        def fail() -> None:
+            with prepare_score_manager.edit() as draft:
+                draft.add_answer(0)
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            fail()
+        with prepare_score_manager.edit():
+            pass
+
+        assert prepare_score_manager.scoreboard is before
+        assert not prepare_score_manager.undo_stack
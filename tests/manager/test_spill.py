@@ -0,0 +1,167 @@
+from pathlib import Path
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.history_file import decode_segment, encode_segment
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.manager.spill import (
+    HistoryPolicy,
+    SpillStack,
+    estimate_entry_bytes,
+)
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_states() -> list[ScoreboardState]:
+    operation = NoMxOperation(win_threshold=100, lose_threshold=100)
+    states = [ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})]
+    for number in range(40):
+        payload_type = PayloadType.RIGHT if number % 3 else PayloadType.MISS
+        states.append(operation(states[-1], Payload.of(payload_type, number % 2)))
+    # A roster change in the middle of a chunk is written as a keyframe.
+    states.append(states[-1].add_players([PlayerScore(player_id=3, name="Carol")]))
+    states.append(states[-1].add_answer(2))
+    return states
+
+
+class TestHistoryPolicy:
+    @staticmethod
+    def test_value_error() -> None:
+        with pytest.raises(ValueError, match="Max entries must be positive."):
+            HistoryPolicy(max_entries=0)
+        with pytest.raises(ValueError, match="Max bytes must be positive."):
+            HistoryPolicy(max_bytes=0)
+        with pytest.raises(ValueError, match="Chunk size must be positive."):
+            HistoryPolicy(chunk_size=0)
+        with pytest.raises(ValueError, match="Chunk size must not exceed max entries."):
+            HistoryPolicy(max_entries=4, chunk_size=8)
+
+
+class TestSpillStack:
+    @staticmethod
+    def test_segment_round_trip(prepare_states: list[ScoreboardState]) -> None:
+        assert decode_segment(encode_segment(prepare_states)) == prepare_states
+        with pytest.raises(ValueError, match="History segment is truncated."):
+            decode_segment(encode_segment(prepare_states)[:-8])
+
+    @staticmethod
+    def test_window(tmp_path: Path, prepare_states: list[ScoreboardState]) -> None:
+        stack = SpillStack(HistoryPolicy(8, chunk_size=4, directory=tmp_path))
+        stack.extend(prepare_states)
+
+        assert len(stack) == len(prepare_states)
+        assert len(stack) - stack.spilled <= 8
+        assert list(stack) == prepare_states
+        assert list(reversed(stack)) == prepare_states[::-1]
+        assert [stack[number] for number in (0, 5, 40, -1)] == [
+            prepare_states[number] for number in (0, 5, 40, -1)
+        ]
+        with pytest.raises(IndexError):
+            stack[len(prepare_states)]
+        # Recent entries are the stored objects, not decoded copies.
+        assert stack[-1] is prepare_states[-1]
+
+        popped = [stack.pop() for _ in range(len(prepare_states))]
+        assert popped == prepare_states[::-1]
+        assert stack.spilled == 0
+        with pytest.raises(IndexError):
+            stack.pop()
+        stack.close()
+
+    @staticmethod
+    def test_max_bytes(prepare_states: list[ScoreboardState]) -> None:
+        entry_bytes = estimate_entry_bytes(prepare_states[0], prepare_states[1])
+        stack = SpillStack(
+            HistoryPolicy(None, max_bytes=10 * entry_bytes, chunk_size=2),
+            prepare_states,
+        )
+
+        assert stack.memory_bytes <= 10 * entry_bytes
+        assert stack.spilled > 0
+        assert list(stack) == prepare_states
+        stack.clear()
+        assert not stack
+        stack.close()
+
+    @staticmethod
+    def test_no_thrashing_at_chunk_boundary() -> None:
+        operation = NoMxOperation(win_threshold=10**6, lose_threshold=10**6)
+        states = [
+            ScoreboardState.create_from_players_dict(
+                {player_id: f"Player {player_id}" for player_id in range(40)}
+            )
+        ]
+        for number in range(200):
+            states.append(
+                operation(states[-1], Payload.of(PayloadType.RIGHT, number % 40))
+            )
+        # The byte budget holds fewer entries than one chunk.
+        stack = SpillStack(HistoryPolicy(None, max_bytes=20_000), states)
+        while len(stack) > stack.spilled:
+            stack.pop()
+
+        spilled = stack.spilled
+        state = stack.pop()
+        assert stack.spilled < spilled
+        spilled = stack.spilled
+        # Alternating undo and call stays in memory after one read back.
+        for _ in range(10):
+            stack.append(state)
+            assert stack.spilled == spilled
+            state = stack.pop()
+        assert stack.memory_bytes <= 20_000
+        stack.close()
+
+
+class TestScoreManagerSpill:
+    @staticmethod
+    def test_deep_undo(tmp_path: Path) -> None:
+        operation = NoMxOperation(win_threshold=100, lose_threshold=100)
+        initial = ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})
+        policy = HistoryPolicy(16, chunk_size=8, directory=tmp_path)
+        manager = ScoreManager(initial, operation, history_policy=policy)
+        expected = ScoreManager(initial, operation)
+        for number in range(100):
+            payload = Payload.of(PayloadType.RIGHT, number % 2)
+            manager(payload)
+            expected(payload)
+
+        assert isinstance(manager.undo_stack, SpillStack)
+        assert manager.undo_stack.spilled >= 100 - 16
+        assert manager.history() == expected.history()
+        for _ in range(60):
+            manager.undo()
+            expected.undo()
+        assert manager.scoreboard == expected.scoreboard
+        assert isinstance(manager.redo_stack, SpillStack)
+        assert len(manager.redo_stack) - manager.redo_stack.spilled <= 16
+        for _ in range(30):
+            manager.redo()
+            expected.redo()
+        assert manager.history() == expected.history()
+        for _ in range(100):
+            manager.undo()
+        assert manager.scoreboard == initial
+
+    @staticmethod
+    def test_load_history(tmp_path: Path) -> None:
+        operation = NoMxOperation(win_threshold=100, lose_threshold=100)
+        manager = ScoreManager(
+            ScoreboardState.create_from_players_dict({1: "Alice"}), operation
+        )
+        for _ in range(20):
+            manager(Payload.of(PayloadType.MISS, 0))
+        manager.undo()
+        path = tmp_path / "history.bin"
+        manager.save_history(path)
+
+        loaded = ScoreManager.load_history(
+            path, operation, history_policy=HistoryPolicy(4, chunk_size=2)
+        )
+        assert isinstance(loaded.undo_stack, SpillStack)
+        assert loaded.undo_stack.spilled > 0
+        assert loaded.history() == manager.history()
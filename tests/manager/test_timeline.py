@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerScore
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.delta_journal import DeltaJournal
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.manager.timeline import Timeline
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_states() -> list[ScoreboardState]:
+    rng = random.Random(7)  # noqa: S311
+    operation = NoMxOperation(win_threshold=1000, lose_threshold=1000)
+    states = [ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})]
+    for _ in range(200):
+        payload = rng.choice(
+            [
+                Payload(PayloadType.RIGHT, extended_index=0),
+                Payload(PayloadType.MISS, extended_index=1),
+                Payload(PayloadType.THROUGH),
+            ]
+        )
+        states.append(operation(states[-1], payload))
+    return states
+
+
+class TestTimeline:
+    @staticmethod
+    def test_value_error() -> None:
+        with pytest.raises(ValueError, match="Checkpoint interval must be positive."):
+            Timeline(ScoreboardState([]), checkpoint_interval=0)
+        with pytest.raises(ValueError, match="Timeline must have at least one state."):
+            Timeline.from_states([])
+        with pytest.raises(ValueError, match="The first state cannot be removed."):
+            Timeline(ScoreboardState([])).pop()
+
+    @staticmethod
+    @pytest.mark.parametrize("checkpoint_interval", [1, 7, 64])
+    def test_random_access(
+        prepare_states: list[ScoreboardState], checkpoint_interval: int
+    ) -> None:
+        timeline = Timeline.from_states(prepare_states, checkpoint_interval)
+
+        assert len(timeline) == len(prepare_states)
+        for number in [0, 1, 6, 7, 8, 100, 200, -1]:
+            assert timeline[number] == prepare_states[number]
+        with pytest.raises(IndexError, match="Timeline index is out of range."):
+            timeline[len(prepare_states)]
+
+    @staticmethod
+    def test_state_at(prepare_states: list[ScoreboardState]) -> None:
+        timeline = Timeline.from_states(prepare_states, checkpoint_interval=16)
+
+        for state in prepare_states:
+            assert timeline.state_at(state.question_count) == state
+        assert timeline.state_at(10_000) == prepare_states[-1]
+        with pytest.raises(
+            ValueError, match="Question count is before the first state."
+        ):
+            timeline.state_at(0)
+
+    @staticmethod
+    def test_roster_change() -> None:
+        first = ScoreboardState([PlayerScore(1, "Alice")])
+        second = first.add_players([PlayerScore(2, "Bob")])
+        third = second.add_answer(1).set_question_count(2)
+        timeline = Timeline.from_states([first, second, third])
+
+        assert list(map(timeline.__getitem__, range(3))) == [first, second, third]
+
+    @staticmethod
+    def test_follow_manager() -> None:
+        manager = ScoreManager(
+            ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"}),
+            NoMxOperation(win_threshold=5, lose_threshold=2),
+        )
+        manager(Payload(PayloadType.RIGHT, extended_index=0))
+        timeline = Timeline.follow(manager, checkpoint_interval=2)
+        manager(Payload(PayloadType.MISS, extended_index=1))
+        manager.extend(
+            [Payload(PayloadType.THROUGH), Payload(PayloadType.RIGHT, extended_index=1)]
+        )
+        manager.undo()
+        manager.redo()
+        manager.undo()
+        manager.undo()
+        manager(Payload(PayloadType.THROUGH))
+
+        states, position = manager.history()
+        assert [timeline[number] for number in range(len(timeline))] == states[
+            : position + 1
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize("journal", [None, DeltaJournal()])
+    def test_follow_no_op(journal: DeltaJournal | None) -> None:
+        manager = ScoreManager(
+            ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"}),
+            NoMxOperation(win_threshold=5, lose_threshold=2),
+            journal=journal,
+        )
+        timeline = Timeline.follow(manager)
+        manager(Payload(PayloadType.RIGHT, extended_index=0))
+        # An empty batch leaves the state unchanged, so undo reverts the payload.
+        manager.extend([])
+        manager.undo()
+
+        states, position = manager.history()
+        assert len(states) == 2
+        assert position == 0
+        assert len(timeline) == 1
+        assert timeline[0] == manager.scoreboard
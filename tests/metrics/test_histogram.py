@@ -0,0 +1,47 @@
+import pytest
+
+from reflex_scoreboard.metrics.histogram import LatencyHistogram
+
+
+@pytest.fixture
+def prepare_histogram() -> LatencyHistogram:
+    histogram = LatencyHistogram(bounds_ns=(10, 100, 1000))
+    for elapsed_ns in (5, 10, 50, 500, 5000):
+        histogram.record(elapsed_ns)
+    return histogram
+
+
+class TestLatencyHistogram:
+    @staticmethod
+    def test_invalid_bounds() -> None:
+        with pytest.raises(ValueError, match="Bounds must be increasing."):
+            LatencyHistogram(bounds_ns=(10, 10))
+        with pytest.raises(ValueError, match="Bounds must be increasing."):
+            LatencyHistogram(bounds_ns=())
+
+    @staticmethod
+    def test_snapshot(prepare_histogram: LatencyHistogram) -> None:
+        snapshot = prepare_histogram.snapshot()
+        assert snapshot.counts == (2, 1, 1, 1)
+        assert snapshot.count == 5
+        assert snapshot.total_ns == 5565
+        assert snapshot.max_ns == 5000
+        assert snapshot.mean_ns == 1113
+
+    @staticmethod
+    def test_percentile(prepare_histogram: LatencyHistogram) -> None:
+        snapshot = prepare_histogram.snapshot()
+        assert snapshot.percentile(0) == 10
+        assert snapshot.percentile(0.6) == 100
+        assert snapshot.percentile(0.8) == 1000
+        assert snapshot.percentile(1) == 5000
+        with pytest.raises(ValueError, match="Fraction must be between 0 and 1."):
+            snapshot.percentile(1.5)
+
+    @staticmethod
+    def test_reset(prepare_histogram: LatencyHistogram) -> None:
+        prepare_histogram.reset()
+        snapshot = prepare_histogram.snapshot()
+        assert snapshot.count == 0
+        assert snapshot.mean_ns == 0
+        assert snapshot.percentile(0.5) == 0
@@ -0,0 +1,153 @@
+import json
+import urllib.request
+from http import HTTPStatus
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.manager.score_manager import ScoreManager
+from reflex_scoreboard.metrics.instrumentation import Instrumentation
+from reflex_scoreboard.metrics.server import serve_metrics
+from reflex_scoreboard.operation.nomx import NoMxOperation
+
+
+@pytest.fixture
+def prepare_instrumented_manager() -> tuple[ScoreManager, Instrumentation]:
+    scoreboard = ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})
+    manager = ScoreManager(scoreboard, NoMxOperation(win_threshold=5, lose_threshold=2))
+    instrumentation = Instrumentation()
+    manager.instrument(instrumentation)
+    return manager, instrumentation
+
+
+class TestInstrumentation:
+    @staticmethod
+    def test_record() -> None:
+        instrumentation = Instrumentation(bounds_ns=(10, 100))
+        instrumentation.record("work", 5)
+        instrumentation.record("work", 50)
+        instrumentation.record_payload(PayloadType.RIGHT, 500)
+
+        snapshot = instrumentation.snapshot()
+        assert snapshot.latencies["work"].counts == (1, 1, 0)
+        assert snapshot.latencies["operation.right"].count == 1
+        assert snapshot.payload_counts[PayloadType.RIGHT] == 1
+        assert snapshot.payload_counts[PayloadType.MISS] == 0
+
+    @staticmethod
+    def test_reset() -> None:
+        instrumentation = Instrumentation()
+        instrumentation.record_payload(PayloadType.MISS, 100)
+        snapshot = instrumentation.snapshot()
+        instrumentation.reset()
+
+        assert not instrumentation.snapshot().latencies
+        assert instrumentation.snapshot().payload_counts[PayloadType.MISS] == 0
+        assert snapshot.payload_counts[PayloadType.MISS] == 1
+
+    @staticmethod
+    def test_to_dict() -> None:
+        instrumentation = Instrumentation(bounds_ns=(10, 100))
+        instrumentation.record("work", 50)
+
+        data = json.loads(json.dumps(instrumentation.snapshot().to_dict()))
+        assert data["latencies"]["work"]["counts"] == [0, 1, 0]
+        assert data["latencies"]["work"]["p50_ns"] == 50
+        assert data["payload_counts"]["RIGHT"] == 0
+
+    @staticmethod
+    def test_format_report() -> None:
+        instrumentation = Instrumentation()
+        instrumentation.record_payload(PayloadType.THROUGH, 1500)
+
+        report = instrumentation.snapshot().format_report()
+        assert "operation.through" in report
+        assert "THROUGH=1" in report
+
+    @staticmethod
+    def test_manager_hooks(
+        prepare_instrumented_manager: tuple[ScoreManager, Instrumentation],
+    ) -> None:
+        manager, instrumentation = prepare_instrumented_manager
+        manager(Payload.of(PayloadType.RIGHT, 0))
+        manager(Payload.of(PayloadType.MISS, 1))
+        manager.undo()
+        manager.redo()
+        manager.extend([Payload.of(PayloadType.THROUGH)] * 2)
+        with manager.edit() as draft:
+            draft.update_players(lambda player: player.update_score(3), [0])
+
+        snapshot = instrumentation.snapshot()
+        counts = {name: latency.count for name, latency in snapshot.latencies.items()}
+        assert counts == {
+            "manager.call": 2,
+            "manager.undo": 1,
+            "manager.redo": 1,
+            "manager.batch": 1,
+            "manager.edit": 1,
+            "operation.right": 1,
+            "operation.miss": 1,
+            "operation.through": 2,
+        }
+        assert {
+            payload_type: count
+            for payload_type, count in snapshot.payload_counts.items()
+            if count
+        } == {
+            PayloadType.RIGHT: 1,
+            PayloadType.MISS: 1,
+            PayloadType.THROUGH: 2,
+        }
+
+    @staticmethod
+    def test_detach(
+        prepare_instrumented_manager: tuple[ScoreManager, Instrumentation],
+    ) -> None:
+        manager, instrumentation = prepare_instrumented_manager
+        manager.instrument(None)
+        manager(Payload.of(PayloadType.RIGHT, 0))
+
+        assert manager.operation.instrumentation is None
+        assert not instrumentation.snapshot().latencies
+        assert manager.scoreboard[0].answers == 1
+
+    @staticmethod
+    def test_same_result(
+        prepare_instrumented_manager: tuple[ScoreManager, Instrumentation],
+    ) -> None:
+        manager, _ = prepare_instrumented_manager
+        plain = ScoreManager(manager.scoreboard, NoMxOperation(5, 2))
+        payloads = [
+            Payload.of(PayloadType.RIGHT, 0),
+            Payload.of(PayloadType.MISS, 1),
+            Payload.of(PayloadType.THROUGH),
+            Payload.of(PayloadType.MISS, 1),
+        ]
+        for payload in payloads:
+            manager(payload)
+            plain(payload)
+
+        assert manager.scoreboard == plain.scoreboard
+
+
+class TestServeMetrics:
+    @staticmethod
+    def test_metrics() -> None:
+        instrumentation = Instrumentation()
+        instrumentation.record_payload(PayloadType.RIGHT, 100)
+        server = serve_metrics(instrumentation)
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        try:
+            with urllib.request.urlopen(url) as response:
+                data = json.load(response)
+            reset = urllib.request.Request(url + "/reset", method="POST")  # noqa: S310
+            with urllib.request.urlopen(reset) as response:  # noqa: S310
+                status = response.status
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert data["payload_counts"]["RIGHT"] == 1
+        assert status == HTTPStatus.NO_CONTENT
+        assert not instrumentation.snapshot().latencies
@@ -139,3 +139,37 @@ class TestNoMxOperation:
             assert updated_scoreboard[i].answers == expected_answers_list[i]
             assert updated_scoreboard[i].misses == expected_misses_list[i]
             assert updated_scoreboard[i].state == expected_states_list[i]
+
+    @staticmethod
+    def test_apply_batch(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = NoMxOperation(win_threshold=2, lose_threshold=2)
+        payloads = [
+            Payload(PayloadType.RIGHT, extended_index=0),
+            Payload(PayloadType.MISS, extended_index=1),
+            Payload(PayloadType.THROUGH),
+            Payload(PayloadType.RIGHT, extended_index=0),
+            Payload(PayloadType.MISS, extended_index=1),
+        ]
+        expected_scoreboard = prepare_scoreboard_state
+        for payload in payloads:
+            expected_scoreboard = operation(expected_scoreboard, payload)
+
+        updated_scoreboard = operation.apply_batch(prepare_scoreboard_state, payloads)
+
+        assert updated_scoreboard == expected_scoreboard
+        assert updated_scoreboard[0].state == PlayerState.WIN
+        assert updated_scoreboard[1].state == PlayerState.LOSE
+        assert prepare_scoreboard_state[0].answers == 0
+
+    @staticmethod
+    def test_rank_key() -> None:
+        operation = NoMxOperation(win_threshold=5, lose_threshold=2)
+        winner = PlayerScore(player_id=1, name="Alice", state=PlayerState.WIN)
+        leader = PlayerScore(player_id=2, name="Bob", answers=3, misses=1)
+        runner_up = PlayerScore(player_id=3, name="Carol", answers=3, misses=0)
+        loser = PlayerScore(player_id=4, name="Dave", answers=4, state=PlayerState.LOSE)
+        keys = [
+            operation.rank_key(player) for player in (winner, runner_up, leader, loser)
+        ]
+        assert keys == sorted(keys)
+        assert len(set(keys)) == 4
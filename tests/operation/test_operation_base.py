@@ -0,0 +1,96 @@
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import (
+    ScoreboardLike,
+    ScoreboardState,
+)
+from reflex_scoreboard.operation.nomx import NoMxOperation
+from reflex_scoreboard.operation.operation_base import handles
+
+
+class ScoreWinOperation(NoMxOperation):
+    """NoMx where an adjustment reaching the win threshold wins."""
+
+    @handles(PayloadType.ADJUST)
+    def adjust_and_check[S: ScoreboardLike](self, scoreboard: S, payload: Payload) -> S:
+        scoreboard = self.adjust_score(scoreboard, payload)
+        if scoreboard[payload.index].score >= self.win_threshold:
+            scoreboard = scoreboard.update_state(payload.index, PlayerState.WIN)
+        return scoreboard
+
+
+class SilentThroughOperation(NoMxOperation):
+    """NoMx where a through does not count as a question."""
+
+    def _handle_through[S: ScoreboardLike](self, scoreboard: S, _: Payload) -> S:
+        return scoreboard
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})
+
+
+class TestOperationBase:
+    @staticmethod
+    def test_adjust(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = NoMxOperation(win_threshold=3, lose_threshold=3)
+        scoreboard = operation(
+            prepare_scoreboard_state, Payload.of(PayloadType.ADJUST, 1, value=5)
+        )
+        scoreboard = operation(scoreboard, Payload.of(PayloadType.ADJUST, 1, value=-2))
+
+        assert scoreboard[1].score == 3
+        assert scoreboard[1].state is PlayerState.NORMAL
+        assert scoreboard.question_count == 1
+        assert scoreboard[0] is prepare_scoreboard_state[0]
+
+    @staticmethod
+    def test_set_state_and_rest(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = NoMxOperation(win_threshold=3, lose_threshold=3)
+        scoreboard = operation(
+            prepare_scoreboard_state,
+            Payload.of(PayloadType.SET_STATE, 0, value=PlayerState.LOSE.value),
+        )
+        scoreboard = operation(scoreboard, Payload.of(PayloadType.REST, 1, value=2))
+
+        assert scoreboard[0].state is PlayerState.LOSE
+        assert scoreboard[1].breaks == 2
+        assert scoreboard.question_count == 1
+
+    @staticmethod
+    def test_handled_payload_types() -> None:
+        assert NoMxOperation.handled_payload_types() == frozenset(PayloadType)
+
+    @staticmethod
+    def test_declared_handler(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = ScoreWinOperation(win_threshold=3, lose_threshold=3)
+        payload = Payload.of(PayloadType.ADJUST, 0, value=3)
+
+        assert operation(prepare_scoreboard_state, payload)[0].state is PlayerState.WIN
+        plain = NoMxOperation(win_threshold=3, lose_threshold=3)
+        assert plain(prepare_scoreboard_state, payload)[0].state is PlayerState.NORMAL
+
+    @staticmethod
+    def test_overridden_handler(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = SilentThroughOperation(win_threshold=3, lose_threshold=3)
+        payload = Payload.of(PayloadType.THROUGH)
+
+        assert operation(prepare_scoreboard_state, payload) is prepare_scoreboard_state
+
+    @staticmethod
+    def test_apply_batch(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = NoMxOperation(win_threshold=3, lose_threshold=3)
+        payloads = [
+            Payload.of(PayloadType.RIGHT, 0),
+            Payload.of(PayloadType.ADJUST, 0, value=-1),
+            Payload.of(PayloadType.REST, 1, value=1),
+            Payload.of(PayloadType.MISS, 1),
+        ]
+        expected = prepare_scoreboard_state
+        for payload in payloads:
+            expected = operation(expected, payload)
+
+        assert operation.apply_batch(prepare_scoreboard_state, payloads) == expected
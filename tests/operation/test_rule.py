@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from reflex_scoreboard.data_structure.payload import Payload, PayloadType
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.operation.nomx import NoMxOperation
+from reflex_scoreboard.operation.rule import RuleSpec, ScoreRule
+
+
+@pytest.fixture
+def prepare_scoreboard_state() -> ScoreboardState:
+    return ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob", 3: "Carol"})
+
+
+def play(spec: RuleSpec, scoreboard: ScoreboardState, moves: str) -> ScoreboardState:
+    """Apply moves written as "o<index>", "x<index>" or "-" (through)."""
+    operation = spec.compile()
+    for move in moves.split():
+        if move == "-":
+            payload = Payload.of(PayloadType.THROUGH)
+        elif move[0] == "o":
+            payload = Payload.of(PayloadType.RIGHT, int(move[1:]))
+        else:
+            payload = Payload.of(PayloadType.MISS, int(move[1:]))
+        scoreboard = operation(scoreboard, payload)
+    return scoreboard
+
+
+class TestRuleSpec:
+    @staticmethod
+    def test_invalid_spec() -> None:
+        with pytest.raises(ValueError, match="Win threshold must be positive."):
+            RuleSpec(0)
+        with pytest.raises(ValueError, match="Lose threshold must be positive."):
+            RuleSpec(1, 0)
+        with pytest.raises(ValueError, match="Rest on miss must not be negative."):
+            RuleSpec(1, rest_on_miss=-1)
+        with pytest.raises(ValueError, match="The BY rule needs a lose threshold."):
+            RuleSpec(1, score_rule=ScoreRule.BY)
+
+    @staticmethod
+    def test_same_as_nomx(prepare_scoreboard_state: ScoreboardState) -> None:
+        compiled = RuleSpec.n_o_m_x(4, 3).compile()
+        nomx = NoMxOperation(win_threshold=4, lose_threshold=3)
+        rng = random.Random(0)  # noqa: S311
+        payload_types = [PayloadType.RIGHT, PayloadType.MISS, PayloadType.THROUGH]
+        expected = actual = prepare_scoreboard_state
+        for _ in range(200):
+            payload = Payload.of(rng.choice(payload_types), rng.randrange(3))
+            expected = nomx(expected, payload)
+            actual = compiled(actual, payload)
+            assert actual.question_count == expected.question_count
+            for index in range(3):
+                assert actual[index].answers == expected[index].answers
+                assert actual[index].misses == expected[index].misses
+                assert actual[index].state == expected[index].state
+
+    @staticmethod
+    def test_n_by_m(prepare_scoreboard_state: ScoreboardState) -> None:
+        scoreboard = play(
+            RuleSpec.n_by_m(8, 3), prepare_scoreboard_state, "o0 o0 x0 o0 o0"
+        )
+        assert scoreboard[0].score == 8
+        assert scoreboard[0].state is PlayerState.WIN
+        scoreboard = play(RuleSpec.n_by_m(8, 3), scoreboard, "o1 x1 x1 x1")
+        assert scoreboard[1].score == 0
+        assert scoreboard[1].state is PlayerState.LOSE
+
+    @staticmethod
+    def test_up_down(prepare_scoreboard_state: ScoreboardState) -> None:
+        spec = RuleSpec.up_down(3, 2)
+        scoreboard = play(spec, prepare_scoreboard_state, "o0 o0 x0 o0")
+        assert scoreboard[0].score == 1
+        assert scoreboard[0].state is PlayerState.NORMAL
+        scoreboard = play(spec, scoreboard, "o0 o0 x1 x1")
+        assert scoreboard[0].state is PlayerState.WIN
+        assert scoreboard[1].state is PlayerState.LOSE
+
+    @staticmethod
+    def test_rest_after_miss(prepare_scoreboard_state: ScoreboardState) -> None:
+        spec = RuleSpec.rest_after_miss(5, None, rest=2)
+        scoreboard = play(spec, prepare_scoreboard_state, "x0")
+        assert scoreboard[0].breaks == 2
+        scoreboard = play(spec, scoreboard, "o1")
+        assert scoreboard[0].breaks == 1
+        scoreboard = play(spec, scoreboard, "x2")
+        assert scoreboard[0].breaks == 0
+        assert scoreboard[2].breaks == 2
+        assert scoreboard[2].state is PlayerState.NORMAL
+
+    @staticmethod
+    def test_point_race(prepare_scoreboard_state: ScoreboardState) -> None:
+        spec = RuleSpec.point_race(5, right_points=2, miss_points=-1)
+        scoreboard = play(spec, prepare_scoreboard_state, "o0 x0 o0 - o0")
+        assert scoreboard[0].score == 5
+        assert scoreboard[0].state is PlayerState.WIN
+        assert scoreboard.question_count == 6
+
+    @staticmethod
+    def test_rank_key() -> None:
+        spec = RuleSpec.point_race(10)
+        scoreboard = play(
+            spec, ScoreboardState.create_from_players_dict({1: "A", 2: "B"}), "o0 o1 o1"
+        )
+        operation = spec.compile()
+        assert operation.rank_key(scoreboard[1]) < operation.rank_key(scoreboard[0])
+
+    @staticmethod
+    def test_apply_batch(prepare_scoreboard_state: ScoreboardState) -> None:
+        operation = RuleSpec.rest_after_miss(2, 2, rest=1).compile()
+        payloads = [
+            Payload.of(PayloadType.MISS, 0),
+            Payload.of(PayloadType.RIGHT, 1),
+            Payload.of(PayloadType.RIGHT, 1),
+        ]
+        expected = prepare_scoreboard_state
+        for payload in payloads:
+            expected = operation(expected, payload)
+        assert operation.apply_batch(prepare_scoreboard_state, payloads) == expected
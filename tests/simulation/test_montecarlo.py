@@ -0,0 +1,133 @@
+import pytest
+
+from reflex_scoreboard.data_structure.payload_codec import decode_payloads
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+from reflex_scoreboard.simulation.montecarlo import (
+    MatchConfig,
+    SimulationSummary,
+    simulate,
+    simulate_batch,
+)
+
+
+@pytest.fixture
+def prepare_config() -> MatchConfig:
+    return MatchConfig(
+        win_threshold=3,
+        lose_threshold=2,
+        buzz=(0.9, 0.6, 0.4, 0.2),
+        accuracy=(0.5, 0.7, 0.9, 0.6),
+        seats=2,
+        question_cap=12,
+    )
+
+
+class TestMatchConfig:
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"win_threshold": 0}, "Win threshold must be positive."),
+            ({"lose_threshold": 0}, "Lose threshold must be positive."),
+            ({"question_cap": 0}, "Question cap must be positive."),
+            ({"accuracy": (0.5,)}, "Buzz and accuracy must be given"),
+            ({"buzz": (0.5, 1.5)}, "Probabilities must be between 0 and 1."),
+            ({"seats": 3}, "Seats must be between 1 and the number of players."),
+        ],
+    )
+    def test_invalid(kwargs: dict[str, object], message: str) -> None:
+        arguments: dict[str, object] = {
+            "win_threshold": 3,
+            "lose_threshold": 2,
+            "buzz": (0.5, 0.5),
+            "accuracy": (0.5, 0.5),
+        } | kwargs
+        with pytest.raises(ValueError, match=message):
+            MatchConfig(**arguments)  # type: ignore[arg-type]
+
+
+class TestSimulateBatch:
+    @staticmethod
+    def test_matches_operation(prepare_config: MatchConfig) -> None:
+        batch = simulate_batch(
+            prepare_config, 300, np.random.default_rng(7), trace=True
+        )
+        assert batch.trace is not None
+        operation = prepare_config.operation()
+        players = {index: f"P{index}" for index in range(prepare_config.num_players)}
+
+        for match in range(300):
+            length = int(batch.lengths[match])
+            words = batch.trace[:length, match].astype("<u4").tobytes()
+            scoreboard = ScoreboardState.create_from_players_dict(players)
+            scoreboard = operation.apply_batch(scoreboard, decode_payloads(words))
+
+            assert scoreboard.question_count == length + 1
+            for index, player in enumerate(scoreboard.players):
+                assert player.answers == batch.answers[match, index]
+                assert player.misses == batch.misses[match, index]
+                assert player.state.value == batch.states[match, index]
+
+            states = [player.state for player in scoreboard.players]
+            finished = (
+                states.count(PlayerState.WIN) >= prepare_config.seats
+                or PlayerState.NORMAL not in states
+            )
+            assert batch.capped[match] == (not finished)
+            if not finished:
+                assert length == prepare_config.question_cap
+
+    @staticmethod
+    def test_nobody_buzzes() -> None:
+        config = MatchConfig(1, 1, buzz=(0.0, 0.0), accuracy=(1.0, 1.0))
+        batch = simulate_batch(config, 10, np.random.default_rng(0))
+        assert batch.capped.all()
+        assert (batch.lengths == config.question_cap).all()
+
+
+class TestSimulate:
+    @staticmethod
+    def test_summary(prepare_config: MatchConfig) -> None:
+        summary = simulate(prepare_config, 1000, seed=1, workers=1, chunk_size=300)
+
+        assert isinstance(summary, SimulationSummary)
+        assert summary.matches == 1000
+        assert summary.length_counts.sum() == 1000
+        assert summary.wins.sum() <= 2 * 1000
+        assert 0.0 <= summary.cap_rate() <= 1.0
+        assert summary.length_distribution().sum() == pytest.approx(1.0)
+        assert 0 < summary.mean_length() <= prepare_config.question_cap
+
+    @staticmethod
+    def test_independent_of_workers(prepare_config: MatchConfig) -> None:
+        serial = simulate(prepare_config, 1000, seed=3, workers=1, chunk_size=250)
+        parallel = simulate(prepare_config, 1000, seed=3, workers=2, chunk_size=250)
+
+        assert (serial.wins == parallel.wins).all()
+        assert (serial.length_counts == parallel.length_counts).all()
+        assert serial.capped == parallel.capped
+
+    @staticmethod
+    def test_dominant_player() -> None:
+        config = MatchConfig(5, 3, buzz=(1.0, 0.0), accuracy=(1.0, 1.0))
+        summary = simulate(config, 100, seed=0, workers=1)
+
+        assert summary.win_probability().tolist() == [1.0, 0.0]
+        assert summary.mean_length() == 5
+        assert summary.cap_rate() == 0.0
+
+    @staticmethod
+    def test_invalid() -> None:
+        config = MatchConfig(1, 1, buzz=(0.5,), accuracy=(0.5,))
+        with pytest.raises(ValueError, match="Number of matches must be positive."):
+            simulate(config, 0)
+        with pytest.raises(ValueError, match="Chunk size must be positive."):
+            simulate(config, 1, chunk_size=0)
+        with pytest.raises(ValueError, match="Number of workers must be positive."):
+            simulate(config, 1, workers=0)
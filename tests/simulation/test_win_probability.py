@@ -0,0 +1,116 @@
+import pytest
+
+from reflex_scoreboard.data_structure.player import PlayerState
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+from reflex_scoreboard.operation.nomx import NoMxOperation
+from reflex_scoreboard.operation.rule import RuleSpec
+from reflex_scoreboard.simulation.win_probability import (
+    PlayerSkill,
+    WinProbabilityEngine,
+)
+
+
+def make_scoreboard(size: int) -> ScoreboardState:
+    return ScoreboardState.create_from_players_dict(
+        {index: f"P{index}" for index in range(size)}
+    )
+
+
+@pytest.fixture
+def prepare_skills() -> list[PlayerSkill]:
+    return [PlayerSkill(0.9, 0.5), PlayerSkill(0.6, 0.7), PlayerSkill(0.4, 0.9)]
+
+
+class TestWinProbabilityEngine:
+    @staticmethod
+    @pytest.mark.parametrize("buzz", [1.0, 0.5])
+    def test_single_player(buzz: float) -> None:
+        engine = WinProbabilityEngine(NoMxOperation(2, 1), [PlayerSkill(buzz, 0.7)])
+        (probability,) = engine.win_probabilities(make_scoreboard(1))
+        assert probability == pytest.approx(0.7**2)
+
+    @staticmethod
+    def test_symmetric_players() -> None:
+        skill = PlayerSkill(0.8, 0.6)
+        engine = WinProbabilityEngine(NoMxOperation(3, 2), [skill, skill])
+        first, second = engine.win_probabilities(make_scoreboard(2))
+        assert first == pytest.approx(second)
+        assert 0.0 < first + second <= 1.0
+
+    @staticmethod
+    def test_finished() -> None:
+        engine = WinProbabilityEngine(
+            NoMxOperation(3, 2), [PlayerSkill(0.5, 0.5)] * 3, seats=2
+        )
+        scoreboard = make_scoreboard(3)
+        scoreboard = scoreboard.update_state(0, PlayerState.WIN)
+        scoreboard = scoreboard.update_state(2, PlayerState.WIN)
+        assert engine.win_probabilities(scoreboard) == (1.0, 0.0, 1.0)
+
+    @staticmethod
+    def test_matches_simulation(prepare_skills: list[PlayerSkill]) -> None:
+        pytest.importorskip("numpy")
+        from reflex_scoreboard.simulation.montecarlo import (  # noqa: PLC0415
+            MatchConfig,
+            simulate,
+        )
+
+        engine = WinProbabilityEngine(NoMxOperation(3, 2), prepare_skills)
+        exact = engine.win_probabilities(make_scoreboard(3))
+        config = MatchConfig(
+            3,
+            2,
+            buzz=tuple(skill.buzz for skill in prepare_skills),
+            accuracy=tuple(skill.accuracy for skill in prepare_skills),
+            question_cap=500,
+        )
+        summary = simulate(config, 50_000, seed=0, workers=1)
+        assert summary.win_probability().tolist() == pytest.approx(exact, abs=0.01)
+
+    @staticmethod
+    def test_reuses_cache(prepare_skills: list[PlayerSkill]) -> None:
+        operation = NoMxOperation(3, 2)
+        engine = WinProbabilityEngine(operation, prepare_skills)
+        scoreboard = make_scoreboard(3)
+        engine.win_probabilities(scoreboard)
+        computed = engine.cache_info().misses
+
+        scoreboard = operation.make_miss(operation.answer_right(scoreboard, 1), 0)
+        engine.win_probabilities(scoreboard)
+        assert engine.cache_info().misses == computed
+
+        engine.clear_cache()
+        assert engine.cache_info().currsize == 0
+
+    @staticmethod
+    def test_rest_after_miss(prepare_skills: list[PlayerSkill]) -> None:
+        operation = RuleSpec.rest_after_miss(2, 3, rest=1).compile()
+        engine = WinProbabilityEngine(operation, prepare_skills)
+        scoreboard = operation.make_miss(make_scoreboard(3), 2)
+        probabilities = engine.win_probabilities(scoreboard)
+        assert 0.0 < sum(probabilities) <= 1.0
+        # A question nobody answers while player 2 rests is good for them.
+        rested = engine.win_probabilities(operation.through(scoreboard))
+        assert rested[2] > probabilities[2]
+
+    @staticmethod
+    def test_without_lose_threshold(prepare_skills: list[PlayerSkill]) -> None:
+        operation = RuleSpec(3).compile()
+        engine = WinProbabilityEngine(operation, prepare_skills)
+        probabilities = engine.win_probabilities(make_scoreboard(3))
+        assert 0.0 < sum(probabilities) <= 1.0
+        assert probabilities[0] > probabilities[2]
+
+    @staticmethod
+    def test_invalid(prepare_skills: list[PlayerSkill]) -> None:
+        with pytest.raises(ValueError, match="Probabilities must be between 0 and 1."):
+            PlayerSkill(1.5, 0.5)
+        with pytest.raises(
+            ValueError, match="Seats must be between 1 and the number of players."
+        ):
+            WinProbabilityEngine(NoMxOperation(3, 2), prepare_skills, seats=4)
+        with pytest.raises(ValueError, match="Attempt cap must be positive."):
+            WinProbabilityEngine(NoMxOperation(3, 2), prepare_skills, attempt_cap=0)
+        engine = WinProbabilityEngine(NoMxOperation(3, 2), prepare_skills)
+        with pytest.raises(ValueError, match="A skill must be given for each player."):
+            engine.win_probabilities(make_scoreboard(2))
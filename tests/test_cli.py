@@ -0,0 +1,139 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from reflex_scoreboard.cli import format_board, main
+from reflex_scoreboard.data_structure.scoreboard import ScoreboardState
+
+# Seconds from the first import of the CLI to its first prompt.
+STARTUP_BUDGET = 0.05
+# Modules the CLI must not import before they are asked for.
+LAZY_MODULES = {
+    "asyncio",
+    "numpy",
+    "reflex",
+    "reflex_scoreboard.manager.delta_journal",
+    "reflex_scoreboard.manager.event_log",
+    "reflex_scoreboard.manager.spill",
+    "reflex_scoreboard.metrics.instrumentation",
+}
+STARTUP_SCRIPT = f"""
+import io
+import sys
+import time
+
+start = time.perf_counter()
+from reflex_scoreboard.cli import PROMPT, main
+
+
+class Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class PromptTimer(io.StringIO):
+    elapsed = None
+
+    def write(self, text):
+        if text == PROMPT and PromptTimer.elapsed is None:
+            PromptTimer.elapsed = time.perf_counter() - start
+        return super().write(text)
+
+
+main(["Alice", "Bob"], Terminal(), PromptTimer())
+print(PromptTimer.elapsed)
+print(" ".join(sorted({LAZY_MODULES!r} & sys.modules.keys())))
+"""
+
+
+def run(argv: list[str], text: str) -> tuple[int, str]:
+    stdout = io.StringIO()
+    status = main(argv, io.StringIO(text), stdout)
+    return status, stdout.getvalue()
+
+
+class TestCli:
+    @staticmethod
+    def test_payloads() -> None:
+        status, output = run(["Alice", "Bob", "--win", "2"], "o1 x2\nt o1\n")
+
+        assert status == 0
+        assert output.startswith("Q5\n")
+        assert "Alice    2    0" in output
+        assert "WIN" in output
+
+    @staticmethod
+    def test_undo_redo_and_quit() -> None:
+        status, output = run(["Alice", "Bob"], "o1 o1 u u r\nq\no2\n")
+
+        assert status == 0
+        assert "Alice    1" in output
+        assert "Bob      0" in output
+
+    @staticmethod
+    @pytest.mark.parametrize("text", ["o3\n", "o\n", "z\n", "tt\n"])
+    def test_invalid_command(text: str, capsys: pytest.CaptureFixture[str]) -> None:
+        status, output = run(["Alice", "Bob"], text)
+
+        assert status == 1
+        assert (
+            output
+            == format_board(
+                ScoreboardState.create_from_players_dict({1: "Alice", 2: "Bob"})
+            )
+            + "\n"
+        )
+        assert capsys.readouterr().err.startswith("error: ")
+
+    @staticmethod
+    def test_save_and_load(tmp_path: Path) -> None:
+        path = str(tmp_path / "match.bin")
+        run(["Alice", "Bob", "--save", path], "o1 x2 o1 u\n")
+        status, output = run(["--load", path, "--journal"], "r p\n")
+
+        assert status == 0
+        assert "Alice    2" in output
+
+    @staticmethod
+    def test_undo_window() -> None:
+        status, output = run(
+            ["Alice", "Bob", "--undo-window", "2"], "o1 o1 o1 o1 x2 u u u u u p\n"
+        )
+
+        assert status == 0
+        assert "Alice    0    0" in output
+        assert "Bob      0    0" in output
+
+    @staticmethod
+    def test_stats() -> None:
+        status, output = run(["Alice", "Bob", "--stats"], "o1 x2 s\n")
+
+        assert status == 0
+        assert output.count("manager.call") == 2
+        assert "RIGHT=1, THROUGH=0, MISS=1" in output
+
+    @staticmethod
+    def test_stats_disabled() -> None:
+        status, _ = run(["Alice", "Bob"], "s\n")
+
+        assert status == 1
+
+    @staticmethod
+    def test_startup_budget() -> None:
+        # The best of a few runs, so a busy machine does not fail the test.
+        timings = []
+        for _ in range(5):
+            result = subprocess.run(  # noqa: S603
+                [sys.executable, "-c", STARTUP_SCRIPT],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            elapsed, lazy_modules = result.stdout.split("\n", 1)
+            assert not lazy_modules.strip()
+            timings.append(float(elapsed))
+
+        assert min(timings) < STARTUP_BUDGET
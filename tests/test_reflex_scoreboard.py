@@ -0,0 +1,75 @@
+import pytest
+
+pytest.importorskip("reflex")
+
+from reflex.state import State as RootState
+
+from reflex_scoreboard.reflex_scoreboard import PLAYER_SLOTS, State
+
+type Delta = dict[str, dict[str, object]]
+
+
+@pytest.fixture
+def prepare_state() -> State:
+    root = RootState(_reflex_internal_init=True)  # type: ignore[call-arg]
+    state = root.get_substate(State.get_full_name().split(".")[1:])
+    assert isinstance(state, State)
+    state.load()
+    root._clean()  # noqa: SLF001
+    return state
+
+
+def sent(state: State) -> Delta:
+    root = state.parent_state
+    assert root is not None
+    delta = root.get_delta()
+    root._clean()  # noqa: SLF001
+    return {
+        name: {var.removesuffix("_rx_state_"): value for var, value in fields.items()}
+        for name, fields in delta.items()
+        if fields
+    }
+
+
+class TestState:
+    @staticmethod
+    def test_load(prepare_state: State) -> None:
+        prepare_state.load()
+        delta = sent(prepare_state)
+
+        assert delta[PLAYER_SLOTS[1].get_full_name()]["name"] == "Player 2"
+        assert delta[PLAYER_SLOTS[3].get_full_name()]["shown"] is True
+        assert delta[PLAYER_SLOTS[4].get_full_name()] == {"shown": False}
+
+    @staticmethod
+    def test_payload_sends_changed_fields(prepare_state: State) -> None:
+        prepare_state.right(1)
+        assert sent(prepare_state) == {
+            State.get_full_name(): {"question_count": 2},
+            PLAYER_SLOTS[1].get_full_name(): {"answers": 1},
+        }
+
+        prepare_state.through()
+        assert sent(prepare_state) == {State.get_full_name(): {"question_count": 3}}
+
+        prepare_state.miss(2)
+        assert sent(prepare_state) == {
+            State.get_full_name(): {"question_count": 4},
+            PLAYER_SLOTS[2].get_full_name(): {"misses": 1},
+        }
+
+    @staticmethod
+    def test_undo_redo(prepare_state: State) -> None:
+        prepare_state.right(0)
+        sent(prepare_state)
+
+        prepare_state.undo()
+        assert sent(prepare_state) == {
+            State.get_full_name(): {"question_count": 1},
+            PLAYER_SLOTS[0].get_full_name(): {"answers": 0},
+        }
+        prepare_state.redo()
+        assert sent(prepare_state) == {
+            State.get_full_name(): {"question_count": 2},
+            PLAYER_SLOTS[0].get_full_name(): {"answers": 1},
+        }